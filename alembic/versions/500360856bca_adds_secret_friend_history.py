@@ -0,0 +1,45 @@
+"""adds secret friend history and group lineage
+
+Revision ID: 500360856bca
+Revises: d5ee365bc944
+Create Date: 2026-10-18 14:05:41.220318
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "500360856bca"
+down_revision = "d5ee365bc944"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("groups", sa.Column("lineage_id", sa.Integer(), nullable=True))
+    op.create_index("ix_groups_lineage_id", "groups", ["lineage_id"])
+    op.create_table(
+        "secret_friend_history",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("lineage_id", sa.Integer(), nullable=False),
+        sa.Column("draw_year", sa.Integer(), nullable=False),
+        sa.Column("giver_name", sa.String(), nullable=False),
+        sa.Column("receiver_name", sa.String(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index(
+        "ix_secret_friend_history_lineage_year",
+        "secret_friend_history",
+        ["lineage_id", "draw_year"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_secret_friend_history_lineage_year", table_name="secret_friend_history"
+    )
+    op.drop_table("secret_friend_history")
+    op.drop_index("ix_groups_lineage_id", table_name="groups")
+    op.drop_column("groups", "lineage_id")
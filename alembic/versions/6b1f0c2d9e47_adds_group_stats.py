@@ -0,0 +1,48 @@
+"""adds group_stats counters
+
+Revision ID: 6b1f0c2d9e47
+Revises: 500360856bca
+Create Date: 2026-10-18 16:42:09.518203
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "6b1f0c2d9e47"
+down_revision = "500360856bca"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "group_stats",
+        sa.Column(
+            "group_id",
+            sa.Integer(),
+            sa.ForeignKey("groups.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("participant_count", sa.Integer(), nullable=False),
+        sa.Column("revealed_count", sa.Integer(), nullable=False),
+    )
+    op.execute(
+        """
+        INSERT INTO group_stats (group_id, participant_count, revealed_count)
+        SELECT groups.id,
+               count(participants.id),
+               count(participants.id) FILTER (
+                   WHERE participants.status = 'REVEALED'
+               )
+        FROM groups
+        LEFT JOIN participants ON participants.group_id = groups.id
+        GROUP BY groups.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("group_stats")
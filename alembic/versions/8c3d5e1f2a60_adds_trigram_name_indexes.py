@@ -0,0 +1,58 @@
+"""adds trigram indexes on group and participant names
+
+Revision ID: 8c3d5e1f2a60
+Revises: 6b1f0c2d9e47
+Create Date: 2026-10-18 17:20:31.804412
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "8c3d5e1f2a60"
+down_revision = "6b1f0c2d9e47"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # GIN trigram indexes serve ILIKE '%q%' as well as the fuzzy <% operator.
+    # Built concurrently, outside the migration transaction, so that writes
+    # to both tables are not blocked while the indexes are built.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_groups_name_trgm",
+            "groups",
+            ["name"],
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_participants_name_trgm",
+            "participants",
+            ["name"],
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_participants_name_trgm",
+            table_name="participants",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_groups_name_trgm",
+            table_name="groups",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,55 @@
+"""cascades group deletes in the database, adds groups.deleted_at
+
+Revision ID: a41e7b9d3c52
+Revises: 8c3d5e1f2a60
+Create Date: 2026-10-18 18:05:47.160938
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "a41e7b9d3c52"
+down_revision = "8c3d5e1f2a60"
+branch_labels = None
+depends_on = None
+
+# (constraint, table, column, referred table) — Postgres' default names,
+# which is also what create_all() produced for bootstrapped databases.
+_FOREIGN_KEYS = [
+    ("participants_group_id_fkey", "participants", "group_id", "groups"),
+    (
+        "secret_friends_gift_giver_id_fkey",
+        "secret_friends",
+        "gift_giver_id",
+        "participants",
+    ),
+    (
+        "secret_friends_gift_receiver_id_fkey",
+        "secret_friends",
+        "gift_receiver_id",
+        "participants",
+    ),
+]
+
+
+def _recreate_foreign_keys(ondelete: str | None) -> None:
+    for name, table, column, referred in _FOREIGN_KEYS:
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {name}")
+        op.create_foreign_key(
+            name, table, referred, [column], ["id"], ondelete=ondelete
+        )
+
+
+def upgrade() -> None:
+    _recreate_foreign_keys(ondelete="CASCADE")
+    op.add_column(
+        "groups", sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("groups", "deleted_at")
+    _recreate_foreign_keys(ondelete=None)
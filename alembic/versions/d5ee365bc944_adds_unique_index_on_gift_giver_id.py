@@ -0,0 +1,46 @@
+"""adds unique index on gift_giver_id
+
+Revision ID: d5ee365bc944
+Revises: ae6617610d2a
+Create Date: 2026-10-18 11:30:12.417263
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "d5ee365bc944"
+down_revision = "ae6617610d2a"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Keep only the most recent link per giver before enforcing uniqueness.
+    op.execute(
+        """
+        DELETE FROM secret_friends older
+        USING secret_friends newer
+        WHERE older.gift_giver_id = newer.gift_giver_id
+          AND older.id < newer.id
+        """
+    )
+    # Databases bootstrapped with create_all() may carry the non-unique index.
+    op.execute("DROP INDEX IF EXISTS ix_secret_friends_gift_giver_id")
+    op.create_index(
+        op.f("ix_secret_friends_gift_giver_id"),
+        "secret_friends",
+        ["gift_giver_id"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_secret_friends_gift_giver_id"), table_name="secret_friends")
+    op.create_index(
+        op.f("ix_secret_friends_gift_giver_id"),
+        "secret_friends",
+        ["gift_giver_id"],
+        unique=False,
+    )
@@ -0,0 +1,88 @@
+"""Compare request throughput of the sync and async database stacks.
+
+Serves GET /groups/{id} twice from one in-process app — a `def` route on the
+psycopg2 session (run in the threadpool) and an `async def` route on the
+asyncpg session — and hammers each with the same number of concurrent
+clients against the configured database.
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.domain.group.async_service import AsyncGroupService
+from src.domain.group.schemas import GroupRead
+from src.domain.group.service import GroupService
+from src.infrastructure.persistence import async_engine, get_async_db, get_db
+
+bench = FastAPI()
+
+
+@bench.get("/sync/groups/{group_id}", response_model=GroupRead)
+def get_group_sync(group_id: int, db_session: Session = Depends(get_db)):
+    return GroupService.get_by_id(group_id=group_id, db_session=db_session)
+
+
+@bench.get("/async/groups/{group_id}", response_model=GroupRead)
+async def get_group_async(
+    group_id: int, db_session: AsyncSession = Depends(get_async_db)
+):
+    return await AsyncGroupService.get_by_id(group_id=group_id, db_session=db_session)
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Requests/sec of the sync vs async database stacks."
+    )
+    parser.add_argument("group_id", type=int, help="an existing group to fetch")
+    parser.add_argument(
+        "--concurrency", type=int, default=64, help="clients in flight per stack"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=10.0, help="seconds to run each stack"
+    )
+    return parser.parse_args(argv)
+
+
+async def _client(
+    http: httpx.AsyncClient, path: str, deadline: float, counts: list[int]
+) -> None:
+    while time.monotonic() < deadline:
+        response = await http.get(path)
+        response.raise_for_status()
+        counts.append(1)
+
+
+async def _measure(path: str, concurrency: int, duration: float) -> float:
+    transport = httpx.ASGITransport(app=bench)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+        await http.get(path)  # warm up pools and the link filter
+        counts: list[int] = []
+        started = time.monotonic()
+        deadline = started + duration
+        await asyncio.gather(
+            *(_client(http, path, deadline, counts) for _ in range(concurrency))
+        )
+        return len(counts) / (time.monotonic() - started)
+
+
+async def _run(args: argparse.Namespace) -> None:
+    for stack in ("sync", "async"):
+        rate = await _measure(
+            f"/{stack}/groups/{args.group_id}", args.concurrency, args.duration
+        )
+        print(f"{stack:>5}: {rate:,.0f} requests/sec", flush=True)
+    await async_engine.dispose()
+
+
+def main(argv: list[str] | None = None) -> None:
+    asyncio.run(_run(_parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
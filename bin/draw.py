@@ -0,0 +1,69 @@
+import argparse
+
+from src.domain.lifecycle import register_all_handlers
+from src.domain.secret_friend.schemas import SecretFriendBatchReport
+from src.domain.secret_friend.service import SecretFriendService
+from src.infrastructure.persistence import SessionLocal
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Draw secret friends for every pending group."
+    )
+    parser.add_argument(
+        "--seed", type=int, default=None, help="make every group's draw reproducible"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=500, help="groups committed per transaction"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="matching processes (default: CPUs)"
+    )
+    parser.add_argument(
+        "--after-id", type=int, default=0, help="resume after this group id"
+    )
+    parser.add_argument(
+        "--no-repeat-years",
+        type=int,
+        default=0,
+        help="forbid pairings drawn in this many previous years",
+    )
+    return parser.parse_args(argv)
+
+
+def _print_progress(report: SecretFriendBatchReport) -> None:
+    print(
+        f"drawn={report.groups_drawn} assignments={report.assignments} "
+        f"failed={len(report.groups_failed)} last_group_id={report.last_group_id}",
+        flush=True,
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = _parse_args(argv)
+    register_all_handlers()
+    db_session = SessionLocal()
+    try:
+        report = SecretFriendService.draw_pending(
+            db_session=db_session,
+            seed=args.seed,
+            batch_size=args.batch_size,
+            workers=args.workers,
+            after_id=args.after_id,
+            no_repeat_years=args.no_repeat_years,
+            progress=_print_progress,
+        )
+    except Exception as e:
+        print(f"Draw interrupted: {e}")
+        print("Run again to resume — groups already drawn are skipped.")
+        exit(1)
+    finally:
+        db_session.close()
+
+    print(f"Done: {report.groups_drawn} groups drawn.")
+    if report.groups_failed:
+        print(f"Could not draw groups: {report.groups_failed}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Conditional GET — strong ETags from entity versions.
+
+Routes ask the service for a version (a cheap aggregate over ids and
+updated_at, no row hydration), turn it into an ETag, and answer 304 when
+the client's If-None-Match already holds it — skipping the full load and
+serialization:
+
+    etag = make_etag(GroupService.get_version(group_id, db_session))
+    if if_none_match(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+"""
+
+import hashlib
+
+from fastapi import status
+from starlette.requests import Request
+from starlette.responses import Response
+
+
+def make_etag(*parts: object) -> str:
+    """Strong ETag for a representation identified by parts (version, query…)."""
+    key = "\x1f".join(str(part) for part in parts)
+    return f'"{hashlib.blake2b(key.encode(), digest_size=12).hexdigest()}"'
+
+
+def if_none_match(request: Request, etag: str) -> bool:
+    """True when the client's If-None-Match matches etag (weak comparison)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag for candidate in header.split(",")
+    )
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
@@ -1,4 +1,4 @@
-from src.infrastructure.persistence import get_db
+from src.infrastructure.persistence import get_async_db, get_db
 
-# Re-export get_db for convenience — routes import from here
-__all__ = ["get_db"]
+# Re-export the session dependencies for convenience — routes import from here
+__all__ = ["get_async_db", "get_db"]
@@ -1,42 +1,216 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+from starlette.responses import Response
 
-from src.domain.group.schemas import GroupCreate, GroupList, GroupRead, GroupUpdate
+from src.domain.group.schemas import (
+    GROUP_EXPORT_COLUMNS,
+    GroupClone,
+    GroupCloneResult,
+    GroupCreate,
+    GroupList,
+    GroupRead,
+    GroupStatsRead,
+    GroupSummaryList,
+    GroupUpdate,
+)
+from src.domain.group.async_service import AsyncGroupService
 from src.domain.group.service import GroupService
-from src.api.dependencies import get_db
+from src.domain.participant.schemas import ParticipantImport, ParticipantImportResult
+from src.domain.participant.service import ParticipantService
+from src.domain.secret_friend.schemas import SecretFriendPairPage
+from src.domain.secret_friend.async_service import AsyncSecretFriendService
+from src.api.conditional import if_none_match, make_etag, not_modified
+from src.api.dependencies import get_async_db, get_db
+from src.api.streaming import (
+    CSV_MEDIA_TYPE,
+    NDJSON_MEDIA_TYPE,
+    csv_response,
+    iter_lines,
+    iter_request_body,
+    ndjson_response,
+    parse_records,
+    request_media_type,
+    validate_records,
+    wants_csv,
+    wants_ndjson,
+)
 
 router = APIRouter()
 
 
 @router.post("", response_model=GroupRead, status_code=status.HTTP_201_CREATED)
-def create_group(group: GroupCreate, db_session: Session = Depends(get_db)):
-    return GroupService.create(group=group, db_session=db_session)
+async def create_group(
+    group: GroupCreate, db_session: AsyncSession = Depends(get_async_db)
+):
+    return await AsyncGroupService.create(group=group, db_session=db_session)
 
 
 @router.get("", response_model=GroupList)
-def list_groups(db_session: Session = Depends(get_db)):
-    return GroupService.get_all(db_session=db_session)
+async def list_groups(
+    request: Request,
+    response: Response,
+    limit: int = Query(default=100, ge=1, le=1000),
+    after: int | None = Query(default=None),
+    db_session: AsyncSession = Depends(get_async_db),
+    stream_session: Session = Depends(get_db),
+):
+    """stream_session only connects when the NDJSON stream is asked for."""
+    stream = wants_ndjson(request)
+    version = await AsyncGroupService.get_page_version(
+        db_session=db_session, limit=None if stream else limit, after=after
+    )
+    etag = make_etag("groups", stream, limit, after, version)
+    if if_none_match(request, etag):
+        return not_modified(etag)
+    if stream:
+        streamed = ndjson_response(
+            GroupService.stream_all(db_session=stream_session, after=after)
+        )
+        streamed.headers["ETag"] = etag
+        return streamed
+    response.headers["ETag"] = etag
+    return await AsyncGroupService.get_all(
+        db_session=db_session, limit=limit, after=after
+    )
+
+
+@router.get("/summaries", response_model=GroupSummaryList)
+async def list_group_summaries(
+    limit: int = Query(default=100, ge=1, le=1000),
+    after: int | None = Query(default=None),
+    db_session: AsyncSession = Depends(get_async_db),
+):
+    return await AsyncGroupService.get_summaries(
+        db_session=db_session, limit=limit, after=after
+    )
 
 
 @router.get("/{group_id}", response_model=GroupRead)
-def get_group(group_id: int, db_session: Session = Depends(get_db)):
-    return GroupService.get_by_id(group_id=group_id, db_session=db_session)
+async def get_group(
+    group_id: int,
+    request: Request,
+    response: Response,
+    db_session: AsyncSession = Depends(get_async_db),
+):
+    version = await AsyncGroupService.get_version(
+        group_id=group_id, db_session=db_session
+    )
+    etag = make_etag("group", group_id, version)
+    if if_none_match(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    return await AsyncGroupService.get_by_id(group_id=group_id, db_session=db_session)
+
+
+@router.get("/{group_id}/stats", response_model=GroupStatsRead)
+async def get_group_stats(
+    group_id: int, db_session: AsyncSession = Depends(get_async_db)
+):
+    return await AsyncGroupService.get_stats(group_id=group_id, db_session=db_session)
+
+
+@router.get("/{group_id}/secret-friends", response_model=SecretFriendPairPage)
+async def list_group_secret_friends(
+    group_id: int,
+    limit: int = Query(default=100, ge=1, le=1000),
+    after: int | None = Query(default=None),
+    db_session: AsyncSession = Depends(get_async_db),
+):
+    return await AsyncSecretFriendService.get_pairs_by_group_id(
+        group_id=group_id, db_session=db_session, limit=limit, after=after
+    )
+
+
+@router.post(
+    "/{group_id}/clone",
+    response_model=GroupCloneResult,
+    status_code=status.HTTP_201_CREATED,
+)
+async def clone_group(
+    group_id: int,
+    payload: GroupClone | None = None,
+    db_session: AsyncSession = Depends(get_async_db),
+):
+    return await AsyncGroupService.clone(
+        group_id=group_id, db_session=db_session, payload=payload
+    )
+
+
+@router.post(
+    "/{group_id}/participants:bulk",
+    response_model=ParticipantImportResult,
+    status_code=status.HTTP_201_CREATED,
+)
+async def bulk_create_participants(
+    group_id: int, request: Request, db_session: Session = Depends(get_db)
+):
+    """Import participants from a streamed text/csv or application/x-ndjson body.
+
+    The body is parsed as it arrives and inserted in chunks inside one
+    transaction — a bad row rejects the whole upload.
+    """
+    media_type = request_media_type(request)
+    if media_type not in (CSV_MEDIA_TYPE, NDJSON_MEDIA_TYPE):
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=f"Send {CSV_MEDIA_TYPE} or {NDJSON_MEDIA_TYPE}.",
+        )
+    lines = iter_lines(iter_request_body(request))
+    rows = validate_records(parse_records(lines, media_type), ParticipantImport)
+    # Stays on the sync session: the Postgres import path is psycopg2's COPY.
+    return await run_in_threadpool(
+        ParticipantService.bulk_create,
+        group_id=group_id,
+        rows=rows,
+        db_session=db_session,
+    )
+
+
+@router.get("/{group_id}/export")
+def export_group(
+    group_id: int, request: Request, db_session: Session = Depends(get_db)
+):
+    """Stream the group's participants and draws: NDJSON, or CSV if accepted."""
+    rows = GroupService.export(group_id=group_id, db_session=db_session)
+    if wants_csv(request):
+        return csv_response(
+            rows, GROUP_EXPORT_COLUMNS, filename=f"group-{group_id}.csv"
+        )
+    return ndjson_response(rows)
 
 
 @router.get("/link/{link_url}", response_model=GroupRead)
-def get_group_by_link(link_url: str, db_session: Session = Depends(get_db)):
-    return GroupService.get_by_link_url(link_url=link_url, db_session=db_session)
+async def get_group_by_link(
+    link_url: str, db_session: AsyncSession = Depends(get_async_db)
+):
+    return await AsyncGroupService.get_by_link_url(
+        link_url=link_url, db_session=db_session
+    )
 
 
 @router.patch("/{group_id}", response_model=GroupRead)
-def update_group(
-    group_id: int, payload: GroupUpdate, db_session: Session = Depends(get_db)
+async def update_group(
+    group_id: int,
+    payload: GroupUpdate,
+    db_session: AsyncSession = Depends(get_async_db),
 ):
-    return GroupService.update(
+    return await AsyncGroupService.update(
         group_id=group_id, payload=payload, db_session=db_session
     )
 
 
 @router.delete("/{group_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_group(group_id: int, db_session: Session = Depends(get_db)):
-    GroupService.delete(group_id=group_id, db_session=db_session)
+async def delete_group(
+    group_id: int,
+    background: bool = Query(default=False),
+    db_session: AsyncSession = Depends(get_async_db),
+):
+    """background=true answers 202 at once and purges the members later."""
+    await AsyncGroupService.delete(
+        group_id=group_id, db_session=db_session, background=background
+    )
+    if background:
+        return Response(status_code=status.HTTP_202_ACCEPTED)
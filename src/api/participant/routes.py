@@ -1,48 +1,118 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from starlette.requests import Request
+from starlette.responses import Response
 
+from src.domain.participant.async_service import AsyncParticipantService
 from src.domain.participant.schemas import (
+    ParticipantBatchResult,
+    ParticipantBatchUpdate,
     ParticipantCreate,
     ParticipantList,
     ParticipantRead,
     ParticipantUpdate,
 )
 from src.domain.participant.service import ParticipantService
-from src.api.dependencies import get_db
+from src.domain.secret_friend.async_service import AsyncSecretFriendService
+from src.domain.secret_friend.schemas import SecretFriendRead
+from src.api.conditional import if_none_match, make_etag, not_modified
+from src.api.dependencies import get_async_db, get_db
+from src.api.streaming import ndjson_response, wants_ndjson
 
 router = APIRouter()
 
 
 @router.post("", response_model=ParticipantRead, status_code=status.HTTP_201_CREATED)
-def create_participant(
-    participant: ParticipantCreate, db_session: Session = Depends(get_db)
+async def create_participant(
+    participant: ParticipantCreate, db_session: AsyncSession = Depends(get_async_db)
 ):
-    return ParticipantService.create(participant=participant, db_session=db_session)
+    return await AsyncParticipantService.create(
+        participant=participant, db_session=db_session
+    )
 
 
 @router.get("", response_model=ParticipantList)
-def list_participants(db_session: Session = Depends(get_db)):
-    return ParticipantService.get_all(db_session=db_session)
+async def list_participants(
+    request: Request,
+    response: Response,
+    limit: int = Query(default=100, ge=1, le=1000),
+    after: int | None = Query(default=None),
+    db_session: AsyncSession = Depends(get_async_db),
+    stream_session: Session = Depends(get_db),
+):
+    """stream_session only connects when the NDJSON stream is asked for."""
+    stream = wants_ndjson(request)
+    version = await AsyncParticipantService.get_page_version(
+        db_session=db_session, limit=None if stream else limit, after=after
+    )
+    etag = make_etag("participants", stream, limit, after, version)
+    if if_none_match(request, etag):
+        return not_modified(etag)
+    if stream:
+        streamed = ndjson_response(
+            ParticipantService.stream_all(db_session=stream_session, after=after)
+        )
+        streamed.headers["ETag"] = etag
+        return streamed
+    response.headers["ETag"] = etag
+    return await AsyncParticipantService.get_all(
+        db_session=db_session, limit=limit, after=after
+    )
+
+
+@router.patch(":batch", response_model=ParticipantBatchResult)
+async def update_participants(
+    payload: ParticipantBatchUpdate, db_session: AsyncSession = Depends(get_async_db)
+):
+    return await AsyncParticipantService.update_batch(
+        payload=payload, db_session=db_session
+    )
 
 
 @router.get("/{participant_id}", response_model=ParticipantRead)
-def get_participant(participant_id: int, db_session: Session = Depends(get_db)):
-    return ParticipantService.get_by_id(
+async def get_participant(
+    participant_id: int,
+    request: Request,
+    response: Response,
+    db_session: AsyncSession = Depends(get_async_db),
+):
+    version = await AsyncParticipantService.get_version(
+        participant_id=participant_id, db_session=db_session
+    )
+    etag = make_etag("participant", participant_id, version)
+    if if_none_match(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    return await AsyncParticipantService.get_by_id(
+        participant_id=participant_id, db_session=db_session
+    )
+
+
+@router.get("/{participant_id}/secret-friend", response_model=SecretFriendRead)
+async def get_drawn_secret_friend(
+    participant_id: int, db_session: AsyncSession = Depends(get_async_db)
+):
+    return await AsyncSecretFriendService.get_by_giver_id(
         participant_id=participant_id, db_session=db_session
     )
 
 
 @router.patch("/{participant_id}", response_model=ParticipantRead)
-def update_participant(
+async def update_participant(
     participant_id: int,
     payload: ParticipantUpdate,
-    db_session: Session = Depends(get_db),
+    db_session: AsyncSession = Depends(get_async_db),
 ):
-    return ParticipantService.update(
+    return await AsyncParticipantService.update(
         participant_id=participant_id, payload=payload, db_session=db_session
     )
 
 
 @router.delete("/{participant_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_participant(participant_id: int, db_session: Session = Depends(get_db)):
-    ParticipantService.delete(participant_id=participant_id, db_session=db_session)
+async def delete_participant(
+    participant_id: int, db_session: AsyncSession = Depends(get_async_db)
+):
+    await AsyncParticipantService.delete(
+        participant_id=participant_id, db_session=db_session
+    )
@@ -1,3 +1,5 @@
+from typing import Any
+
 from fastapi import APIRouter
 from starlette.responses import JSONResponse
 
@@ -5,7 +7,10 @@ from src.api.error_schemas import ErrorResponse
 from src.api.agents.routes import agents_router
 from src.api.group.routes import router as group_router
 from src.api.participant.routes import router as participant_router
+from src.api.search.routes import router as search_router
 from src.api.secret_friend.routes import router as secret_friend_router
+from src.domain.group.link_filter import link_tokens
+from src.infrastructure.persistence import pool_stats
 
 api_router = APIRouter(
     default_response_class=JSONResponse,
@@ -25,9 +30,16 @@ api_router.include_router(
 api_router.include_router(
     secret_friend_router, prefix="/secret-friends", tags=["secret-friends"]
 )
+api_router.include_router(search_router, prefix="/search", tags=["search"])
 api_router.include_router(agents_router, prefix="/agents", tags=["agents"])
 
 
 @api_router.get("/healthcheck", include_in_schema=False)
 def healthcheck() -> dict[str, str]:
     return {"status": "ok"}
+
+
+@api_router.get("/metrics", include_in_schema=False)
+def metrics() -> dict[str, Any]:
+    """In-process state of this worker: its filters and connection pools."""
+    return {"link_filter": link_tokens.stats(), "db_pool": pool_stats()}
@@ -0,0 +1,19 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from src.domain.search.schemas import SearchKind, SearchResults
+from src.domain.search.service import SearchService
+from src.api.dependencies import get_db
+
+router = APIRouter()
+
+
+@router.get("", response_model=SearchResults)
+def search(
+    q: str = Query(max_length=100),
+    limit: int = Query(default=20, ge=1, le=100),
+    kind: SearchKind | None = Query(default=None),
+    db_session: Session = Depends(get_db),
+):
+    """Groups and participants by partial or misspelled name, best match first."""
+    return SearchService.search(q=q, db_session=db_session, limit=limit, kind=kind)
@@ -1,30 +1,54 @@
 from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.domain.secret_friend.schemas import SecretFriendRead
-from src.domain.secret_friend.service import SecretFriendService
-from src.api.dependencies import get_db
+from src.domain.secret_friend.async_service import AsyncSecretFriendService
+from src.domain.secret_friend.schemas import (
+    SecretFriendDraw,
+    SecretFriendList,
+    SecretFriendRead,
+)
+from src.api.dependencies import get_async_db
 
 router = APIRouter()
 
 
+@router.post("/{group_id}/draw", response_model=SecretFriendList)
+async def draw_secret_friends(
+    group_id: int,
+    payload: SecretFriendDraw | None = None,
+    db_session: AsyncSession = Depends(get_async_db),
+):
+    return await AsyncSecretFriendService.draw_group(
+        group_id=group_id,
+        db_session=db_session,
+        exclusions=payload.exclusions if payload else None,
+        no_repeat_years=payload.no_repeat_years if payload else 0,
+    )
+
+
 @router.post("/{group_id}/{participant_id}")
-def assign_secret_friend(
-    group_id: int, participant_id: int, db_session: Session = Depends(get_db)
+async def assign_secret_friend(
+    group_id: int, participant_id: int, db_session: AsyncSession = Depends(get_async_db)
 ):
-    result = SecretFriendService.assign(
+    result = await AsyncSecretFriendService.assign(
         group_id=group_id, participant_id=participant_id, db_session=db_session
     )
     return {"secret_friends": result}
 
 
 @router.get("/{secret_friend_id}", response_model=SecretFriendRead)
-def get_secret_friend(secret_friend_id: int, db_session: Session = Depends(get_db)):
-    return SecretFriendService.get_by_id(
+async def get_secret_friend(
+    secret_friend_id: int, db_session: AsyncSession = Depends(get_async_db)
+):
+    return await AsyncSecretFriendService.get_by_id(
         secret_friend_id=secret_friend_id, db_session=db_session
     )
 
 
 @router.delete("/{secret_friend_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_secret_friend(secret_friend_id: int, db_session: Session = Depends(get_db)):
-    SecretFriendService.delete(secret_friend_id=secret_friend_id, db_session=db_session)
+async def delete_secret_friend(
+    secret_friend_id: int, db_session: AsyncSession = Depends(get_async_db)
+):
+    await AsyncSecretFriendService.delete(
+        secret_friend_id=secret_friend_id, db_session=db_session
+    )
@@ -0,0 +1,170 @@
+"""Streaming request and response bodies.
+
+Responses: list endpoints stream NDJSON when the client sends
+`Accept: application/x-ndjson` (exports also offer CSV). Items are serialized
+as they are read from the database, so memory stays flat however many rows
+the endpoint returns.
+
+Requests: uploads are read chunk by chunk and parsed into records line by
+line (CSV or NDJSON), so only one line is ever held in full.
+"""
+
+import codecs
+import csv
+import io
+import json
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import Any, TypeVar
+
+import anyio.from_thread
+from pydantic import BaseModel, ValidationError
+from starlette.requests import Request
+from starlette.responses import StreamingResponse
+
+from src.shared.exceptions import BusinessRuleError
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+CSV_MEDIA_TYPE = "text/csv"
+
+M = TypeVar("M", bound=BaseModel)
+
+# Longest line accepted in an upload; guards memory against a body that
+# never sends a newline.
+_MAX_LINE_LENGTH = 64 * 1024
+
+# Lines written per chunk — one socket write per line would dominate the cost.
+_LINES_PER_CHUNK = 256
+
+
+def wants_ndjson(request: Request) -> bool:
+    """True when the client asked for an NDJSON stream."""
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def wants_csv(request: Request) -> bool:
+    """True when the client asked for CSV."""
+    return CSV_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def ndjson_lines(
+    items: Iterable[BaseModel | Mapping[Any, Any]],
+) -> Iterator[bytes]:
+    """Serialize items to NDJSON, a few hundred lines per yielded chunk.
+
+    Models are dumped by pydantic; plain mappings (e.g. result rows) go
+    through json.dumps with no model in between.
+    """
+    chunk: list[bytes] = []
+    for item in items:
+        if isinstance(item, BaseModel):
+            chunk.append(item.model_dump_json().encode())
+        else:
+            chunk.append(json.dumps(dict(item)).encode())
+        if len(chunk) >= _LINES_PER_CHUNK:
+            yield b"\n".join(chunk) + b"\n"
+            chunk = []
+    if chunk:
+        yield b"\n".join(chunk) + b"\n"
+
+
+def ndjson_response(
+    items: Iterable[BaseModel | Mapping[Any, Any]],
+) -> StreamingResponse:
+    return StreamingResponse(ndjson_lines(items), media_type=NDJSON_MEDIA_TYPE)
+
+
+def csv_lines(
+    rows: Iterable[Mapping[Any, Any]], columns: Sequence[str]
+) -> Iterator[bytes]:
+    """Serialize rows to CSV with a header, a few hundred rows per yielded chunk."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for count, row in enumerate(rows, start=1):
+        writer.writerow([row[column] for column in columns])
+        if count % _LINES_PER_CHUNK == 0:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode()
+
+
+def csv_response(
+    rows: Iterable[Mapping[Any, Any]], columns: Sequence[str], filename: str
+) -> StreamingResponse:
+    return StreamingResponse(
+        csv_lines(rows, columns),
+        media_type=CSV_MEDIA_TYPE,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+# ── Uploads ─────────────────────────────────────────────────────────────────
+
+
+def request_media_type(request: Request) -> str:
+    return request.headers.get("content-type", "").split(";")[0].strip().lower()
+
+
+def iter_request_body(request: Request) -> Iterator[bytes]:
+    """The request body chunk by chunk, for code running in a worker thread.
+
+    Each chunk is awaited on the event loop through anyio.from_thread, so a
+    synchronous service can consume an upload while it is still arriving.
+    """
+    stream = request.stream()
+
+    async def receive() -> bytes | None:
+        return await anext(stream, None)
+
+    while (chunk := anyio.from_thread.run(receive)) is not None:
+        if chunk:
+            yield chunk
+
+
+def iter_lines(chunks: Iterable[bytes]) -> Iterator[str]:
+    """Decode UTF-8 chunks into lines, keeping each line's newline."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line + "\n"
+        if len(pending) > _MAX_LINE_LENGTH:
+            raise BusinessRuleError("Upload has a line longer than 64 KiB.")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+def parse_records(lines: Iterable[str], media_type: str) -> Iterator[dict[str, Any]]:
+    """Parse CSV (header row first) or NDJSON lines into dicts, lazily.
+
+    Empty CSV cells are dropped, so optional fields fall back to defaults.
+    """
+    if media_type == CSV_MEDIA_TYPE:
+        for row in csv.DictReader(lines):
+            yield {k: v for k, v in row.items() if k is not None and v}
+        return
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            raise BusinessRuleError(f"Line {number}: invalid JSON.")
+        if not isinstance(record, dict):
+            raise BusinessRuleError(f"Line {number}: expected a JSON object.")
+        yield record
+
+
+def validate_records(records: Iterable[dict[str, Any]], model: type[M]) -> Iterator[M]:
+    """Validate records one by one, naming the first bad record in the error."""
+    for number, record in enumerate(records, start=1):
+        try:
+            yield model.model_validate(record)
+        except ValidationError as e:
+            error = e.errors()[0]
+            field = ".".join(str(part) for part in error["loc"])
+            raise BusinessRuleError(f"Record {number}: {field}: {error['msg']}.")
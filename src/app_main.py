@@ -3,6 +3,7 @@ from collections.abc import AsyncIterator, Awaitable, Callable
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 from sentry_asgi import SentryMiddleware
 from slowapi import _rate_limit_exceeded_handler
@@ -14,8 +15,9 @@ from starlette.responses import Response
 from src.api.middleware import ExceptionMiddleware, MetricsMiddleware
 from src.api.router import api_router
 from src.api.agents.dependencies import init_agents_registry, shutdown_agents
+from src.domain.group.link_filter import link_tokens
 from src.domain.lifecycle import register_all_handlers
-from src.infrastructure.persistence import Base, engine
+from src.infrastructure.persistence import Base, SessionLocal, engine
 from src.shared.config import settings
 from src.shared.rate_limiter import limiter
 
@@ -34,9 +36,24 @@ def _not_found_handler(request: Request, exc: Exception) -> JSONResponse:
     )
 
 
+def _build_link_filter() -> None:
+    """Load every invite token into the link filter before serving traffic.
+
+    Not fatal: if the database is unreachable the filter builds itself on
+    the first link lookup instead.
+    """
+    try:
+        with SessionLocal() as db_session:
+            link_tokens.rebuild(db_session)
+    except Exception:
+        log.warning("link filter not built at startup", exc_info=True)
+
+
 @asynccontextmanager
 async def _api_lifespan(application: FastAPI) -> AsyncIterator[None]:
     """Startup/shutdown lifecycle for the API sub-application."""
+    if settings.ENV != "test":
+        await run_in_threadpool(_build_link_filter)
     await init_agents_registry()
     yield
     await shutdown_agents()
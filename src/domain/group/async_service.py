@@ -0,0 +1,93 @@
+"""Async variants of GroupService for the async API routes.
+
+Each method runs the sync service on the async session's connection (see
+src.infrastructure.persistence.async_session): one implementation of the
+rules, transactions and signals, awaited rather than run in a thread.
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.group.schemas import (
+    GroupClone,
+    GroupCloneResult,
+    GroupCreate,
+    GroupList,
+    GroupRead,
+    GroupStatsRead,
+    GroupSummaryList,
+    GroupUpdate,
+)
+from src.domain.group.service import GroupService
+from src.infrastructure.persistence import run_sync
+
+
+class AsyncGroupService:
+    @staticmethod
+    async def create(group: GroupCreate, db_session: AsyncSession) -> GroupRead:
+        return await run_sync(db_session, GroupService.create, group=group)
+
+    @staticmethod
+    async def clone(
+        group_id: int, db_session: AsyncSession, payload: GroupClone | None = None
+    ) -> GroupCloneResult:
+        return await run_sync(
+            db_session, GroupService.clone, group_id=group_id, payload=payload
+        )
+
+    @staticmethod
+    async def update(
+        group_id: int, payload: GroupUpdate, db_session: AsyncSession
+    ) -> GroupRead:
+        return await run_sync(
+            db_session, GroupService.update, group_id=group_id, payload=payload
+        )
+
+    @staticmethod
+    async def delete(
+        group_id: int, db_session: AsyncSession, background: bool = False
+    ) -> None:
+        await run_sync(
+            db_session, GroupService.delete, group_id=group_id, background=background
+        )
+
+    @staticmethod
+    async def get_all(
+        db_session: AsyncSession, limit: int | None = None, after: int | None = None
+    ) -> GroupList:
+        return await run_sync(
+            db_session, GroupService.get_all, limit=limit, after=after
+        )
+
+    @staticmethod
+    async def get_page_version(
+        db_session: AsyncSession, limit: int | None = None, after: int | None = None
+    ) -> str:
+        return await run_sync(
+            db_session, GroupService.get_page_version, limit=limit, after=after
+        )
+
+    @staticmethod
+    async def get_summaries(
+        db_session: AsyncSession, limit: int | None = None, after: int | None = None
+    ) -> GroupSummaryList:
+        return await run_sync(
+            db_session, GroupService.get_summaries, limit=limit, after=after
+        )
+
+    @staticmethod
+    async def get_stats(group_id: int, db_session: AsyncSession) -> GroupStatsRead:
+        return await run_sync(db_session, GroupService.get_stats, group_id=group_id)
+
+    @staticmethod
+    async def get_by_id(group_id: int, db_session: AsyncSession) -> GroupRead:
+        return await run_sync(db_session, GroupService.get_by_id, group_id=group_id)
+
+    @staticmethod
+    async def get_version(group_id: int, db_session: AsyncSession) -> str:
+        return await run_sync(db_session, GroupService.get_version, group_id=group_id)
+
+    @staticmethod
+    async def get_by_link_url(link_url: str, db_session: AsyncSession) -> GroupRead:
+        return await run_sync(
+            db_session, GroupService.get_by_link_url, link_url=link_url
+        )
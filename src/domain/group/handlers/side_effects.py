@@ -2,8 +2,14 @@
 
 import logging
 
-from src.domain.group.schemas import GroupRead
-from src.domain.group.signals import group_created, group_deleted, group_updated
+from src.domain.group.link_filter import link_tokens
+from src.domain.group.schemas import GroupCloneResult, GroupRead
+from src.domain.group.signals import (
+    group_cloned,
+    group_created,
+    group_deleted,
+    group_updated,
+)
 from src.shared.signals import isolated
 
 log = logging.getLogger(__name__)
@@ -19,13 +25,47 @@ def _on_group_updated(sender: type, *, group: GroupRead, **kwargs: object) -> No
     log.info("lifecycle: group updated — id=%s name=%s", group.id, group.name)
 
 
+@isolated
+def _on_group_cloned(
+    sender: type, *, group: GroupCloneResult, **kwargs: object
+) -> None:
+    log.info(
+        "lifecycle: group cloned — id=%s source_id=%s participants=%s",
+        group.id,
+        group.source_id,
+        group.participant_count,
+    )
+
+
 @isolated
 def _on_group_deleted(sender: type, *, group_id: int, **kwargs: object) -> None:
     log.info("lifecycle: group deleted — id=%s", group_id)
 
 
+# ── Link token filter ────────────────────────────────────────────────────────
+# Adding before the commit is harmless: a rolled-back token only costs a
+# false positive, which the database lookup then answers.
+
+
+@isolated
+def _add_link_token(
+    sender: type, *, group: GroupRead | GroupCloneResult, **kwargs: object
+) -> None:
+    if group.link_url:
+        link_tokens.add(group.link_url)
+
+
+@isolated
+def _discard_link_token(sender: type, *, group_id: int, **kwargs: object) -> None:
+    link_tokens.discard()
+
+
 def register_side_effects() -> None:
     """Connect group side-effect handlers to their signals."""
     group_created.connect(_on_group_created)
+    group_cloned.connect(_on_group_cloned)
     group_updated.connect(_on_group_updated)
     group_deleted.connect(_on_group_deleted)
+    group_created.connect(_add_link_token)
+    group_cloned.connect(_add_link_token)
+    group_deleted.connect(_discard_link_token)
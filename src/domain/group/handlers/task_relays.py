@@ -1,7 +1,12 @@
 """Group task relays — bridge lifecycle events to the background task queue."""
 
-from src.domain.group.schemas import GroupRead
-from src.domain.group.signals import group_created, group_deleted, group_updated
+from src.domain.group.schemas import GroupCloneResult, GroupRead
+from src.domain.group.signals import (
+    group_cloned,
+    group_created,
+    group_deleted,
+    group_updated,
+)
 from src.shared.signals import isolated
 from src.shared.task_backend import dispatch_task
 
@@ -13,6 +18,16 @@ def _relay_group_created(sender: type, *, group: GroupRead, **kwargs: object) ->
     )
 
 
+@isolated
+def _relay_group_cloned(
+    sender: type, *, group: GroupCloneResult, **kwargs: object
+) -> None:
+    """A clone is announced like any new group."""
+    dispatch_task(
+        "notifications.group_created", group_id=group.id, group_name=group.name
+    )
+
+
 @isolated
 def _relay_group_updated(sender: type, *, group: GroupRead, **kwargs: object) -> None:
     dispatch_task(
@@ -25,8 +40,19 @@ def _relay_group_deleted(sender: type, *, group_id: int, **kwargs: object) -> No
     dispatch_task("notifications.group_deleted", group_id=group_id)
 
 
+@isolated
+def _relay_group_purge(
+    sender: type, *, group_id: int, purge: bool = False, **kwargs: object
+) -> None:
+    """Only groups deleted in the background still have rows to remove."""
+    if purge:
+        dispatch_task("groups.purge", group_id=group_id)
+
+
 def register_task_relays() -> None:
     """Connect group task relay handlers to their signals."""
     group_created.connect(_relay_group_created)
+    group_cloned.connect(_relay_group_cloned)
     group_updated.connect(_relay_group_updated)
     group_deleted.connect(_relay_group_deleted)
+    group_deleted.connect(_relay_group_purge)
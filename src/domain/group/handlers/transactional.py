@@ -1,5 +1,127 @@
-"""Group transactional handlers — errors propagate, rolling back the transaction."""
+"""Group transactional handlers — errors propagate, rolling back the transaction.
+
+They keep group_stats in step with the participant writes that change it,
+inside the same transaction: a counter never moves without its write.
+"""
+
+from sqlalchemy.orm import Session
+
+from src.domain.group.repository import GroupRepository
+from src.domain.group.schemas import GroupCloneResult
+from src.domain.group.signals import group_cloned, group_deleted
+from src.domain.participant.schemas import ParticipantRead, ParticipantStatus
+from src.domain.participant.signals import (
+    participant_created,
+    participant_deleted,
+    participant_updated,
+    participants_imported,
+    participants_revealed,
+    participants_updated,
+)
+
+
+def _count_created_participant(
+    sender: type, *, participant: ParticipantRead, db_session: Session, **kwargs: object
+) -> None:
+    GroupRepository.add_to_stats(
+        group_id=participant.group_id,
+        participants=1,
+        revealed=int(participant.status == ParticipantStatus.REVEALED),
+        db_session=db_session,
+    )
+
+
+def _count_imported_participants(
+    sender: type,
+    *,
+    group_id: int,
+    participant_ids: list[int],
+    db_session: Session,
+    **kwargs: object,
+) -> None:
+    GroupRepository.add_to_stats(
+        group_id=group_id, participants=len(participant_ids), db_session=db_session
+    )
+
+
+def _count_deleted_participant(
+    sender: type,
+    *,
+    group_id: int,
+    status: ParticipantStatus,
+    db_session: Session,
+    **kwargs: object,
+) -> None:
+    GroupRepository.add_to_stats(
+        group_id=group_id,
+        participants=-1,
+        revealed=-int(status == ParticipantStatus.REVEALED),
+        db_session=db_session,
+    )
+
+
+def _count_status_change(
+    sender: type,
+    *,
+    participant: ParticipantRead,
+    status_changed: bool,
+    db_session: Session,
+    **kwargs: object,
+) -> None:
+    """Covers secret_friend.assigned too: assigning reveals through an update."""
+    if not status_changed:
+        return
+    GroupRepository.add_to_stats(
+        group_id=participant.group_id,
+        revealed=1 if participant.status == ParticipantStatus.REVEALED else -1,
+        db_session=db_session,
+    )
+
+
+def _count_revealed_participants(
+    sender: type, *, group_id: int, count: int, db_session: Session, **kwargs: object
+) -> None:
+    GroupRepository.add_to_stats(
+        group_id=group_id, revealed=count, db_session=db_session
+    )
+
+
+def _count_batch_status_changes(
+    sender: type,
+    *,
+    revealed_by_group: dict[int, int],
+    db_session: Session,
+    **kwargs: object,
+) -> None:
+    for group_id, delta in revealed_by_group.items():
+        GroupRepository.add_to_stats(
+            group_id=group_id, revealed=delta, db_session=db_session
+        )
+
+
+def _count_cloned_participants(
+    sender: type, *, group: GroupCloneResult, db_session: Session, **kwargs: object
+) -> None:
+    """Copies start out PENDING, so none of them is revealed."""
+    GroupRepository.add_to_stats(
+        group_id=group.id, participants=group.participant_count, db_session=db_session
+    )
+
+
+def _drop_group_stats(
+    sender: type, *, group_id: int, db_session: Session, **kwargs: object
+) -> None:
+    """The foreign key cascades on Postgres; SQLite does not enforce it."""
+    GroupRepository.delete_stats(group_id=group_id, db_session=db_session)
 
 
 def register_transactional() -> None:
     """Connect group transactional handlers to their signals."""
+    participant_created.connect(_count_created_participant)
+    participants_imported.connect(_count_imported_participants)
+    participant_deleted.connect(_count_deleted_participant)
+    participant_updated.connect(_count_status_change)
+    participants_revealed.connect(_count_revealed_participants)
+    participants_updated.connect(_count_batch_status_changes)
+    group_cloned.connect(_count_cloned_participants)
+    group_deleted.connect(_drop_group_stats)
@@ -0,0 +1,196 @@
+"""Negative-lookup filter for invite link tokens ("does this link exist?").
+
+A Bloom filter of every group's link_url, held per worker process, so that
+guessed or scraped tokens get a 404 without a database round trip. Only
+tokens the filter reports as possibly present go on to the database.
+
+Kept current three ways:
+- group_created adds the new token (side-effect handler, this process);
+- a miss triggers a catch-up query for groups created by other processes,
+  at most once every LINK_FILTER_SYNC_INTERVAL seconds — so a token created
+  elsewhere may be refused for at most that long;
+- a full rebuild at startup, and whenever the filter has filled up.
+
+Bloom filters cannot remove items: group_deleted only counts the stale
+token, which keeps answering "possibly present" (and falls through to the
+database, as before) until the next rebuild.
+"""
+
+import logging
+import math
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from src.domain.group.repository import GroupRepository
+from src.shared.bloom import BloomFilter
+from src.shared.config import settings
+
+log = logging.getLogger(__name__)
+
+# Catch-up re-reads this many ids below the highest one already seen, so a
+# group whose transaction commits after a higher id was seen is not missed.
+_CATCH_UP_OVERLAP = 256
+
+
+class LinkTokenFilter:
+    """Bloom filter of link tokens, built from and caught up with the database.
+
+    Database reads happen outside self._lock, which only guards swapping the
+    filter in and the sync bookkeeping. The async routes run this on the event
+    loop's thread (via run_sync), where a lock held across a query would
+    block every other request on that loop — and the query itself.
+    """
+
+    def __init__(
+        self,
+        error_rate: float,
+        min_capacity: int,
+        sync_interval: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._error_rate = error_rate
+        self._min_capacity = min_capacity
+        self._sync_interval = sync_interval
+        self._clock = clock
+        self._bloom: BloomFilter | None = None
+        self._synced_id = 0
+        self._last_sync = -math.inf
+        self._stale = 0
+        self._syncing = False
+        # Tokens added while a rebuild reads, merged into the new filter.
+        self._added: list[str] | None = None
+        self._lock = threading.Lock()
+        self.rejected = 0
+
+    def add(self, token: str) -> None:
+        with self._lock:
+            bloom = self._bloom
+            if self._added is not None:
+                self._added.append(token)
+        if bloom is not None:
+            bloom.add(token)
+
+    def discard(self) -> None:
+        """Record that a token was deleted; it is dropped at the next rebuild."""
+        with self._lock:
+            self._stale += 1
+
+    def reset(self) -> None:
+        """Forget everything; the next lookup rebuilds from the database."""
+        with self._lock:
+            self._bloom = None
+            self._synced_id = 0
+            self._last_sync = -math.inf
+            self._stale = 0
+            self._syncing = False
+            self._added = None
+            self.rejected = 0
+
+    def might_exist(self, token: str, db_session: Session) -> bool:
+        """False only if no group has this token (as of the last sync).
+
+        While another caller is loading tokens, unknown tokens are let through
+        to the database rather than waiting for it.
+        """
+        bloom = self._bloom
+        if bloom is None:
+            bloom = self.rebuild(db_session)
+            if bloom is None:
+                return True
+        if token in bloom:
+            return True
+        if self._clock() - self._last_sync >= self._sync_interval:
+            bloom = self._catch_up(db_session)
+            if bloom is None or token in bloom:
+                return True
+        self.rejected += 1
+        return False
+
+    def rebuild(self, db_session: Session) -> BloomFilter | None:
+        """Size a new filter for the current token count and load every token.
+
+        Returns None, without reading, if a rebuild or catch-up is under way.
+        """
+        with self._lock:
+            if self._syncing:
+                return None
+            self._syncing = True
+            self._added = []
+            stale = self._stale
+        try:
+            count, max_id = GroupRepository.get_link_token_bounds(db_session=db_session)
+            bloom = BloomFilter(
+                capacity=max(self._min_capacity, 2 * count),
+                error_rate=self._error_rate,
+            )
+            for group_id, token in GroupRepository.stream_link_tokens(
+                db_session=db_session
+            ):
+                bloom.add(token)
+                max_id = max(max_id, group_id)
+            with self._lock:
+                for token in self._added:
+                    bloom.add(token)
+                self._bloom = bloom
+                self._synced_id = max_id
+                self._last_sync = self._clock()
+                self._stale -= stale  # deletions during the read may be missed
+        finally:
+            with self._lock:
+                self._syncing = False
+                self._added = None
+        log.info("link filter built — tokens=%s bytes=%s", len(bloom), bloom.nbytes)
+        return bloom
+
+    def _catch_up(self, db_session: Session) -> BloomFilter | None:
+        with self._lock:
+            if self._syncing:
+                return None
+            bloom = self._bloom
+            full = bloom is None or len(bloom) + self._stale >= bloom.capacity
+            if not full:
+                if self._clock() - self._last_sync < self._sync_interval:
+                    return bloom  # another caller caught up meanwhile
+                self._syncing = True
+                after = self._synced_id - _CATCH_UP_OVERLAP
+        if full or bloom is None:
+            return self.rebuild(db_session)
+        try:
+            synced_id = after
+            for group_id, token in GroupRepository.stream_link_tokens(
+                db_session=db_session, after=after
+            ):
+                if token not in bloom:  # overlap rows are mostly known already
+                    bloom.add(token)
+                synced_id = max(synced_id, group_id)
+            with self._lock:
+                self._synced_id = max(self._synced_id, synced_id)
+                self._last_sync = self._clock()
+        finally:
+            with self._lock:
+                self._syncing = False
+        return bloom
+
+    def stats(self) -> dict[str, Any]:
+        bloom = self._bloom
+        return {
+            "built": bloom is not None,
+            "tokens": len(bloom) if bloom is not None else 0,
+            "stale": self._stale,
+            "capacity": bloom.capacity if bloom is not None else 0,
+            "error_rate": self._error_rate,
+            "hash_count": bloom.hash_count if bloom is not None else 0,
+            "bytes": bloom.nbytes if bloom is not None else 0,
+            "rejected": self.rejected,
+        }
+
+
+link_tokens = LinkTokenFilter(
+    error_rate=settings.LINK_FILTER_ERROR_RATE,
+    min_capacity=settings.LINK_FILTER_MIN_CAPACITY,
+    sync_interval=settings.LINK_FILTER_SYNC_INTERVAL,
+)
@@ -1,6 +1,6 @@
 from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, String
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy import Enum as SQLAlchemyEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -10,11 +10,23 @@ from src.domain.group.schemas import CategoryEnum
 
 class Group(Base):
     __tablename__ = "groups"
+    __table_args__ = (
+        # Serves name search (ILIKE '%q%' and the fuzzy <% operator).
+        Index(
+            "ix_groups_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String, nullable=False)
     description: Mapped[str] = mapped_column(String, nullable=False)
     link_url: Mapped[str | None] = mapped_column(String, nullable=True, unique=True)
+    # Id of the first group in a chain of yearly editions. None means this
+    # group starts its own lineage (see effective lineage: lineage_id or id).
+    lineage_id: Mapped[int | None] = mapped_column(Integer, nullable=True, index=True)
     category: Mapped[CategoryEnum] = mapped_column(
         SQLAlchemyEnum(CategoryEnum), nullable=False, default=CategoryEnum.santa
     )
@@ -28,7 +40,30 @@ class Group(Base):
         nullable=True,
         onupdate=lambda: datetime.now(timezone.utc),
     )
+    # Set when the group is deleted in the background: from then on it reads
+    # as gone, while GroupService.purge removes its rows in chunks.
+    deleted_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
 
+    # The database cascades deletes to participants (and from them to
+    # secret_friends); the ORM never loads them just to delete them.
     participants: Mapped[list["Participant"]] = relationship(
-        back_populates="group", cascade="all, delete-orphan"
+        back_populates="group", cascade="all, delete-orphan", passive_deletes=True
+    )
+
+
+class GroupStats(Base):
+    """Member counters of a group, kept current by the group transactional handlers.
+
+    A group without a row has no members yet; the first counted change
+    creates it. Rebuilt in bulk by GroupService.reconcile_stats if it drifts.
+    """
+
+    __tablename__ = "group_stats"
+
+    group_id: Mapped[int] = mapped_column(
+        ForeignKey("groups.id", ondelete="CASCADE"), primary_key=True
     )
+    participant_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    revealed_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
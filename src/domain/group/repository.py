@@ -1,63 +1,456 @@
-from sqlalchemy import select
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import (
+    DateTime,
+    Row,
+    RowMapping,
+    String,
+    delete,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, aliased, selectinload
 
-from src.domain.group.model import Group
-from src.domain.group.schemas import GroupCreate, GroupUpdate
+from src.domain.group.model import Group, GroupStats
+from src.domain.participant.model import Participant
+from src.domain.participant.schemas import ParticipantStatus
+from src.domain.secret_friend.model import SecretFriend
+from src.domain.group.schemas import CategoryEnum, GroupCreate, GroupUpdate
 from src.shared.exceptions import ConflictError, NotFoundError
 from src.shared.hashing import generate_group_token
 
+# Rows fetched per round trip when streaming with a server-side cursor.
+_STREAM_BATCH_SIZE = 500
+_EXPORT_BATCH_SIZE = 2000
+_TOKEN_BATCH_SIZE = 10_000
+
+
+def _insert_stats(db_session: Session) -> postgresql.Insert | sqlite.Insert:
+    """INSERT INTO group_stats for the session's dialect (both speak ON CONFLICT)."""
+    dialect = db_session.get_bind().dialect.name
+    insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+    return insert(GroupStats)
+
+
+# When a row last changed — updated_at is only set by the first update.
+_group_changed_at = func.coalesce(Group.updated_at, Group.created_at)
+_participant_changed_at = func.coalesce(Participant.updated_at, Participant.created_at)
+
+# Groups not marked deleted; marked ones read as gone while they are purged.
+_live = Group.deleted_at.is_(None)
+
 
 class GroupRepository:
     @staticmethod
     def create(group: GroupCreate, db_session: Session) -> Group:
         new_group = Group(**group.model_dump(exclude_unset=True))
         new_group.link_url = generate_group_token()
+        # A new group has no participants; saying so spares a lazy-load SELECT.
+        new_group.participants = []
         try:
             db_session.add(new_group)
             db_session.flush()
-            db_session.refresh(new_group)
         except IntegrityError:
             raise ConflictError("Group creation failed. Unique constraint violated.")
         return new_group
 
     @staticmethod
-    def get_all(db_session: Session) -> list[Group]:
-        stmt = select(Group)
+    def get_all(
+        db_session: Session, limit: int | None = None, after: int | None = None
+    ) -> list[Group]:
+        """Groups ordered by id; keyset-paginated with limit and after (id > after).
+
+        Participants are loaded for the whole page in one extra SELECT … IN
+        instead of one lazy load per group.
+        """
+        stmt = (
+            select(Group)
+            .options(selectinload(Group.participants))
+            .where(_live)
+            .order_by(Group.id)
+            .limit(limit)
+        )
+        if after is not None:
+            stmt = stmt.where(Group.id > after)
         return list(db_session.execute(stmt).scalars().all())
 
+    @staticmethod
+    def stream_all(db_session: Session, after: int | None = None) -> Iterator[Group]:
+        """Every group ordered by id, read in batches from a server-side cursor."""
+        stmt = (
+            select(Group)
+            .options(selectinload(Group.participants))
+            .where(_live)
+            .order_by(Group.id)
+            .execution_options(yield_per=_STREAM_BATCH_SIZE)
+        )
+        if after is not None:
+            stmt = stmt.where(Group.id > after)
+        yield from db_session.scalars(stmt)
+
+    @staticmethod
+    def get_version(group_id: int, db_session: Session) -> Row[tuple[Any, ...]] | None:
+        """What GroupRead depends on, without loading it; None if no such group.
+
+        The group's last change plus its members' count and last change —
+        GroupRead embeds the members, so their edits change the group too.
+        """
+        stmt = (
+            select(
+                _group_changed_at,
+                func.count(Participant.id),
+                func.max(_participant_changed_at),
+            )
+            .outerjoin(Participant, Participant.group_id == Group.id)
+            .where(Group.id == group_id, _live)
+            .group_by(Group.id)
+        )
+        return db_session.execute(stmt).one_or_none()
+
+    @staticmethod
+    def get_page_version(
+        db_session: Session, limit: int | None = None, after: int | None = None
+    ) -> Row[tuple[Any, ...]]:
+        """Version of the page get_all(limit, after) would return, in one query.
+
+        Counts, last id and last change of the page's groups and of their
+        members; any insert, update or delete touching the page changes it.
+        """
+        page_stmt = (
+            select(Group.id, _group_changed_at.label("changed_at"))
+            .where(_live)
+            .order_by(Group.id)
+            .limit(limit)
+        )
+        if after is not None:
+            page_stmt = page_stmt.where(Group.id > after)
+        page = page_stmt.subquery()
+        stmt = select(
+            func.count(page.c.id.distinct()),
+            func.max(page.c.id),
+            func.max(page.c.changed_at),
+            func.count(Participant.id),
+            func.max(_participant_changed_at),
+        ).select_from(page.outerjoin(Participant, Participant.group_id == page.c.id))
+        return db_session.execute(stmt).one()
+
+    @staticmethod
+    def get_summaries(
+        db_session: Session, limit: int | None = None, after: int | None = None
+    ) -> list[Row[tuple[int, str, CategoryEnum, int, int]]]:
+        """Groups with their maintained participant and revealed counters.
+
+        Keyset-paginated like get_all. Returns plain rows labelled like
+        GroupSummary — one primary-key join per group, no participant rows.
+        """
+        stmt = (
+            select(
+                Group.id,
+                Group.name,
+                Group.category,
+                func.coalesce(GroupStats.participant_count, 0).label(
+                    "participant_count"
+                ),
+                func.coalesce(GroupStats.revealed_count, 0).label("revealed_count"),
+            )
+            .outerjoin(GroupStats, GroupStats.group_id == Group.id)
+            .where(_live)
+            .order_by(Group.id)
+            .limit(limit)
+        )
+        if after is not None:
+            stmt = stmt.where(Group.id > after)
+        return list(db_session.execute(stmt).all())
+
+    @staticmethod
+    def get_stats(group_id: int, db_session: Session) -> Row[tuple[int, int, int]]:
+        """(group_id, participant_count, revealed_count) from the counters."""
+        stmt = (
+            select(
+                Group.id.label("group_id"),
+                func.coalesce(GroupStats.participant_count, 0).label(
+                    "participant_count"
+                ),
+                func.coalesce(GroupStats.revealed_count, 0).label("revealed_count"),
+            )
+            .outerjoin(GroupStats, GroupStats.group_id == Group.id)
+            .where(Group.id == group_id, _live)
+        )
+        row = db_session.execute(stmt).one_or_none()
+        if row is None:
+            raise NotFoundError("Group not found")
+        return row
+
+    @staticmethod
+    def add_to_stats(
+        group_id: int, db_session: Session, participants: int = 0, revealed: int = 0
+    ) -> None:
+        """Atomically adds to a group's counters, creating its row if missing.
+
+        One INSERT … ON CONFLICT DO UPDATE SET count = count + delta: no read,
+        and concurrent writers serialize on the row instead of losing updates.
+        """
+        stmt = _insert_stats(db_session).values(
+            group_id=group_id, participant_count=participants, revealed_count=revealed
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[GroupStats.group_id],
+            set_={
+                "participant_count": GroupStats.participant_count
+                + stmt.excluded.participant_count,
+                "revealed_count": GroupStats.revealed_count
+                + stmt.excluded.revealed_count,
+            },
+        )
+        db_session.execute(stmt)
+
+    @staticmethod
+    def delete_stats(group_id: int, db_session: Session) -> None:
+        db_session.execute(delete(GroupStats).where(GroupStats.group_id == group_id))
+
+    @staticmethod
+    def rebuild_stats(
+        db_session: Session, after_id: int, limit: int
+    ) -> tuple[list[int], int]:
+        """Recounts the next limit groups after after_id into their counters.
+
+        Returns (group ids checked, number of groups whose counters were
+        missing or wrong). One aggregate INSERT … SELECT … ON CONFLICT that
+        only rewrites rows whose counts differ.
+        """
+        group_ids = list(
+            db_session.scalars(
+                select(Group.id)
+                .where(Group.id > after_id)
+                .order_by(Group.id)
+                .limit(limit)
+            )
+        )
+        if not group_ids:
+            return [], 0
+        counted = (
+            select(
+                Group.id,
+                func.count(Participant.id),
+                func.count(Participant.id).filter(
+                    Participant.status == ParticipantStatus.REVEALED
+                ),
+            )
+            .outerjoin(Participant, Participant.group_id == Group.id)
+            .where(Group.id.between(group_ids[0], group_ids[-1]))
+            .group_by(Group.id)
+        )
+        stmt = _insert_stats(db_session).from_select(
+            ["group_id", "participant_count", "revealed_count"], counted
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[GroupStats.group_id],
+            set_={
+                "participant_count": stmt.excluded.participant_count,
+                "revealed_count": stmt.excluded.revealed_count,
+            },
+            where=or_(
+                GroupStats.participant_count != stmt.excluded.participant_count,
+                GroupStats.revealed_count != stmt.excluded.revealed_count,
+            ),
+        )
+        repaired = db_session.scalars(stmt.returning(GroupStats.group_id)).all()
+        return group_ids, len(repaired)
+
+    @staticmethod
+    def stream_export(group_id: int, db_session: Session) -> Iterator[RowMapping]:
+        """One row per participant with the group and their draw, streamed.
+
+        A single query joining groups, participants and (outer) secret_friends
+        plus the receiver, read in batches from a server-side cursor as plain
+        row mappings keyed like GROUP_EXPORT_COLUMNS.
+        """
+        receiver = aliased(Participant)
+        stmt = (
+            select(
+                Group.id.label("group_id"),
+                Group.name.label("group_name"),
+                Group.category,
+                Participant.id.label("participant_id"),
+                Participant.name.label("participant_name"),
+                Participant.gift_hint,
+                Participant.status,
+                SecretFriend.id.label("secret_friend_id"),
+                SecretFriend.gift_receiver_id,
+                receiver.name.label("gift_receiver_name"),
+            )
+            .join(Participant, Participant.group_id == Group.id)
+            .outerjoin(SecretFriend, SecretFriend.gift_giver_id == Participant.id)
+            .outerjoin(receiver, receiver.id == SecretFriend.gift_receiver_id)
+            .where(Group.id == group_id, _live)
+            .order_by(Participant.id)
+            .execution_options(yield_per=_EXPORT_BATCH_SIZE)
+        )
+        yield from db_session.execute(stmt).mappings()
+
     @staticmethod
     def get_by_id(group_id: int, db_session: Session) -> Group:
         group = db_session.get(Group, group_id)
-        if not group:
+        if not group or group.deleted_at is not None:
             raise NotFoundError("Group not found")
         return group
 
     @staticmethod
-    def update(group_id: int, payload: GroupUpdate, db_session: Session) -> Group:
-        group = db_session.get(Group, group_id)
+    def clone(
+        group_id: int,
+        db_session: Session,
+        name: str | None = None,
+        description: str | None = None,
+    ) -> Group:
+        """Copies the group row with one INSERT … SELECT, returning the copy.
+
+        The copy gets a fresh link_url and joins the source's lineage, so
+        next year's draw can avoid this year's pairings. Members are copied
+        separately (ParticipantRepository.copy_to_group).
+        """
+        source = select(
+            func.coalesce(literal(name, String), Group.name),
+            func.coalesce(literal(description, String), Group.description),
+            Group.category,
+            literal(generate_group_token(), String),
+            func.coalesce(Group.lineage_id, Group.id),
+            literal(datetime.now(timezone.utc), DateTime(timezone=True)),
+        ).where(Group.id == group_id, _live)
+        stmt = (
+            insert(Group)
+            .from_select(
+                [
+                    Group.name,
+                    Group.description,
+                    Group.category,
+                    Group.link_url,
+                    Group.lineage_id,
+                    Group.created_at,
+                ],
+                source,
+            )
+            .returning(Group)
+        )
+        try:
+            group = db_session.scalars(stmt).one_or_none()
+        except IntegrityError:
+            raise ConflictError("Group clone failed. Unique constraint violated.")
         if not group:
             raise NotFoundError("Group not found")
-        for key, value in payload.model_dump(exclude_unset=True).items():
-            setattr(group, key, value)
+        return group
+
+    @staticmethod
+    def update(group_id: int, payload: GroupUpdate, db_session: Session) -> Group:
+        """Applies the changes with a single UPDATE … RETURNING."""
+        stmt = (
+            update(Group)
+            .where(Group.id == group_id, _live)
+            .values(**payload.model_dump(exclude_unset=True))
+            .returning(Group)
+            .execution_options(populate_existing=True)
+        )
         try:
-            db_session.flush()
-            db_session.refresh(group)
+            group = db_session.scalars(stmt).one_or_none()
         except IntegrityError:
             raise ConflictError("Group update failed. Unique constraint violated.")
+        if not group:
+            raise NotFoundError("Group not found")
         return group
 
     @staticmethod
     def delete(group_id: int, db_session: Session) -> None:
-        group = db_session.get(Group, group_id)
-        if not group:
+        """Deletes the group with one DELETE; the database cascades to its rows.
+
+        Participants and their secret_friends go through ON DELETE CASCADE,
+        so nothing is loaded — but the whole group is deleted in this one
+        transaction. See mark_deleted for groups too large for that.
+        """
+        stmt = delete(Group).where(Group.id == group_id, _live).returning(Group.id)
+        if db_session.scalars(stmt).one_or_none() is None:
+            raise NotFoundError("Group not found")
+
+    @staticmethod
+    def mark_deleted(group_id: int, db_session: Session) -> None:
+        """Hides the group at once; purge_participants then removes its rows."""
+        stmt = (
+            update(Group)
+            .where(Group.id == group_id, _live)
+            .values(deleted_at=datetime.now(timezone.utc))
+            .returning(Group)
+            .execution_options(populate_existing=True)
+        )
+        if db_session.scalars(stmt).one_or_none() is None:
             raise NotFoundError("Group not found")
-        db_session.delete(group)
-        db_session.flush()
+
+    @staticmethod
+    def get_deleted_at(group_id: int, db_session: Session) -> Row[tuple[Any]] | None:
+        """(deleted_at,) of the group, None inside when live; None if absent."""
+        stmt = select(Group.deleted_at).where(Group.id == group_id)
+        return db_session.execute(stmt).one_or_none()
+
+    @staticmethod
+    def purge_participants(group_id: int, limit: int, db_session: Session) -> int:
+        """Deletes up to limit participants of a marked group, returning how many.
+
+        Their secret_friends go with them through ON DELETE CASCADE.
+        """
+        chunk = (
+            select(Participant.id)
+            .join(Group, Group.id == Participant.group_id)
+            .where(Participant.group_id == group_id, Group.deleted_at.is_not(None))
+            .order_by(Participant.id)
+            .limit(limit)
+        )
+        stmt = (
+            delete(Participant)
+            .where(Participant.id.in_(chunk.scalar_subquery()))
+            .returning(Participant.id)
+            .execution_options(synchronize_session=False)
+        )
+        return len(db_session.scalars(stmt).all())
+
+    @staticmethod
+    def delete_marked(group_id: int, db_session: Session) -> None:
+        """Deletes a marked group's own row (and group_stats, by cascade)."""
+        db_session.execute(
+            delete(Group).where(Group.id == group_id, Group.deleted_at.is_not(None))
+        )
+
+    @staticmethod
+    def get_link_token_bounds(db_session: Session) -> tuple[int, int]:
+        """(number of groups with a link token, highest group id)."""
+        stmt = select(func.count(Group.link_url), func.coalesce(func.max(Group.id), 0))
+        count, max_id = db_session.execute(stmt).one()
+        return count, max_id
+
+    @staticmethod
+    def stream_link_tokens(
+        db_session: Session, after: int | None = None
+    ) -> Iterator[tuple[int, str]]:
+        """(id, link_url) of every group with a token, ordered by id, streamed."""
+        stmt = (
+            select(Group.id, Group.link_url)
+            .where(Group.link_url.is_not(None))
+            .order_by(Group.id)
+            .execution_options(yield_per=_TOKEN_BATCH_SIZE)
+        )
+        if after is not None:
+            stmt = stmt.where(Group.id > after)
+        for group_id, token in db_session.execute(stmt):
+            if token is not None:  # excluded by the WHERE; narrows the type
+                yield group_id, token
 
     @staticmethod
     def get_by_link_url(link_url: str, db_session: Session) -> Group:
-        stmt = select(Group).where(Group.link_url == link_url)
+        stmt = select(Group).where(Group.link_url == link_url, _live)
         group = db_session.execute(stmt).scalars().one_or_none()
         if not group:
             raise NotFoundError("Group not found")
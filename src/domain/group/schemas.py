@@ -31,6 +31,13 @@ class GroupUpdate(BaseModel):
         return data
 
 
+class GroupClone(BaseModel):
+    """Overrides for the copy; anything left out is taken from the source."""
+
+    name: str | None = Field(default=None, min_length=4)
+    description: str | None = None
+
+
 class GroupRead(BaseModel):
     model_config = {"from_attributes": True}
 
@@ -42,8 +49,83 @@ class GroupRead(BaseModel):
     participants: list["ParticipantBase"] = []
 
 
+class GroupCloneResult(BaseModel):
+    """A freshly cloned group, with how many members were copied into it."""
+
+    model_config = {"from_attributes": True}
+
+    id: int
+    name: str
+    description: str
+    category: CategoryEnum
+    link_url: str | None = None
+    lineage_id: int
+    source_id: int
+    participant_count: int
+
+
 class GroupList(BaseModel):
     groups: list[GroupRead] = Field(default_factory=list)
+    # Cursor for the next page (pass as `after`); None on the last page.
+    next_after: int | None = None
+
+
+class GroupStatsRead(BaseModel):
+    """Maintained member counters of a group — an O(1) read."""
+
+    model_config = {"from_attributes": True}
+
+    group_id: int
+    participant_count: int = 0
+    revealed_count: int = 0
+
+
+class GroupStatsReport(BaseModel):
+    """Progress of a counter reconciliation run."""
+
+    groups_checked: int = 0
+    groups_repaired: int = 0
+    last_group_id: int = 0
+
+
+class GroupPurgeReport(BaseModel):
+    """Outcome of purging a group deleted in the background."""
+
+    group_id: int
+    participants_purged: int = 0
+
+
+class GroupSummary(BaseModel):
+    """List-view projection of a group — counts instead of participant rows."""
+
+    model_config = {"from_attributes": True}
+
+    id: int
+    name: str
+    category: CategoryEnum
+    participant_count: int
+    revealed_count: int
+
+
+class GroupSummaryList(BaseModel):
+    groups: list[GroupSummary] = Field(default_factory=list)
+    # Cursor for the next page (pass as `after`); None on the last page.
+    next_after: int | None = None
+
+
+# Columns of GET /groups/{id}/export, one row per participant, in CSV order.
+GROUP_EXPORT_COLUMNS = (
+    "group_id",
+    "group_name",
+    "category",
+    "participant_id",
+    "participant_name",
+    "gift_hint",
+    "status",
+    "secret_friend_id",
+    "gift_receiver_id",
+    "gift_receiver_name",
+)
 
 
 # Deferred import to avoid circular dependency
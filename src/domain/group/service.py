@@ -1,9 +1,39 @@
+import logging
+from collections.abc import Callable, Iterator
+
+from sqlalchemy import RowMapping
 from sqlalchemy.orm import Session
 
+from src.domain.group.link_filter import link_tokens
 from src.domain.group.repository import GroupRepository
-from src.domain.group.schemas import GroupCreate, GroupList, GroupRead, GroupUpdate
-from src.domain.group.signals import group_created, group_deleted, group_updated
+from src.domain.group.schemas import (
+    GroupClone,
+    GroupCloneResult,
+    GroupCreate,
+    GroupList,
+    GroupPurgeReport,
+    GroupRead,
+    GroupStatsRead,
+    GroupStatsReport,
+    GroupSummary,
+    GroupSummaryList,
+    GroupUpdate,
+)
+from src.domain.group.signals import (
+    group_cloned,
+    group_created,
+    group_deleted,
+    group_updated,
+)
 from src.infrastructure.persistence import transaction
+from src.shared.exceptions import BusinessRuleError, NotFoundError
+
+log = logging.getLogger(__name__)
+
+# Groups recounted per transaction by reconcile_stats().
+_RECONCILE_BATCH_SIZE = 1000
+# Participants deleted per transaction by purge().
+_PURGE_BATCH_SIZE = 5000
 
 
 class GroupService:
@@ -15,6 +45,42 @@ class GroupService:
             group_created.send(GroupService, group=validated)
             return validated
 
+    @staticmethod
+    def clone(
+        group_id: int, db_session: Session, payload: GroupClone | None = None
+    ) -> GroupCloneResult:
+        """Copies a group and all its members for another round, all or nothing.
+
+        Two INSERT … SELECT statements whatever the group's size; the copy
+        has a new link and every member starts again as PENDING.
+        """
+        # ParticipantService imports this module for its group checks.
+        from src.domain.participant.service import ParticipantService
+
+        payload = payload or GroupClone()
+        with transaction(db_session):
+            group = GroupRepository.clone(
+                group_id=group_id,
+                db_session=db_session,
+                name=payload.name,
+                description=payload.description,
+            )
+            participant_ids = ParticipantService.copy_to_group(
+                source_group_id=group_id, group_id=group.id, db_session=db_session
+            )
+            result = GroupCloneResult(
+                id=group.id,
+                name=group.name,
+                description=group.description,
+                category=group.category,
+                link_url=group.link_url,
+                lineage_id=group.lineage_id or group_id,
+                source_id=group_id,
+                participant_count=len(participant_ids),
+            )
+            group_cloned.send(GroupService, group=result, db_session=db_session)
+            return result
+
     @staticmethod
     def update(group_id: int, payload: GroupUpdate, db_session: Session) -> GroupRead:
         with transaction(db_session):
@@ -26,24 +92,177 @@ class GroupService:
             return validated
 
     @staticmethod
-    def delete(group_id: int, db_session: Session) -> None:
+    def delete(group_id: int, db_session: Session, background: bool = False) -> None:
+        """Deletes the group and, by database cascade, everything in it.
+
+        With background, the group is only marked deleted — it is gone for
+        every read at once — and the groups.purge task removes its rows in
+        chunks, so a huge group never holds one long transaction.
+        """
+        with transaction(db_session):
+            if background:
+                GroupRepository.mark_deleted(group_id=group_id, db_session=db_session)
+            else:
+                GroupRepository.delete(group_id=group_id, db_session=db_session)
+            group_deleted.send(
+                GroupService,
+                group_id=group_id,
+                purge=background,
+                db_session=db_session,
+            )
+
+    @staticmethod
+    def purge(
+        group_id: int, db_session: Session, batch_size: int = _PURGE_BATCH_SIZE
+    ) -> GroupPurgeReport:
+        """Removes a group deleted in the background, batch_size members at a time.
+
+        Each batch commits on its own; an interrupted purge simply resumes
+        when run again. A group that is already gone reports nothing purged.
+        Raises BusinessRuleError for a group that is not marked deleted —
+        possibly because the marking transaction has not committed yet.
+        """
+        report = GroupPurgeReport(group_id=group_id)
+        row = GroupRepository.get_deleted_at(group_id=group_id, db_session=db_session)
+        if row is None:
+            return report
+        if row.deleted_at is None:
+            raise BusinessRuleError("Group is not marked for deletion")
+        while True:
+            with transaction(db_session):
+                purged = GroupRepository.purge_participants(
+                    group_id=group_id, limit=batch_size, db_session=db_session
+                )
+            report.participants_purged += purged
+            log.info(
+                "purge progress — group_id=%s purged=%s",
+                group_id,
+                report.participants_purged,
+            )
+            if purged < batch_size:
+                break
         with transaction(db_session):
-            GroupRepository.delete(group_id=group_id, db_session=db_session)
-            group_deleted.send(GroupService, group_id=group_id)
+            GroupRepository.delete_marked(group_id=group_id, db_session=db_session)
+        return report
 
     @staticmethod
-    def get_all(db_session: Session) -> GroupList:
-        groups = GroupRepository.get_all(db_session=db_session)
-        items = [GroupRead.model_validate(g) for g in groups]
-        return GroupList(groups=items)
+    def get_all(
+        db_session: Session, limit: int | None = None, after: int | None = None
+    ) -> GroupList:
+        """One page of groups; next_after is set when another page follows."""
+        groups = GroupRepository.get_all(
+            db_session=db_session,
+            limit=None if limit is None else limit + 1,
+            after=after,
+        )
+        items = [GroupRead.model_validate(g) for g in groups[:limit]]
+        has_more = limit is not None and len(groups) > limit
+        return GroupList(groups=items, next_after=items[-1].id if has_more else None)
+
+    @staticmethod
+    def get_page_version(
+        db_session: Session, limit: int | None = None, after: int | None = None
+    ) -> str:
+        """Changes whenever the page get_all(limit, after) returns would change."""
+        row = GroupRepository.get_page_version(
+            db_session=db_session,
+            limit=None if limit is None else limit + 1,
+            after=after,
+        )
+        return ":".join(str(value) for value in row)
+
+    @staticmethod
+    def stream_all(
+        db_session: Session, after: int | None = None
+    ) -> Iterator[GroupRead]:
+        for group in GroupRepository.stream_all(db_session=db_session, after=after):
+            yield GroupRead.model_validate(group)
+
+    @staticmethod
+    def get_summaries(
+        db_session: Session, limit: int | None = None, after: int | None = None
+    ) -> GroupSummaryList:
+        """One page of group summaries; next_after is set when another page follows."""
+        rows = GroupRepository.get_summaries(
+            db_session=db_session,
+            limit=None if limit is None else limit + 1,
+            after=after,
+        )
+        items = [GroupSummary.model_validate(row) for row in rows[:limit]]
+        has_more = limit is not None and len(rows) > limit
+        return GroupSummaryList(
+            groups=items, next_after=items[-1].id if has_more else None
+        )
+
+    @staticmethod
+    def get_stats(group_id: int, db_session: Session) -> GroupStatsRead:
+        """The group's maintained member counters — no participant rows are read."""
+        row = GroupRepository.get_stats(group_id=group_id, db_session=db_session)
+        return GroupStatsRead.model_validate(row)
+
+    @staticmethod
+    def reconcile_stats(
+        db_session: Session,
+        batch_size: int = _RECONCILE_BATCH_SIZE,
+        after_id: int = 0,
+        progress: Callable[[GroupStatsReport], None] | None = None,
+    ) -> GroupStatsReport:
+        """Recounts every group's counters from its participants, in batches.
+
+        Each batch is one aggregate upsert in its own transaction, rewriting
+        only counters that drifted; resume from last_group_id if interrupted.
+        """
+        report = GroupStatsReport(last_group_id=after_id)
+        while True:
+            with transaction(db_session):
+                group_ids, repaired = GroupRepository.rebuild_stats(
+                    db_session=db_session,
+                    after_id=report.last_group_id,
+                    limit=batch_size,
+                )
+            if not group_ids:
+                break
+            report.groups_checked += len(group_ids)
+            report.groups_repaired += repaired
+            report.last_group_id = group_ids[-1]
+            log.info(
+                "reconcile_stats progress — checked=%s repaired=%s last_group_id=%s",
+                report.groups_checked,
+                report.groups_repaired,
+                report.last_group_id,
+            )
+            if progress:
+                progress(report)
+        return report
+
+    @staticmethod
+    def export(group_id: int, db_session: Session) -> Iterator[RowMapping]:
+        """Stream the group's participants and draws as plain rows.
+
+        Checks the group exists before returning, so a missing group fails
+        before a response starts streaming.
+        """
+        GroupRepository.get_by_id(group_id=group_id, db_session=db_session)
+        return GroupRepository.stream_export(group_id=group_id, db_session=db_session)
 
     @staticmethod
     def get_by_id(group_id: int, db_session: Session) -> GroupRead:
         result = GroupRepository.get_by_id(group_id=group_id, db_session=db_session)
         return GroupRead.model_validate(result)
 
+    @staticmethod
+    def get_version(group_id: int, db_session: Session) -> str:
+        """Changes whenever the group's GroupRead would change."""
+        row = GroupRepository.get_version(group_id=group_id, db_session=db_session)
+        if row is None:
+            raise NotFoundError("Group not found")
+        return ":".join(str(value) for value in row)
+
     @staticmethod
     def get_by_link_url(link_url: str, db_session: Session) -> GroupRead:
+        """Unknown tokens are refused by the link filter before any query."""
+        if not link_tokens.might_exist(link_url, db_session=db_session):
+            raise NotFoundError("Group not found")
         result = GroupRepository.get_by_link_url(
             link_url=link_url, db_session=db_session
         )
@@ -5,3 +5,5 @@ from blinker import NamedSignal, signal
 group_created: NamedSignal = signal("group.created")
 group_updated: NamedSignal = signal("group.updated")
 group_deleted: NamedSignal = signal("group.deleted")
+# Sent once per clone; the copied members are not announced one by one.
+group_cloned: NamedSignal = signal("group.cloned")
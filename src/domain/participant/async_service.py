@@ -0,0 +1,83 @@
+"""Async variants of ParticipantService for the async API routes.
+
+Each method runs the sync service on the async session's connection (see
+src.infrastructure.persistence.async_session).
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.participant.schemas import (
+    ParticipantBatchResult,
+    ParticipantBatchUpdate,
+    ParticipantCreate,
+    ParticipantList,
+    ParticipantRead,
+    ParticipantUpdate,
+)
+from src.domain.participant.service import ParticipantService
+from src.infrastructure.persistence import run_sync
+
+
+class AsyncParticipantService:
+    @staticmethod
+    async def create(
+        participant: ParticipantCreate, db_session: AsyncSession
+    ) -> ParticipantRead:
+        return await run_sync(
+            db_session, ParticipantService.create, participant=participant
+        )
+
+    @staticmethod
+    async def get_all(
+        db_session: AsyncSession, limit: int | None = None, after: int | None = None
+    ) -> ParticipantList:
+        return await run_sync(
+            db_session, ParticipantService.get_all, limit=limit, after=after
+        )
+
+    @staticmethod
+    async def get_page_version(
+        db_session: AsyncSession, limit: int | None = None, after: int | None = None
+    ) -> str:
+        return await run_sync(
+            db_session, ParticipantService.get_page_version, limit=limit, after=after
+        )
+
+    @staticmethod
+    async def get_version(participant_id: int, db_session: AsyncSession) -> str:
+        return await run_sync(
+            db_session, ParticipantService.get_version, participant_id=participant_id
+        )
+
+    @staticmethod
+    async def get_by_id(
+        participant_id: int, db_session: AsyncSession
+    ) -> ParticipantRead:
+        return await run_sync(
+            db_session, ParticipantService.get_by_id, participant_id=participant_id
+        )
+
+    @staticmethod
+    async def delete(participant_id: int, db_session: AsyncSession) -> None:
+        await run_sync(
+            db_session, ParticipantService.delete, participant_id=participant_id
+        )
+
+    @staticmethod
+    async def update(
+        participant_id: int, payload: ParticipantUpdate, db_session: AsyncSession
+    ) -> ParticipantRead:
+        return await run_sync(
+            db_session,
+            ParticipantService.update,
+            participant_id=participant_id,
+            payload=payload,
+        )
+
+    @staticmethod
+    async def update_batch(
+        payload: ParticipantBatchUpdate, db_session: AsyncSession
+    ) -> ParticipantBatchResult:
+        return await run_sync(
+            db_session, ParticipantService.update_batch, payload=payload
+        )
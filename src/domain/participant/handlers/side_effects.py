@@ -7,6 +7,8 @@ from src.domain.participant.signals import (
     participant_created,
     participant_deleted,
     participant_updated,
+    participants_imported,
+    participants_updated,
 )
 from src.shared.signals import isolated
 
@@ -35,6 +37,24 @@ def _on_participant_updated(
     )
 
 
+@isolated
+def _on_participants_imported(
+    sender: type, *, group_id: int, participant_ids: list[int], **kwargs: object
+) -> None:
+    log.info(
+        "lifecycle: participants imported — group_id=%s count=%s",
+        group_id,
+        len(participant_ids),
+    )
+
+
+@isolated
+def _on_participants_updated(
+    sender: type, *, participant_ids: list[int], **kwargs: object
+) -> None:
+    log.info("lifecycle: participants updated — count=%s", len(participant_ids))
+
+
 @isolated
 def _on_participant_deleted(
     sender: type, *, participant_id: int, **kwargs: object
@@ -46,4 +66,6 @@ def register_side_effects() -> None:
     """Connect participant side-effect handlers to their signals."""
     participant_created.connect(_on_participant_created)
     participant_updated.connect(_on_participant_updated)
+    participants_imported.connect(_on_participants_imported)
+    participants_updated.connect(_on_participants_updated)
     participant_deleted.connect(_on_participant_deleted)
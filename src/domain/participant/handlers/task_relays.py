@@ -1,7 +1,11 @@
 """Participant task relays — bridge lifecycle events to the background task queue."""
 
 from src.domain.participant.schemas import ParticipantRead
-from src.domain.participant.signals import participant_created, participant_deleted
+from src.domain.participant.signals import (
+    participant_created,
+    participant_deleted,
+    participants_imported,
+)
 from src.shared.signals import isolated
 from src.shared.task_backend import dispatch_task
 
@@ -17,6 +21,17 @@ def _relay_participant_created(
     )
 
 
+@isolated
+def _relay_participants_imported(
+    sender: type, *, group_id: int, participant_ids: list[int], **kwargs: object
+) -> None:
+    dispatch_task(
+        "notifications.participants_joined",
+        group_id=group_id,
+        participant_ids=participant_ids,
+    )
+
+
 @isolated
 def _relay_participant_deleted(
     sender: type, *, participant_id: int, **kwargs: object
@@ -27,4 +42,5 @@ def _relay_participant_deleted(
 def register_task_relays() -> None:
     """Connect participant task relay handlers to their signals."""
     participant_created.connect(_relay_participant_created)
+    participants_imported.connect(_relay_participants_imported)
     participant_deleted.connect(_relay_participant_deleted)
@@ -7,7 +7,10 @@ MUST succeed or the whole operation fails.
 
 from sqlalchemy.orm import Session
 
-from src.domain.secret_friend.signals import secret_friend_assigned
+from src.domain.secret_friend.signals import (
+    secret_friend_assigned,
+    secret_friend_drawn,
+)
 
 
 def _reveal_participant_on_assignment(
@@ -27,6 +30,19 @@ def _reveal_participant_on_assignment(
     )
 
 
+def _reveal_group_on_draw(
+    sender: type, *, group_id: int, db_session: Session, **kwargs: object
+) -> None:
+    """Mark every participant of the group as REVEALED after a whole-group draw.
+
+    Listens to: secret_friend.drawn (from secret_friend domain)
+    """
+    from src.domain.participant.service import ParticipantService
+
+    ParticipantService.reveal_by_group_id(group_id=group_id, db_session=db_session)
+
+
 def register_transactional() -> None:
     """Connect participant transactional handlers to their signals."""
     secret_friend_assigned.connect(_reveal_participant_on_assignment)
+    secret_friend_drawn.connect(_reveal_group_on_draw)
@@ -1,6 +1,6 @@
 from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, ForeignKey, String
+from sqlalchemy import DateTime, ForeignKey, Index, String
 from sqlalchemy import Enum as SQLAlchemyEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -10,6 +10,15 @@ from src.domain.participant.schemas import ParticipantStatus
 
 class Participant(Base):
     __tablename__ = "participants"
+    __table_args__ = (
+        # Serves name search (ILIKE '%q%' and the fuzzy <% operator).
+        Index(
+            "ix_participants_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String, nullable=False)
@@ -31,7 +40,7 @@ class Participant(Base):
     )
 
     group_id: Mapped[int] = mapped_column(
-        ForeignKey("groups.id"), nullable=False, index=True
+        ForeignKey("groups.id", ondelete="CASCADE"), nullable=False, index=True
     )
     group: Mapped["Group"] = relationship(back_populates="participants")
 
@@ -40,6 +49,7 @@ class Participant(Base):
         back_populates="giver",
         uselist=False,
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     gift_receiver: Mapped["SecretFriend | None"] = relationship(
         foreign_keys="SecretFriend.gift_receiver_id",
@@ -13,6 +13,15 @@ def on_participant_joined(*, participant_id: int, group_id: int) -> None:
     )
 
 
+def on_participants_joined(*, group_id: int, participant_ids: list[int]) -> None:
+    """Handle a batch of participants joining through a bulk import."""
+    log.info(
+        "notification: participants joined — group_id=%s count=%s",
+        group_id,
+        len(participant_ids),
+    )
+
+
 def on_participant_deleted(*, participant_id: int) -> None:
     """Handle participant-deleted notification."""
     log.info("notification: participant deleted — id=%s", participant_id)
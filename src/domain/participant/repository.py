@@ -1,26 +1,80 @@
-from sqlalchemy import select
+import csv
+import io
+from array import array
+from collections.abc import Iterator, Sequence
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import (
+    ColumnElement,
+    DateTime,
+    Integer,
+    Row,
+    any_,
+    bindparam,
+    cast,
+    func,
+    insert,
+    literal,
+    select,
+    update,
+)
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, joinedload
 
 from src.domain.group.model import Group
 from src.domain.participant.model import Participant
-from src.domain.participant.schemas import ParticipantCreate, ParticipantUpdate
+from src.domain.participant.schemas import (
+    ParticipantBatchChange,
+    ParticipantCreate,
+    ParticipantImport,
+    ParticipantStatus,
+    ParticipantUpdate,
+)
 from src.domain.secret_friend.model import SecretFriend
 from src.shared.exceptions import ConflictError, NotFoundError
 
+# Rows fetched per round trip when streaming with a server-side cursor.
+_STREAM_BATCH_SIZE = 1000
+
+
+# When a row last changed — updated_at is only set by the first update.
+_changed_at = func.coalesce(Participant.updated_at, Participant.created_at)
+
+# Members of a group marked for deletion read as gone, like the group itself.
+_in_live_group = (
+    select(Group.id)
+    .where(Group.id == Participant.group_id, Group.deleted_at.is_(None))
+    .exists()
+)
+
+
+def _id_among(
+    participant_ids: Sequence[int], db_session: Session
+) -> ColumnElement[bool]:
+    """Participant.id in participant_ids.
+
+    Postgres gets `id = ANY(:ids)` with one array parameter, so the statement
+    text is the same whatever the number of ids; elsewhere an IN list.
+    """
+    if db_session.get_bind().dialect.name == "postgresql":
+        ids = bindparam("ids", list(participant_ids), type_=postgresql.ARRAY(Integer))
+        return Participant.id == any_(ids)
+    return Participant.id.in_(participant_ids)
+
 
 class ParticipantRepository:
     @staticmethod
     def create(participant: ParticipantCreate, db_session: Session) -> Participant:
         group = db_session.get(Group, participant.group_id)
-        if not group:
+        if not group or group.deleted_at is not None:
             raise NotFoundError("Group not found")
 
         new_participant = Participant(**participant.model_dump())
         try:
             db_session.add(new_participant)
             db_session.flush()
-            db_session.refresh(new_participant)
         except IntegrityError:
             raise ConflictError(
                 "Participant creation failed. Unique constraint violated."
@@ -28,23 +82,210 @@ class ParticipantRepository:
         return new_participant
 
     @staticmethod
-    def get_all(db_session: Session) -> list[Participant]:
-        stmt = select(Participant).options(
-            joinedload(Participant.gift_giver).joinedload(SecretFriend.receiver)
+    def bulk_create(
+        group_id: int, rows: Sequence[ParticipantImport], db_session: Session
+    ) -> list[int]:
+        """Inserts a chunk of participants into a group, returning their ids.
+
+        Postgres: ids are reserved from the sequence in one query, then the rows
+        are streamed with COPY. Elsewhere: one executemany INSERT … RETURNING.
+        No ORM objects are built either way.
+        """
+        if not rows:
+            return []
+        now = datetime.now(timezone.utc)
+        if db_session.get_bind().dialect.name == "postgresql":
+            return ParticipantRepository._copy(group_id, rows, now, db_session)
+        stmt = insert(Participant).returning(Participant.id)
+        values = [
+            {
+                "group_id": group_id,
+                "name": row.name,
+                "gift_hint": row.gift_hint,
+                "status": ParticipantStatus.PENDING,
+                "created_at": now,
+            }
+            for row in rows
+        ]
+        return list(db_session.scalars(stmt, values))
+
+    @staticmethod
+    def _copy(
+        group_id: int,
+        rows: Sequence[ParticipantImport],
+        now: datetime,
+        db_session: Session,
+    ) -> list[int]:
+        ids = list(
+            db_session.scalars(
+                select(
+                    func.nextval(func.pg_get_serial_sequence("participants", "id"))
+                ).select_from(func.generate_series(1, len(rows)))
+            )
         )
-        return list(db_session.execute(stmt).scalars().unique().all())
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for participant_id, row in zip(ids, rows):
+            # An unquoted empty field is NULL in COPY's csv format.
+            writer.writerow(
+                [
+                    participant_id,
+                    group_id,
+                    row.name,
+                    row.gift_hint,
+                    ParticipantStatus.PENDING.name,
+                    now.isoformat(),
+                ]
+            )
+        buffer.seek(0)
+        # The psycopg2 connection; None once the connection was invalidated.
+        driver_connection = db_session.connection().connection.driver_connection
+        if driver_connection is None:
+            raise RuntimeError("participant import lost its database connection")
+        driver_connection.cursor().copy_expert(
+            "COPY participants (id, group_id, name, gift_hint, status, created_at) "
+            "FROM STDIN WITH (FORMAT csv)",
+            buffer,
+        )
+        return ids
+
+    @staticmethod
+    def copy_to_group(
+        source_group_id: int, group_id: int, db_session: Session
+    ) -> list[int]:
+        """Copies every member of one group into another, returning the new ids.
+
+        One INSERT … SELECT, in id order: names and gift hints carry over,
+        status starts again at PENDING. No rows are read into Python.
+        """
+        source = (
+            select(
+                literal(group_id, Integer),
+                Participant.name,
+                Participant.gift_hint,
+                # An untyped parameter would be text to Postgres, not the enum.
+                cast(ParticipantStatus.PENDING, Participant.status.type),
+                literal(datetime.now(timezone.utc), DateTime(timezone=True)),
+            )
+            .where(Participant.group_id == source_group_id)
+            .order_by(Participant.id)
+        )
+        stmt = (
+            insert(Participant)
+            .from_select(
+                [
+                    Participant.group_id,
+                    Participant.name,
+                    Participant.gift_hint,
+                    Participant.status,
+                    Participant.created_at,
+                ],
+                source,
+            )
+            .returning(Participant.id)
+        )
+        return list(db_session.scalars(stmt))
+
+    @staticmethod
+    def get_all(
+        db_session: Session, limit: int | None = None, after: int | None = None
+    ) -> list[Participant]:
+        """Participants ordered by id; keyset-paginated with limit and after.
+
+        ParticipantRead has no relationship fields, so nothing is eager-loaded.
+        """
+        stmt = (
+            select(Participant)
+            .where(_in_live_group)
+            .order_by(Participant.id)
+            .limit(limit)
+        )
+        if after is not None:
+            stmt = stmt.where(Participant.id > after)
+        return list(db_session.execute(stmt).scalars().all())
+
+    @staticmethod
+    def get_version(participant_id: int, db_session: Session) -> Row[tuple[Any]] | None:
+        """When the participant last changed, without loading it; None if absent."""
+        stmt = select(_changed_at).where(
+            Participant.id == participant_id, _in_live_group
+        )
+        return db_session.execute(stmt).one_or_none()
+
+    @staticmethod
+    def get_page_version(
+        db_session: Session, limit: int | None = None, after: int | None = None
+    ) -> Row[tuple[Any, ...]]:
+        """Count, last id and last change of the page get_all would return."""
+        page_stmt = (
+            select(Participant.id, _changed_at.label("changed_at"))
+            .where(_in_live_group)
+            .order_by(Participant.id)
+            .limit(limit)
+        )
+        if after is not None:
+            page_stmt = page_stmt.where(Participant.id > after)
+        page = page_stmt.subquery()
+        stmt = select(
+            func.count(page.c.id), func.max(page.c.id), func.max(page.c.changed_at)
+        )
+        return db_session.execute(stmt).one()
+
+    @staticmethod
+    def stream_all(
+        db_session: Session, after: int | None = None
+    ) -> Iterator[Participant]:
+        """Every participant by id, read in batches from a server-side cursor."""
+        stmt = (
+            select(Participant)
+            .where(_in_live_group)
+            .order_by(Participant.id)
+            .execution_options(yield_per=_STREAM_BATCH_SIZE)
+        )
+        if after is not None:
+            stmt = stmt.where(Participant.id > after)
+        yield from db_session.scalars(stmt)
 
     @staticmethod
     def get_by_group_id(group_id: int, db_session: Session) -> list[Participant]:
         stmt = (
             select(Participant)
-            .where(Participant.group_id == group_id)
+            .where(Participant.group_id == group_id, _in_live_group)
             .options(
                 joinedload(Participant.gift_giver).joinedload(SecretFriend.receiver)
             )
         )
         return list(db_session.execute(stmt).scalars().unique().all())
 
+    @staticmethod
+    def get_ids_by_group_id(group_id: int, db_session: Session) -> "array[int]":
+        """Member ids of a group as a compact int64 array, ordered by id.
+
+        Selects the id column only — no other columns cross the wire and no
+        ORM objects or schemas are built.
+        """
+        stmt = (
+            select(Participant.id)
+            .where(Participant.group_id == group_id, _in_live_group)
+            .order_by(Participant.id)
+        )
+        return array("q", db_session.scalars(stmt))
+
+    @staticmethod
+    def get_ids_by_group_ids(
+        group_ids: Sequence[int], db_session: Session
+    ) -> dict[int, list[int]]:
+        """Member ids of several groups in one query, ordered by id per group."""
+        stmt = (
+            select(Participant.group_id, Participant.id)
+            .where(Participant.group_id.in_(group_ids), _in_live_group)
+            .order_by(Participant.group_id, Participant.id)
+        )
+        members: dict[int, list[int]] = {group_id: [] for group_id in group_ids}
+        for group_id, participant_id in db_session.execute(stmt):
+            members[group_id].append(participant_id)
+        return members
+
     @staticmethod
     def get_by_id(participant_id: int, db_session: Session) -> Participant:
         stmt = (
@@ -52,7 +293,7 @@ class ParticipantRepository:
             .options(
                 joinedload(Participant.gift_giver).joinedload(SecretFriend.receiver)
             )
-            .where(Participant.id == participant_id)
+            .where(Participant.id == participant_id, _in_live_group)
         )
         participant = db_session.execute(stmt).scalars().unique().one_or_none()
         if not participant:
@@ -60,29 +301,139 @@ class ParticipantRepository:
         return participant
 
     @staticmethod
-    def delete(participant_id: int, db_session: Session) -> None:
-        participant = db_session.get(Participant, participant_id)
+    def delete(participant_id: int, db_session: Session) -> Participant:
+        """Deletes the participant and returns it (for its group and status)."""
+        stmt = select(Participant).where(
+            Participant.id == participant_id, _in_live_group
+        )
+        participant = db_session.scalars(stmt).one_or_none()
         if not participant:
             raise NotFoundError("Participant not found")
         db_session.delete(participant)
         db_session.flush()
+        return participant
+
+    @staticmethod
+    def update_changing_status(
+        participant_id: int, payload: ParticipantUpdate, db_session: Session
+    ) -> Participant | None:
+        """Like update, but only if it changes the status; None when it would not.
+
+        The status test is part of the UPDATE, so the answer holds even when
+        two transactions race to change the same participant.
+        """
+        return ParticipantRepository._update(
+            payload,
+            db_session,
+            Participant.id == participant_id,
+            Participant.status != payload.status,
+        )
 
     @staticmethod
     def update(
         participant_id: int, payload: ParticipantUpdate, db_session: Session
     ) -> Participant:
-        participant = db_session.get(Participant, participant_id)
+        """Applies the changes with a single UPDATE … RETURNING."""
+        participant = ParticipantRepository._update(
+            payload, db_session, Participant.id == participant_id
+        )
         if not participant:
             raise NotFoundError("Participant not found")
+        return participant
+
+    @staticmethod
+    def _update(
+        payload: ParticipantUpdate,
+        db_session: Session,
+        *criteria: ColumnElement[bool],
+    ) -> Participant | None:
+        stmt = (
+            update(Participant)
+            .where(*criteria, _in_live_group)
+            .values(**payload.model_dump(exclude_unset=True))
+            .returning(Participant)
+            .execution_options(populate_existing=True)
+        )
+        try:
+            return db_session.scalars(stmt).one_or_none()
+        except IntegrityError:
+            raise ConflictError(
+                "Participant update failed. Unique constraint violated."
+            )
+
+    @staticmethod
+    def lock_statuses(
+        participant_ids: Sequence[int], db_session: Session
+    ) -> list[Row[tuple[int, int, ParticipantStatus]]]:
+        """(id, group_id, status) of the given participants that exist.
 
-        for key, value in payload.model_dump(exclude_unset=True).items():
-            setattr(participant, key, value)
+        Members of groups marked for deletion are left out, as if gone.
+        The rows stay locked until the transaction ends, so the statuses read
+        here are still the ones an update in the same transaction replaces.
+        """
+        stmt = (
+            select(Participant.id, Participant.group_id, Participant.status)
+            .where(_id_among(participant_ids, db_session), _in_live_group)
+            .order_by(Participant.id)
+            .with_for_update()
+        )
+        return list(db_session.execute(stmt).all())
 
+    @staticmethod
+    def update_many(
+        participant_ids: Sequence[int], payload: ParticipantUpdate, db_session: Session
+    ) -> None:
+        """Applies the same changes to every given participant in one UPDATE."""
+        stmt = (
+            update(Participant)
+            .where(_id_among(participant_ids, db_session))
+            .values(**payload.model_dump(exclude_unset=True))
+            .execution_options(synchronize_session="fetch")
+        )
         try:
-            db_session.flush()
-            db_session.refresh(participant)
+            db_session.execute(stmt)
         except IntegrityError:
             raise ConflictError(
                 "Participant update failed. Unique constraint violated."
             )
-        return participant
+
+    @staticmethod
+    def update_each(
+        changes: Sequence[ParticipantBatchChange], db_session: Session
+    ) -> None:
+        """Applies per-participant changes as executemany UPDATEs by id.
+
+        Rows changing the same set of columns share one statement; no ORM
+        objects are loaded.
+        """
+        now = datetime.now(timezone.utc)
+        rows = [
+            {**change.model_dump(exclude_unset=True), "updated_at": now}
+            for change in changes
+        ]
+        try:
+            db_session.execute(update(Participant), rows)
+        except IntegrityError:
+            raise ConflictError(
+                "Participant update failed. Unique constraint violated."
+            )
+
+    @staticmethod
+    def reveal_by_group_id(group_id: int, db_session: Session) -> int:
+        """Marks every participant of a group as REVEALED in one UPDATE.
+
+        Returns how many changed status; already revealed rows are left alone.
+        """
+        stmt = (
+            update(Participant)
+            .where(
+                Participant.group_id == group_id,
+                Participant.status != ParticipantStatus.REVEALED,
+            )
+            .values(
+                status=ParticipantStatus.REVEALED,
+                updated_at=datetime.now(timezone.utc),
+            )
+            .returning(Participant.id)
+        )
+        return len(db_session.scalars(stmt).all())
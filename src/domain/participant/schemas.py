@@ -1,7 +1,7 @@
 from datetime import datetime
 from enum import Enum
 
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, Field, model_validator
 
 
 class ParticipantStatus(str, Enum):
@@ -23,6 +23,18 @@ class ParticipantCreate(BaseModel):
     group_id: int
 
 
+class ParticipantImport(BaseModel):
+    """One row of a bulk import; the group comes from the URL."""
+
+    name: str = Field(..., min_length=1)
+    gift_hint: str | None = None
+
+
+class ParticipantImportResult(BaseModel):
+    group_id: int
+    created: int
+
+
 class ParticipantRead(BaseModel):
     model_config = {"from_attributes": True}
 
@@ -37,6 +49,8 @@ class ParticipantRead(BaseModel):
 
 class ParticipantList(BaseModel):
     participants: list[ParticipantRead]
+    # Cursor for the next page (pass as `after`); None on the last page.
+    next_after: int | None = None
 
 
 class ParticipantUpdate(BaseModel):
@@ -50,3 +64,58 @@ class ParticipantUpdate(BaseModel):
         if isinstance(data, dict) and not any(data.values()):
             raise ValueError("At least one field must be provided")
         return data
+
+
+# Most participants one batch update may touch.
+MAX_BATCH_SIZE = 10_000
+
+
+class ParticipantBatchChange(ParticipantUpdate):
+    """One participant's changes within a heterogeneous batch update."""
+
+    id: int
+
+    @model_validator(mode="before")
+    @classmethod
+    def at_least_one_field(cls, data: object) -> object:
+        if isinstance(data, dict) and not any(
+            value for key, value in data.items() if key != "id"
+        ):
+            raise ValueError("At least one field must be provided")
+        return data
+
+
+class ParticipantBatchUpdate(BaseModel):
+    """Either the same changes for many ids, or per-participant changes.
+
+    {"ids": [1, 2], "changes": {"status": "PENDING"}} is homogeneous;
+    {"updates": [{"id": 1, "gift_hint": "…"}, …]} is heterogeneous.
+    """
+
+    ids: list[int] | None = Field(default=None, min_length=1, max_length=MAX_BATCH_SIZE)
+    changes: ParticipantUpdate | None = None
+    updates: list[ParticipantBatchChange] | None = Field(
+        default=None, min_length=1, max_length=MAX_BATCH_SIZE
+    )
+
+    @model_validator(mode="after")
+    def one_form(self) -> "ParticipantBatchUpdate":
+        homogeneous = self.ids is not None or self.changes is not None
+        if homogeneous == (self.updates is not None):
+            raise ValueError("Provide either ids and changes, or updates")
+        if homogeneous and (self.ids is None or self.changes is None):
+            raise ValueError("ids and changes must be provided together")
+        if len(set(self.participant_ids)) != len(self.participant_ids):
+            raise ValueError("Participant ids must be unique")
+        return self
+
+    @property
+    def participant_ids(self) -> list[int]:
+        if self.updates is not None:
+            return [update.id for update in self.updates]
+        return self.ids or []
+
+
+class ParticipantBatchResult(BaseModel):
+    updated: int
+    participant_ids: list[int]
@@ -1,18 +1,36 @@
+from array import array
+from collections import Counter
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import islice
+
 from sqlalchemy.orm import Session
 
+from src.domain.group.service import GroupService
 from src.domain.participant.repository import ParticipantRepository
 from src.domain.participant.schemas import (
+    ParticipantBatchResult,
+    ParticipantBatchUpdate,
     ParticipantCreate,
+    ParticipantImport,
+    ParticipantImportResult,
     ParticipantList,
     ParticipantRead,
+    ParticipantStatus,
     ParticipantUpdate,
 )
 from src.domain.participant.signals import (
     participant_created,
     participant_deleted,
     participant_updated,
+    participants_imported,
+    participants_revealed,
+    participants_updated,
 )
 from src.infrastructure.persistence import transaction
+from src.shared.exceptions import BusinessRuleError, NotFoundError
+
+# Participants inserted (and announced) per statement by bulk_create().
+_IMPORT_CHUNK_SIZE = 1000
 
 
 class ParticipantService:
@@ -23,14 +41,77 @@ class ParticipantService:
                 participant=participant, db_session=db_session
             )
             validated = ParticipantRead.model_validate(result)
-            participant_created.send(ParticipantService, participant=validated)
+            participant_created.send(
+                ParticipantService, participant=validated, db_session=db_session
+            )
             return validated
 
     @staticmethod
-    def get_all(db_session: Session) -> ParticipantList:
-        participants = ParticipantRepository.get_all(db_session=db_session)
-        items = [ParticipantRead.model_validate(p) for p in participants]
-        return ParticipantList(participants=items)
+    def bulk_create(
+        group_id: int,
+        rows: Iterable[ParticipantImport],
+        db_session: Session,
+        chunk_size: int = _IMPORT_CHUNK_SIZE,
+    ) -> ParticipantImportResult:
+        """Imports participants into a group, all or nothing.
+
+        rows is consumed lazily, one chunk at a time, so an upload parsed
+        while it streams in is never held in memory whole. Each chunk is one
+        bulk insert and one participants_imported signal.
+        """
+        created = 0
+        rows = iter(rows)
+        with transaction(db_session):
+            GroupService.get_by_id(group_id=group_id, db_session=db_session)
+            while chunk := list(islice(rows, chunk_size)):
+                participant_ids = ParticipantRepository.bulk_create(
+                    group_id=group_id, rows=chunk, db_session=db_session
+                )
+                participants_imported.send(
+                    ParticipantService,
+                    group_id=group_id,
+                    participant_ids=participant_ids,
+                    db_session=db_session,
+                )
+                created += len(participant_ids)
+        return ParticipantImportResult(group_id=group_id, created=created)
+
+    @staticmethod
+    def get_all(
+        db_session: Session, limit: int | None = None, after: int | None = None
+    ) -> ParticipantList:
+        """One page of participants; next_after is set when another page follows."""
+        participants = ParticipantRepository.get_all(
+            db_session=db_session,
+            limit=None if limit is None else limit + 1,
+            after=after,
+        )
+        items = [ParticipantRead.model_validate(p) for p in participants[:limit]]
+        has_more = limit is not None and len(participants) > limit
+        return ParticipantList(
+            participants=items, next_after=items[-1].id if has_more else None
+        )
+
+    @staticmethod
+    def get_page_version(
+        db_session: Session, limit: int | None = None, after: int | None = None
+    ) -> str:
+        """Changes whenever the page get_all(limit, after) returns would change."""
+        row = ParticipantRepository.get_page_version(
+            db_session=db_session,
+            limit=None if limit is None else limit + 1,
+            after=after,
+        )
+        return ":".join(str(value) for value in row)
+
+    @staticmethod
+    def stream_all(
+        db_session: Session, after: int | None = None
+    ) -> Iterator[ParticipantRead]:
+        for participant in ParticipantRepository.stream_all(
+            db_session=db_session, after=after
+        ):
+            yield ParticipantRead.model_validate(participant)
 
     @staticmethod
     def get_by_group_id(group_id: int, db_session: Session) -> list[ParticipantRead]:
@@ -39,6 +120,42 @@ class ParticipantService:
         )
         return [ParticipantRead.model_validate(p) for p in participants]
 
+    @staticmethod
+    def copy_to_group(
+        source_group_id: int, group_id: int, db_session: Session
+    ) -> list[int]:
+        """Copies every member of one group into another, returning the new ids.
+
+        Used by GroupService.clone, whose group_cloned signal counts the copies.
+        """
+        return ParticipantRepository.copy_to_group(
+            source_group_id=source_group_id, group_id=group_id, db_session=db_session
+        )
+
+    @staticmethod
+    def get_ids_by_group_id(group_id: int, db_session: Session) -> "array[int]":
+        return ParticipantRepository.get_ids_by_group_id(
+            group_id=group_id, db_session=db_session
+        )
+
+    @staticmethod
+    def get_ids_by_group_ids(
+        group_ids: Sequence[int], db_session: Session
+    ) -> dict[int, list[int]]:
+        return ParticipantRepository.get_ids_by_group_ids(
+            group_ids=group_ids, db_session=db_session
+        )
+
+    @staticmethod
+    def get_version(participant_id: int, db_session: Session) -> str:
+        """Changes whenever the participant's ParticipantRead would change."""
+        row = ParticipantRepository.get_version(
+            participant_id=participant_id, db_session=db_session
+        )
+        if row is None:
+            raise NotFoundError("Participant not found")
+        return str(row[0])
+
     @staticmethod
     def get_by_id(participant_id: int, db_session: Session) -> ParticipantRead:
         result = ParticipantRepository.get_by_id(
@@ -49,19 +166,113 @@ class ParticipantService:
     @staticmethod
     def delete(participant_id: int, db_session: Session) -> None:
         with transaction(db_session):
-            ParticipantRepository.delete(
+            deleted = ParticipantRepository.delete(
                 participant_id=participant_id, db_session=db_session
             )
-            participant_deleted.send(ParticipantService, participant_id=participant_id)
+            participant_deleted.send(
+                ParticipantService,
+                participant_id=participant_id,
+                group_id=deleted.group_id,
+                status=deleted.status,
+                db_session=db_session,
+            )
 
     @staticmethod
     def update(
         participant_id: int, payload: ParticipantUpdate, db_session: Session
     ) -> ParticipantRead:
+        """status_changed tells handlers whether this update flipped the status."""
         with transaction(db_session):
-            result = ParticipantRepository.update(
-                participant_id=participant_id, payload=payload, db_session=db_session
-            )
+            result = None
+            if payload.status is not None:
+                result = ParticipantRepository.update_changing_status(
+                    participant_id=participant_id,
+                    payload=payload,
+                    db_session=db_session,
+                )
+            status_changed = result is not None
+            if result is None:
+                result = ParticipantRepository.update(
+                    participant_id=participant_id,
+                    payload=payload,
+                    db_session=db_session,
+                )
             validated = ParticipantRead.model_validate(result)
-            participant_updated.send(ParticipantService, participant=validated)
+            participant_updated.send(
+                ParticipantService,
+                participant=validated,
+                status_changed=status_changed,
+                db_session=db_session,
+            )
             return validated
+
+    @staticmethod
+    def update_batch(
+        payload: ParticipantBatchUpdate, db_session: Session
+    ) -> ParticipantBatchResult:
+        """Applies a batch update set-based, all or nothing.
+
+        Homogeneous changes are one UPDATE over every id, heterogeneous ones
+        one executemany UPDATE per set of changed columns. The affected rows
+        are read (and locked) first, for their groups and previous statuses;
+        one participants_updated signal then covers the whole batch.
+        """
+        participant_ids = payload.participant_ids
+        with transaction(db_session):
+            rows = ParticipantRepository.lock_statuses(
+                participant_ids=participant_ids, db_session=db_session
+            )
+            if len(rows) < len(participant_ids):
+                found = {row.id for row in rows}
+                missing = [pid for pid in participant_ids if pid not in found]
+                raise NotFoundError(
+                    f"Participants not found: {', '.join(map(str, missing))}"
+                )
+            if payload.updates is not None:
+                new_statuses = {u.id: u.status for u in payload.updates}
+                ParticipantRepository.update_each(
+                    changes=payload.updates, db_session=db_session
+                )
+            elif payload.changes is not None:
+                new_statuses = dict.fromkeys(participant_ids, payload.changes.status)
+                ParticipantRepository.update_many(
+                    participant_ids=participant_ids,
+                    payload=payload.changes,
+                    db_session=db_session,
+                )
+            else:
+                raise BusinessRuleError("Provide either ids and changes, or updates")
+            revealed_by_group: Counter[int] = Counter()
+            for row in rows:
+                new_status = new_statuses[row.id] or row.status
+                revealed_by_group[row.group_id] += int(
+                    new_status == ParticipantStatus.REVEALED
+                ) - int(row.status == ParticipantStatus.REVEALED)
+            participants_updated.send(
+                ParticipantService,
+                participant_ids=participant_ids,
+                revealed_by_group={
+                    group_id: delta
+                    for group_id, delta in revealed_by_group.items()
+                    if delta
+                },
+                db_session=db_session,
+            )
+        return ParticipantBatchResult(
+            updated=len(participant_ids), participant_ids=participant_ids
+        )
+
+    @staticmethod
+    def reveal_by_group_id(group_id: int, db_session: Session) -> int:
+        with transaction(db_session):
+            revealed = ParticipantRepository.reveal_by_group_id(
+                group_id=group_id, db_session=db_session
+            )
+            if revealed:
+                participants_revealed.send(
+                    ParticipantService,
+                    group_id=group_id,
+                    count=revealed,
+                    db_session=db_session,
+                )
+            return revealed
@@ -5,3 +5,10 @@ from blinker import NamedSignal, signal
 participant_created: NamedSignal = signal("participant.created")
 participant_updated: NamedSignal = signal("participant.updated")
 participant_deleted: NamedSignal = signal("participant.deleted")
+# Sent once per imported chunk rather than once per participant.
+participants_imported: NamedSignal = signal("participant.imported")
+# Sent when a whole group is revealed at once, with how many changed status.
+participants_revealed: NamedSignal = signal("participant.revealed")
+# Sent once per batch update, with every affected id and, per group, how
+# many more (or fewer) participants are REVEALED afterwards.
+participants_updated: NamedSignal = signal("participant.batch_updated")
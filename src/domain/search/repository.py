@@ -0,0 +1,81 @@
+"""Name search over groups and participants.
+
+Postgres: matches are found through the pg_trgm GIN indexes on both name
+columns (declared on the models) — a case-insensitive substring match,
+or a fuzzy word match (`q <% name`) for typos — and ranked by
+word_similarity, then similarity.
+
+Elsewhere (SQLite in tests) there is no trigram support: names containing
+the query match, ranked by how much of the name the query covers.
+"""
+
+from typing import Any
+
+from sqlalchemy import ColumnElement, Float, Row, cast, func, literal, or_, select
+from sqlalchemy.orm import InstrumentedAttribute, Session
+
+from src.domain.group.model import Group
+from src.domain.participant.model import Participant
+from src.domain.search.schemas import SearchKind
+
+
+def _escape_like(q: str) -> str:
+    return q.replace("/", "//").replace("%", "/%").replace("_", "/_")
+
+
+def _match(
+    column: InstrumentedAttribute[str], q: str, db_session: Session
+) -> tuple[ColumnElement[bool], ColumnElement[Any], ColumnElement[Any]]:
+    """(match condition, score, tie-breaker) for the session's dialect."""
+    contains = column.ilike(f"%{_escape_like(q)}%", escape="/")
+    if db_session.get_bind().dialect.name == "postgresql":
+        return (
+            or_(contains, literal(q).op("<%")(column)),
+            func.word_similarity(q, column),
+            func.similarity(q, column),
+        )
+    coverage = cast(func.length(q), Float) / func.length(column)
+    return contains, coverage, coverage
+
+
+class SearchRepository:
+    @staticmethod
+    def search_groups(
+        q: str, limit: int, db_session: Session
+    ) -> list[Row[tuple[str, int, str, int, float]]]:
+        """Best-matching groups, best first; rows labelled like SearchHit."""
+        condition, score, tie_breaker = _match(Group.name, q, db_session)
+        stmt = (
+            select(
+                literal(SearchKind.group.value).label("kind"),
+                Group.id,
+                Group.name,
+                Group.id.label("group_id"),
+                score.label("score"),
+            )
+            .where(condition, Group.deleted_at.is_(None))
+            .order_by(score.desc(), tie_breaker.desc(), Group.id)
+            .limit(limit)
+        )
+        return list(db_session.execute(stmt).all())
+
+    @staticmethod
+    def search_participants(
+        q: str, limit: int, db_session: Session
+    ) -> list[Row[tuple[str, int, str, int, float]]]:
+        """Best-matching participants, best first; rows labelled like SearchHit."""
+        condition, score, tie_breaker = _match(Participant.name, q, db_session)
+        stmt = (
+            select(
+                literal(SearchKind.participant.value).label("kind"),
+                Participant.id,
+                Participant.name,
+                Participant.group_id,
+                score.label("score"),
+            )
+            .join(Group, Group.id == Participant.group_id)
+            .where(condition, Group.deleted_at.is_(None))
+            .order_by(score.desc(), tie_breaker.desc(), Participant.id)
+            .limit(limit)
+        )
+        return list(db_session.execute(stmt).all())
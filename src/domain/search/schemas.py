@@ -0,0 +1,26 @@
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+
+class SearchKind(str, Enum):
+    group = "group"
+    participant = "participant"
+
+
+class SearchHit(BaseModel):
+    """A group or participant whose name matches the query."""
+
+    model_config = {"from_attributes": True}
+
+    kind: SearchKind
+    id: int
+    name: str
+    # The group itself for kind=group, the participant's group otherwise.
+    group_id: int
+    # Higher is a closer match; comparable across kinds within one search.
+    score: float
+
+
+class SearchResults(BaseModel):
+    hits: list[SearchHit] = Field(default_factory=list)
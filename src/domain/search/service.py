@@ -0,0 +1,39 @@
+import heapq
+
+from sqlalchemy.orm import Session
+
+from src.domain.search.repository import SearchRepository
+from src.domain.search.schemas import SearchHit, SearchKind, SearchResults
+from src.shared.exceptions import BusinessRuleError
+
+# Trigrams: shorter queries cannot use the name indexes.
+MIN_QUERY_LENGTH = 3
+
+
+class SearchService:
+    @staticmethod
+    def search(
+        q: str,
+        db_session: Session,
+        limit: int = 20,
+        kind: SearchKind | None = None,
+    ) -> SearchResults:
+        """Groups and participants whose names match q, best first, at most limit.
+
+        Each kind is ranked and limited by the database; the two short lists
+        are then merged by score.
+        """
+        q = q.strip()
+        if len(q) < MIN_QUERY_LENGTH:
+            raise BusinessRuleError(
+                f"Search needs at least {MIN_QUERY_LENGTH} characters."
+            )
+        ranked = []
+        if kind in (None, SearchKind.group):
+            ranked.append(SearchRepository.search_groups(q, limit, db_session))
+        if kind in (None, SearchKind.participant):
+            ranked.append(SearchRepository.search_participants(q, limit, db_session))
+        merged = heapq.merge(*ranked, key=lambda row: -row.score)
+        return SearchResults(
+            hits=[SearchHit.model_validate(row) for _, row in zip(range(limit), merged)]
+        )
@@ -0,0 +1,98 @@
+"""Async variants of SecretFriendService for the async API routes.
+
+Each method runs the sync service on the async session's connection (see
+src.infrastructure.persistence.async_session), except for draw_group's
+matching, which is CPU-bound and runs in a worker thread.
+"""
+
+from datetime import datetime, timezone
+
+import anyio.to_thread
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.secret_friend import matching
+from src.domain.secret_friend.schemas import (
+    SecretFriendList,
+    SecretFriendPairPage,
+    SecretFriendRead,
+)
+from src.domain.secret_friend.service import SecretFriendService
+from src.infrastructure.persistence import async_transaction, run_sync
+
+
+class AsyncSecretFriendService:
+    @staticmethod
+    async def assign(
+        group_id: int, participant_id: int, db_session: AsyncSession
+    ) -> SecretFriendRead:
+        return await run_sync(
+            db_session,
+            SecretFriendService.assign,
+            group_id=group_id,
+            participant_id=participant_id,
+        )
+
+    @staticmethod
+    async def draw_group(
+        group_id: int,
+        db_session: AsyncSession,
+        exclusions: list[tuple[int, int]] | None = None,
+        no_repeat_years: int = 0,
+    ) -> SecretFriendList:
+        """SecretFriendService.draw_group, matching off the event loop."""
+        draw_year = datetime.now(timezone.utc).year
+        async with async_transaction(db_session):
+            participant_ids, forbidden = await run_sync(
+                db_session,
+                SecretFriendService.prepare_draw,
+                group_id=group_id,
+                draw_year=draw_year,
+                exclusions=exclusions,
+                no_repeat_years=no_repeat_years,
+            )
+            assignment = await anyio.to_thread.run_sync(
+                matching.match, participant_ids, forbidden
+            )
+            return await run_sync(
+                db_session,
+                SecretFriendService.save_draw,
+                group_id=group_id,
+                assignment=assignment,
+                draw_year=draw_year,
+            )
+
+    @staticmethod
+    async def get_by_id(
+        secret_friend_id: int, db_session: AsyncSession
+    ) -> SecretFriendRead:
+        return await run_sync(
+            db_session, SecretFriendService.get_by_id, secret_friend_id=secret_friend_id
+        )
+
+    @staticmethod
+    async def get_pairs_by_group_id(
+        group_id: int, db_session: AsyncSession, limit: int, after: int | None = None
+    ) -> SecretFriendPairPage:
+        return await run_sync(
+            db_session,
+            SecretFriendService.get_pairs_by_group_id,
+            group_id=group_id,
+            limit=limit,
+            after=after,
+        )
+
+    @staticmethod
+    async def get_by_giver_id(
+        participant_id: int, db_session: AsyncSession
+    ) -> SecretFriendRead:
+        return await run_sync(
+            db_session,
+            SecretFriendService.get_by_giver_id,
+            participant_id=participant_id,
+        )
+
+    @staticmethod
+    async def delete(secret_friend_id: int, db_session: AsyncSession) -> None:
+        await run_sync(
+            db_session, SecretFriendService.delete, secret_friend_id=secret_friend_id
+        )
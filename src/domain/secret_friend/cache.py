@@ -0,0 +1,15 @@
+"""Read-through cache of each giver's current assignment ("who did I draw").
+
+Keyed by gift_giver_id. None is cached for participants who have not drawn
+yet, so repeat checks skip the database too. Entries are evicted by the
+secret friend side-effect handlers whenever a link changes.
+"""
+
+from src.domain.secret_friend.schemas import SecretFriendRead
+from src.shared.cache import TTLCache
+from src.shared.config import settings
+
+by_giver: TTLCache[int, SecretFriendRead | None] = TTLCache(
+    maxsize=settings.SECRET_FRIEND_CACHE_SIZE,
+    ttl=settings.SECRET_FRIEND_CACHE_TTL,
+)
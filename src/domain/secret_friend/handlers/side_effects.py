@@ -1,11 +1,19 @@
 """Secret friend side-effect handlers — @isolated, errors are swallowed."""
 
 import logging
+from collections.abc import Callable
 
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.domain.group.signals import group_deleted
+from src.domain.participant.signals import participant_deleted
+from src.domain.secret_friend import cache
 from src.domain.secret_friend.schemas import SecretFriendRead
 from src.domain.secret_friend.signals import (
     secret_friend_assigned,
     secret_friend_deleted,
+    secret_friend_drawn,
 )
 from src.shared.signals import isolated
 
@@ -23,6 +31,21 @@ def _on_secret_friend_assigned(
     )
 
 
+@isolated
+def _on_secret_friend_drawn(
+    sender: type,
+    *,
+    assignments: list[SecretFriendRead],
+    group_id: int,
+    **kwargs: object,
+) -> None:
+    log.info(
+        "lifecycle: secret friends drawn — group_id=%s count=%s",
+        group_id,
+        len(assignments),
+    )
+
+
 @isolated
 def _on_secret_friend_deleted(
     sender: type, *, secret_friend_id: int, **kwargs: object
@@ -30,7 +53,57 @@ def _on_secret_friend_deleted(
     log.info("lifecycle: secret friend deleted — id=%s", secret_friend_id)
 
 
+# ── Giver cache eviction ─────────────────────────────────────────────────────
+# Entries are evicted rather than overwritten: the signals fire before the
+# commit, and a rolled-back write must not leave its value in the cache.
+# Until the commit, a concurrent read still sees the old row and may cache
+# it again, so the entries are evicted once more after the commit.
+
+
+def _now_and_after_commit(db_session: object, evict: Callable[[], None]) -> None:
+    evict()
+    if isinstance(db_session, Session):
+        event.listen(db_session, "after_commit", lambda session: evict(), once=True)
+
+
+def _evict_givers(db_session: object, *gift_giver_ids: int) -> None:
+    _now_and_after_commit(
+        db_session, lambda: cache.by_giver.invalidate(*gift_giver_ids)
+    )
+
+
+@isolated
+def _evict_assigned_giver(
+    sender: type, *, assignment: SecretFriendRead, **kwargs: object
+) -> None:
+    _evict_givers(kwargs.get("db_session"), assignment.gift_giver_id)
+
+
+@isolated
+def _evict_drawn_givers(
+    sender: type, *, assignments: list[SecretFriendRead], **kwargs: object
+) -> None:
+    _evict_givers(kwargs.get("db_session"), *(a.gift_giver_id for a in assignments))
+
+
+@isolated
+def _evict_deleted_giver(sender: type, *, gift_giver_id: int, **kwargs: object) -> None:
+    _evict_givers(kwargs.get("db_session"), gift_giver_id)
+
+
+@isolated
+def _evict_all_on_member_removal(sender: type, **kwargs: object) -> None:
+    """Deleting participants cascades to whoever drew them — unknown here."""
+    _now_and_after_commit(kwargs.get("db_session"), cache.by_giver.clear)
+
+
 def register_side_effects() -> None:
     """Connect secret friend side-effect handlers to their signals."""
     secret_friend_assigned.connect(_on_secret_friend_assigned)
+    secret_friend_drawn.connect(_on_secret_friend_drawn)
     secret_friend_deleted.connect(_on_secret_friend_deleted)
+    secret_friend_assigned.connect(_evict_assigned_giver)
+    secret_friend_drawn.connect(_evict_drawn_givers)
+    secret_friend_deleted.connect(_evict_deleted_giver)
+    participant_deleted.connect(_evict_all_on_member_removal)
+    group_deleted.connect(_evict_all_on_member_removal)
@@ -4,6 +4,7 @@ from src.domain.secret_friend.schemas import SecretFriendRead
 from src.domain.secret_friend.signals import (
     secret_friend_assigned,
     secret_friend_deleted,
+    secret_friend_drawn,
 )
 from src.shared.signals import isolated
 from src.shared.task_backend import dispatch_task
@@ -20,6 +21,21 @@ def _relay_secret_friend_assigned(
     )
 
 
+@isolated
+def _relay_secret_friend_drawn(
+    sender: type,
+    *,
+    assignments: list[SecretFriendRead],
+    group_id: int,
+    **kwargs: object,
+) -> None:
+    dispatch_task(
+        "notifications.secret_friend_drawn",
+        group_id=group_id,
+        assignment_count=len(assignments),
+    )
+
+
 @isolated
 def _relay_secret_friend_deleted(
     sender: type, *, secret_friend_id: int, **kwargs: object
@@ -32,4 +48,5 @@ def _relay_secret_friend_deleted(
 def register_task_relays() -> None:
     """Connect secret friend task relay handlers to their signals."""
     secret_friend_assigned.connect(_relay_secret_friend_assigned)
+    secret_friend_drawn.connect(_relay_secret_friend_drawn)
     secret_friend_deleted.connect(_relay_secret_friend_deleted)
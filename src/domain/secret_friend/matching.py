@@ -0,0 +1,372 @@
+"""Matching engine — turns a group plus exclusion rules into a full assignment.
+
+An assignment maps every giver to exactly one receiver so that everyone also
+receives exactly once, nobody draws themselves and no forbidden pair is used.
+
+Exclusions are passed as ``forbidden``: a mapping of giver id to any
+container of receiver ids that giver must not draw (a set, a range, an
+array…). Only membership tests are performed on it.
+
+Two strategies are combined by the default engine:
+
+- CycleMatcher — fast path for sparse exclusions. Shuffles everyone into a
+  single cycle and repairs forbidden edges with local swaps, retrying from a
+  fresh shuffle a bounded number of times. O(n) expected time.
+- BipartiteMatcher — guaranteed fallback. Randomized Hopcroft–Karp perfect
+  matching on the giver/receiver graph, O(E·√V). Always finds an assignment
+  when one exists, but may split the group into several smaller cycles.
+
+Swap the engine at startup, the same way task backends are swapped:
+    from src.domain.secret_friend.matching import set_matching_engine
+    set_matching_engine(MyEngine())
+
+Many groups at once (offline draws) go through parallel_matcher(), which
+fans match_group() out to a process pool. Pool workers are forked, so an
+engine swapped before the pool starts is the one they use.
+"""
+
+import logging
+import random
+from array import array
+from collections import deque
+from collections.abc import (
+    Callable,
+    Container,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from multiprocessing import current_process
+from typing import Protocol
+
+from src.shared.exceptions import BusinessRuleError
+
+log = logging.getLogger(__name__)
+
+Forbidden = Mapping[int, Container[int]]
+
+# (group_id, participant_ids, forbidden (giver, receiver) pairs, seed)
+MatchJob = tuple[int, Sequence[int], Sequence[tuple[int, int]], int | None]
+# (group_id, assignment — None when the group cannot be drawn)
+MatchResult = tuple[int, dict[int, int] | None]
+
+# Jobs handed to a pool worker per round trip; groups are small, so batching
+# them amortises the pickling overhead.
+_POOL_CHUNKSIZE = 16
+
+_NO_FORBIDDEN: Forbidden = {}
+
+
+class MatchingEngine(Protocol):
+    """Interface for matching strategies."""
+
+    def match(
+        self,
+        participant_ids: Sequence[int],
+        forbidden: Forbidden = _NO_FORBIDDEN,
+        rng: random.Random | None = None,
+    ) -> dict[int, int]:
+        """Return a giver → receiver mapping covering every participant."""
+        ...
+
+
+def forbidden_from_pairs(pairs: Iterable[tuple[int, int]]) -> dict[int, set[int]]:
+    """Build the ``forbidden`` mapping from (giver_id, receiver_id) pairs."""
+    forbidden: dict[int, set[int]] = {}
+    for giver_id, receiver_id in pairs:
+        forbidden.setdefault(giver_id, set()).add(receiver_id)
+    return forbidden
+
+
+def pack_forbidden(pairs: Iterable[tuple[int, int]]) -> dict[int, "array[int]"]:
+    """Like forbidden_from_pairs, but one compact int64 array per giver.
+
+    Meant for history-derived rules, where a giver has at most one entry per
+    past year: 8 bytes per entry instead of a hash set per giver, and a
+    membership test is a scan over a handful of ints. Unbounded rules, such
+    as user-supplied exclusions, belong in forbidden_from_pairs' sets.
+    """
+    forbidden: dict[int, "array[int]"] = {}
+    for giver_id, receiver_id in pairs:
+        row = forbidden.get(giver_id)
+        if row is None:
+            row = forbidden[giver_id] = array("q")
+        row.append(receiver_id)
+    return forbidden
+
+
+def _require_enough_participants(participant_ids: Sequence[int]) -> None:
+    if len(participant_ids) < 2:
+        raise BusinessRuleError(
+            "At least 2 participants are required to assign secret friends."
+        )
+
+
+class CycleMatcher:
+    """Randomized single-cycle construction with local repair.
+
+    Returns None (instead of raising) when it gives up, so callers can fall
+    back to an exhaustive strategy.
+    """
+
+    def __init__(self, attempts: int = 20, repair_tries: int = 32) -> None:
+        self._attempts = attempts
+        self._repair_tries = repair_tries
+
+    def try_match(
+        self,
+        participant_ids: Sequence[int],
+        forbidden: Forbidden = _NO_FORBIDDEN,
+        rng: random.Random | None = None,
+    ) -> dict[int, int] | None:
+        _require_enough_participants(participant_ids)
+        rng = rng or random.Random()
+        order = list(participant_ids)
+        n = len(order)
+
+        def allowed(giver_id: int, receiver_id: int) -> bool:
+            if giver_id == receiver_id:
+                return False
+            excluded = forbidden.get(giver_id)
+            return excluded is None or receiver_id not in excluded
+
+        for _ in range(self._attempts):
+            rng.shuffle(order)
+            for i in range(n):
+                p = (i + 1) % n
+                if allowed(order[i], order[p]):
+                    continue
+                self._repair(order, p, allowed, rng)
+            if all(allowed(order[i], order[(i + 1) % n]) for i in range(n)):
+                return {order[i]: order[(i + 1) % n] for i in range(n)}
+        return None
+
+    def _repair(
+        self,
+        order: list[int],
+        p: int,
+        allowed: Callable[[int, int], bool],
+        rng: random.Random,
+    ) -> None:
+        """Swap order[p] with a random far-away slot if all touched edges stay valid."""
+        n = len(order)
+        if n < 5:
+            return
+        for _ in range(self._repair_tries):
+            j = rng.randrange(n)
+            if min((j - p) % n, (p - j) % n) < 2:
+                continue
+            a, b = order[p], order[j]
+            if (
+                allowed(order[p - 1], b)
+                and allowed(b, order[(p + 1) % n])
+                and allowed(order[j - 1], a)
+                and allowed(a, order[(j + 1) % n])
+            ):
+                order[p], order[j] = b, a
+                return
+
+    def match(
+        self,
+        participant_ids: Sequence[int],
+        forbidden: Forbidden = _NO_FORBIDDEN,
+        rng: random.Random | None = None,
+    ) -> dict[int, int]:
+        result = self.try_match(participant_ids, forbidden, rng)
+        if result is None:
+            raise BusinessRuleError(
+                "Unable to draw secret friends that satisfy the exclusion rules."
+            )
+        return result
+
+
+class BipartiteMatcher:
+    """Randomized Hopcroft–Karp perfect matching between givers and receivers."""
+
+    def match(
+        self,
+        participant_ids: Sequence[int],
+        forbidden: Forbidden = _NO_FORBIDDEN,
+        rng: random.Random | None = None,
+    ) -> dict[int, int]:
+        _require_enough_participants(participant_ids)
+        rng = rng or random.Random()
+        ids = list(participant_ids)
+        rng.shuffle(ids)
+        n = len(ids)
+
+        excluded = [forbidden.get(giver_id, ()) for giver_id in ids]
+        # ids are already shuffled; a random rotation per giver is enough to
+        # vary who gets tried first. Candidates are generated as they are
+        # tried, so a dense group never holds its n² edges in memory.
+        start = [rng.randrange(n) for _ in range(n)]
+
+        def candidates(g: int) -> Iterator[int]:
+            ruled_out = excluded[g]
+            for i in range(start[g], start[g] + n):
+                r = i - n if i >= n else i
+                if r != g and ids[r] not in ruled_out:
+                    yield r
+
+        receiver_of = _hopcroft_karp(candidates, n)
+        if any(r < 0 for r in receiver_of):
+            raise BusinessRuleError(
+                "Unable to draw secret friends that satisfy the exclusion rules."
+            )
+        return {ids[g]: ids[r] for g, r in enumerate(receiver_of)}
+
+
+def _hopcroft_karp(candidates: Callable[[int], Iterator[int]], n: int) -> list[int]:
+    """Maximum matching on an n×n bipartite graph; -1 marks an unmatched giver.
+
+    candidates(g) yields the receivers giver g may be matched with, afresh
+    on every call.
+    """
+    receiver_of = [-1] * n
+    giver_of = [-1] * n
+    unreached = n + 1
+
+    # Greedy start: most givers get their first free candidate, leaving only
+    # a handful of augmenting phases for Hopcroft–Karp proper.
+    for g in range(n):
+        for r in candidates(g):
+            if giver_of[r] < 0:
+                receiver_of[g] = r
+                giver_of[r] = g
+                break
+
+    while True:
+        # BFS: layer free givers and find the shortest augmenting path length.
+        depth = [unreached] * n
+        queue: deque[int] = deque()
+        for g in range(n):
+            if receiver_of[g] < 0:
+                depth[g] = 0
+                queue.append(g)
+        shortest = unreached
+        while queue:
+            g = queue.popleft()
+            if depth[g] >= shortest:
+                continue
+            for r in candidates(g):
+                owner = giver_of[r]
+                if owner < 0:
+                    shortest = min(shortest, depth[g] + 1)
+                elif depth[owner] == unreached:
+                    depth[owner] = depth[g] + 1
+                    queue.append(owner)
+        if shortest == unreached:
+            return receiver_of
+
+        # DFS (iterative): augment along vertex-disjoint shortest paths.
+        # One live generator per giver: each edge is tried once per phase.
+        cursor = [candidates(g) for g in range(n)]
+        for root in range(n):
+            if receiver_of[root] >= 0:
+                continue
+            stack = [root]
+            while stack:
+                g = stack[-1]
+                advanced = False
+                for r in cursor[g]:
+                    owner = giver_of[r]
+                    if owner < 0 and depth[g] + 1 == shortest:
+                        # Free receiver at the right depth: flip the path.
+                        for giver in reversed(stack):
+                            previous = receiver_of[giver]
+                            receiver_of[giver] = r
+                            giver_of[r] = giver
+                            r = previous
+                        stack = []
+                        advanced = True
+                        break
+                    if owner >= 0 and depth[owner] == depth[g] + 1:
+                        stack.append(owner)
+                        advanced = True
+                        break
+                if not advanced:
+                    depth[g] = unreached
+                    stack.pop()
+
+
+class DefaultMatcher:
+    """Fast cycle construction first, bipartite matching when it gives up."""
+
+    def __init__(
+        self,
+        fast: CycleMatcher | None = None,
+        fallback: BipartiteMatcher | None = None,
+    ) -> None:
+        self._fast = fast or CycleMatcher()
+        self._fallback = fallback or BipartiteMatcher()
+
+    def match(
+        self,
+        participant_ids: Sequence[int],
+        forbidden: Forbidden = _NO_FORBIDDEN,
+        rng: random.Random | None = None,
+    ) -> dict[int, int]:
+        rng = rng or random.Random()
+        result = self._fast.try_match(participant_ids, forbidden, rng)
+        if result is not None:
+            return result
+        return self._fallback.match(participant_ids, forbidden, rng)
+
+
+# ── Global engine registry ──────────────────────────────────────────────────
+
+_engine: MatchingEngine = DefaultMatcher()
+
+
+def set_matching_engine(engine: MatchingEngine) -> None:
+    """Swap the matching engine. Call at app startup."""
+    global _engine
+    _engine = engine
+
+
+def match(
+    participant_ids: Sequence[int],
+    forbidden: Forbidden = _NO_FORBIDDEN,
+    rng: random.Random | None = None,
+) -> dict[int, int]:
+    """Compute a full assignment via the configured engine."""
+    return _engine.match(participant_ids, forbidden, rng)
+
+
+# ── Many groups at once ─────────────────────────────────────────────────────
+
+
+def match_group(job: MatchJob) -> MatchResult:
+    """Match one group of a batch; picklable, so it can run in a pool worker.
+
+    With a seed, the rng is derived from (seed, group_id): a group's result
+    is the same whichever worker runs it and in whatever order.
+    """
+    group_id, participant_ids, exclusions, seed = job
+    rng = random.Random(f"{seed}:{group_id}") if seed is not None else None
+    try:
+        return group_id, match(participant_ids, pack_forbidden(exclusions), rng)
+    except BusinessRuleError:
+        return group_id, None
+
+
+@contextmanager
+def parallel_matcher(
+    workers: int | None = None,
+) -> Iterator[Callable[[Iterable[MatchJob]], Iterator[MatchResult]]]:
+    """Yield a function matching many groups in a process pool, in job order.
+
+    workers=None sizes the pool to the CPU count; workers=1 matches in
+    process. Daemonic processes (e.g. Celery prefork children) may not have
+    children of their own, so they also fall back to matching in process.
+    """
+    if workers == 1 or current_process().daemon:
+        if workers != 1:
+            log.warning("daemonic process — matching groups without a pool")
+        yield lambda jobs: map(match_group, jobs)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield lambda jobs: pool.map(match_group, jobs, chunksize=_POOL_CHUNKSIZE)
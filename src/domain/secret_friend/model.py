@@ -1,6 +1,6 @@
 from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.infrastructure.persistence import Base
@@ -21,8 +21,13 @@ class SecretFriend(Base):
         default=lambda: datetime.now(timezone.utc),
     )
 
+    # Unique: a participant gives to exactly one person. Also the conflict
+    # target of the upsert in SecretFriendRepository.link / bulk_link.
     gift_giver_id: Mapped[int] = mapped_column(
-        ForeignKey("participants.id"), nullable=False, index=True
+        ForeignKey("participants.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+        unique=True,
     )
     giver: Mapped["Participant | None"] = relationship(
         foreign_keys=[gift_giver_id],
@@ -30,9 +35,34 @@ class SecretFriend(Base):
     )
 
     gift_receiver_id: Mapped[int] = mapped_column(
-        ForeignKey("participants.id"), nullable=False, index=True
+        ForeignKey("participants.id", ondelete="CASCADE"), nullable=False, index=True
     )
     receiver: Mapped["Participant | None"] = relationship(
         foreign_keys=[gift_receiver_id],
         back_populates="gift_receiver",
     )
+
+
+class SecretFriendHistory(Base):
+    """One past pairing of a group lineage, kept to avoid repeats in later years.
+
+    Participants are matched across editions by name — the only identity that
+    survives a group being cloned for the next year. No foreign keys: history
+    outlives the groups and participants it describes.
+    """
+
+    __tablename__ = "secret_friend_history"
+    __table_args__ = (
+        Index("ix_secret_friend_history_lineage_year", "lineage_id", "draw_year"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    lineage_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    draw_year: Mapped[int] = mapped_column(Integer, nullable=False)
+    giver_name: Mapped[str] = mapped_column(String, nullable=False)
+    receiver_name: Mapped[str] = mapped_column(String, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
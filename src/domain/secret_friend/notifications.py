@@ -13,6 +13,15 @@ def on_secret_friend_assigned(*, assignment_id: int, group_id: int) -> None:
     )
 
 
+def on_secret_friend_drawn(*, group_id: int, assignment_count: int) -> None:
+    """Handle secret-friend-drawn notification."""
+    log.info(
+        "notification: secret friends drawn — group_id=%s count=%s",
+        group_id,
+        assignment_count,
+    )
+
+
 def on_secret_friend_deleted(*, secret_friend_id: int) -> None:
     """Handle secret-friend-deleted notification."""
     log.info("notification: secret friend deleted — id=%s", secret_friend_id)
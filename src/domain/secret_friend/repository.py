@@ -1,52 +1,352 @@
-from sqlalchemy import select
+from collections.abc import Iterable, Sequence
+
+from sqlalchemy import (
+    Row,
+    ScalarSelect,
+    and_,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, aliased
 
-from src.domain.secret_friend.model import SecretFriend
+from src.domain.group.model import Group
+from src.domain.participant.model import Participant
+from src.domain.participant.schemas import ParticipantStatus
+from src.domain.secret_friend.model import SecretFriend, SecretFriendHistory
 from src.domain.secret_friend.schemas import SecretFriendLink
 from src.shared.exceptions import ConflictError, NotFoundError
 
+# First key of the two-part Postgres advisory lock taken while assigning.
+# Namespaces the lock so group ids never collide with other advisory locks.
+_ASSIGN_LOCK_NAMESPACE = 1
+
+# Links of a group marked for deletion read as gone, like the group itself.
+_giver_in_live_group = (
+    select(Participant.id)
+    .join(Group, Group.id == Participant.group_id)
+    .where(Participant.id == SecretFriend.gift_giver_id, Group.deleted_at.is_(None))
+    .exists()
+)
+
+
+def _upsert_by_giver(
+    db_session: Session,
+) -> postgresql.Insert | sqlite.Insert:
+    """INSERT … ON CONFLICT (gift_giver_id) DO UPDATE for the session's dialect.
+
+    Postgres and SQLite (tests) share the same ON CONFLICT syntax.
+    """
+    dialect = db_session.get_bind().dialect.name
+    insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+    stmt = insert(SecretFriend)
+    return stmt.on_conflict_do_update(
+        index_elements=[SecretFriend.gift_giver_id],
+        set_={"gift_receiver_id": stmt.excluded.gift_receiver_id},
+    )
+
+
+def _lineage_of(group_id: int) -> ScalarSelect[int]:
+    """Scalar subquery resolving a group's lineage (lineage_id, else its own id)."""
+    return (
+        select(func.coalesce(Group.lineage_id, Group.id))
+        .where(Group.id == group_id)
+        .scalar_subquery()
+    )
+
 
 class SecretFriendRepository:
+    @staticmethod
+    def lock_group(group_id: int, db_session: Session) -> bool:
+        """Serializes assignments within a group until the transaction ends.
+
+        Postgres takes a transaction-scoped advisory lock keyed by group id.
+        SQLite has neither advisory nor row locks, so a no-op write on the
+        group row takes the database write lock instead. Either way, one
+        statement; False, with nothing locked, when the group is missing or
+        marked for deletion.
+        """
+        live = (Group.id == group_id, Group.deleted_at.is_(None))
+        if db_session.get_bind().dialect.name == "postgresql":
+            locked = db_session.execute(
+                select(
+                    func.pg_advisory_xact_lock(_ASSIGN_LOCK_NAMESPACE, group_id)
+                ).where(*live)
+            )
+        else:
+            locked = db_session.execute(
+                update(Group)
+                .where(*live)
+                .values(id=Group.id, updated_at=Group.updated_at)
+                .returning(Group.id)
+                .execution_options(synchronize_session=False)
+            )
+        return locked.first() is not None
+
     @staticmethod
     def link(secret_friend: SecretFriendLink, db_session: Session) -> SecretFriend:
-        """Creates or updates a secret friend link (upsert by gift_giver_id)."""
-        stmt = select(SecretFriend).where(
-            SecretFriend.gift_giver_id == secret_friend.gift_giver_id
+        """Creates or updates a secret friend link (upsert by gift_giver_id).
+
+        A single INSERT … ON CONFLICT (gift_giver_id) DO UPDATE … RETURNING.
+        """
+        stmt = (
+            _upsert_by_giver(db_session)
+            .values(**secret_friend.model_dump())
+            .returning(SecretFriend)
+            .execution_options(populate_existing=True)
         )
-        existing = db_session.execute(stmt).scalars().one_or_none()
+        try:
+            return db_session.scalars(stmt).one()
+        except IntegrityError:
+            raise ConflictError(
+                "Secret friend link failed. Unique constraint violated."
+            )
 
-        if existing:
-            existing.gift_receiver_id = secret_friend.gift_receiver_id
-            try:
-                db_session.flush()
-                db_session.refresh(existing)
-            except IntegrityError:
-                raise ConflictError("Secret friend link update failed.")
-            return existing
+    @staticmethod
+    def bulk_link(
+        links: list[SecretFriendLink], db_session: Session
+    ) -> Sequence[Row[tuple[int, int, int]]]:
+        """Upserts many links in one executemany, returning (id, giver, receiver).
 
-        new_sf = SecretFriend(**secret_friend.model_dump())
+        Rows are returned as plain tuples — no ORM objects are built.
+        """
+        if not links:
+            return []
+        stmt = _upsert_by_giver(db_session).returning(
+            SecretFriend.id, SecretFriend.gift_giver_id, SecretFriend.gift_receiver_id
+        )
         try:
-            db_session.add(new_sf)
-            db_session.flush()
-            db_session.refresh(new_sf)
+            rows = db_session.execute(stmt, [link.model_dump() for link in links])
         except IntegrityError:
             raise ConflictError(
-                "Secret friend link failed. Unique constraint violated."
+                "Secret friend bulk link failed. Unique constraint violated."
+            )
+        return rows.all()
+
+    @staticmethod
+    def pick_available_receiver(
+        group_id: int, gift_giver_id: int, db_session: Session
+    ) -> int | None:
+        """Picks a random group member nobody else is giving to yet.
+
+        One query: anti-joins secret_friends on gift_receiver_id so taken
+        receivers are filtered by the database, not in Python. The giver's own
+        current link is ignored so a re-assignment may pick anyone free.
+        """
+        stmt = (
+            select(Participant.id)
+            .outerjoin(
+                SecretFriend,
+                and_(
+                    SecretFriend.gift_receiver_id == Participant.id,
+                    SecretFriend.gift_giver_id != gift_giver_id,
+                ),
+            )
+            .where(
+                Participant.group_id == group_id,
+                Participant.id != gift_giver_id,
+                SecretFriend.id.is_(None),
+            )
+            .order_by(func.random())
+            .limit(1)
+        )
+        return db_session.execute(stmt).scalar_one_or_none()
+
+    @staticmethod
+    def get_pending_group_ids(
+        after_id: int, limit: int, db_session: Session
+    ) -> Sequence[int]:
+        """Next page of drawable groups still waiting for a draw, by ascending id.
+
+        A group is pending while any member is still PENDING and it has at
+        least two members. Keyset paging (id > after_id) keeps every page a
+        single index range scan, however far into the table the job is.
+        """
+        stmt = (
+            select(Participant.group_id)
+            .join(Group, Group.id == Participant.group_id)
+            .where(Participant.group_id > after_id, Group.deleted_at.is_(None))
+            .group_by(Participant.group_id)
+            .having(
+                func.count() >= 2,
+                func.count().filter(Participant.status == ParticipantStatus.PENDING)
+                > 0,
+            )
+            .order_by(Participant.group_id)
+            .limit(limit)
+        )
+        return db_session.scalars(stmt).all()
+
+    @staticmethod
+    def record_history(
+        group_ids: Sequence[int], draw_year: int, db_session: Session
+    ) -> None:
+        """Snapshots the groups' current links as their lineages' draw for the year.
+
+        A re-draw in the same year replaces that year's snapshot. Two
+        statements whatever the number of groups: DELETE of the year, then
+        INSERT … SELECT from the links.
+        """
+        lineage = func.coalesce(Group.lineage_id, Group.id)
+        lineages = select(lineage).where(Group.id.in_(group_ids))
+        db_session.execute(
+            delete(SecretFriendHistory)
+            .where(
+                SecretFriendHistory.lineage_id.in_(lineages),
+                SecretFriendHistory.draw_year == draw_year,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        giver = aliased(Participant)
+        receiver = aliased(Participant)
+        pairs = (
+            select(lineage, literal(draw_year), giver.name, receiver.name)
+            .select_from(SecretFriend)
+            .join(giver, giver.id == SecretFriend.gift_giver_id)
+            .join(Group, Group.id == giver.group_id)
+            .join(receiver, receiver.id == SecretFriend.gift_receiver_id)
+            .where(giver.group_id.in_(group_ids))
+        )
+        db_session.execute(
+            insert(SecretFriendHistory).from_select(
+                ["lineage_id", "draw_year", "giver_name", "receiver_name"], pairs
+            )
+        )
+
+    @staticmethod
+    def get_history_pairs(
+        group_id: int, first_year: int, last_year: int, db_session: Session
+    ) -> Iterable[tuple[int, int]]:
+        """Past (giver_id, receiver_id) pairs of the group's lineage.
+
+        Draws between first_year and last_year are mapped onto today's
+        participants by name. One query; at most one row per giver per year.
+        """
+        giver = aliased(Participant)
+        receiver = aliased(Participant)
+        stmt = (
+            select(giver.id, receiver.id)
+            .select_from(SecretFriendHistory)
+            .join(
+                giver,
+                and_(
+                    giver.group_id == group_id,
+                    giver.name == SecretFriendHistory.giver_name,
+                ),
+            )
+            .join(
+                receiver,
+                and_(
+                    receiver.group_id == group_id,
+                    receiver.name == SecretFriendHistory.receiver_name,
+                ),
             )
-        return new_sf
+            .where(
+                SecretFriendHistory.lineage_id == _lineage_of(group_id),
+                SecretFriendHistory.draw_year.between(first_year, last_year),
+            )
+        )
+        return db_session.execute(stmt).tuples()
+
+    @staticmethod
+    def get_history_pairs_by_group_ids(
+        group_ids: Sequence[int], first_year: int, last_year: int, db_session: Session
+    ) -> dict[int, list[tuple[int, int]]]:
+        """get_history_pairs for several groups in one query, keyed by group id."""
+        giver = aliased(Participant)
+        receiver = aliased(Participant)
+        stmt = (
+            select(Group.id, giver.id, receiver.id)
+            .select_from(SecretFriendHistory)
+            .join(
+                Group,
+                and_(
+                    Group.id.in_(group_ids),
+                    func.coalesce(Group.lineage_id, Group.id)
+                    == SecretFriendHistory.lineage_id,
+                ),
+            )
+            .join(
+                giver,
+                and_(
+                    giver.group_id == Group.id,
+                    giver.name == SecretFriendHistory.giver_name,
+                ),
+            )
+            .join(
+                receiver,
+                and_(
+                    receiver.group_id == Group.id,
+                    receiver.name == SecretFriendHistory.receiver_name,
+                ),
+            )
+            .where(SecretFriendHistory.draw_year.between(first_year, last_year))
+        )
+        pairs: dict[int, list[tuple[int, int]]] = {
+            group_id: [] for group_id in group_ids
+        }
+        for group_id, giver_id, receiver_id in db_session.execute(stmt):
+            pairs[group_id].append((giver_id, receiver_id))
+        return pairs
 
     @staticmethod
     def get_by_id(secret_friend_id: int, db_session: Session) -> SecretFriend:
-        secret_friend = db_session.get(SecretFriend, secret_friend_id)
+        stmt = select(SecretFriend).where(
+            SecretFriend.id == secret_friend_id, _giver_in_live_group
+        )
+        secret_friend = db_session.scalars(stmt).one_or_none()
         if not secret_friend:
             raise NotFoundError("Secret friend assignment not found")
         return secret_friend
 
     @staticmethod
-    def delete(secret_friend_id: int, db_session: Session) -> None:
-        secret_friend = db_session.get(SecretFriend, secret_friend_id)
-        if not secret_friend:
-            raise NotFoundError("Secret friend assignment not found")
+    def get_pairs_by_group_id(
+        group_id: int, limit: int, after: int | None, db_session: Session
+    ) -> Sequence[Row[tuple[int, int, str, int, str]]]:
+        """A page of the group's links with both names, in one joined query.
+
+        Keyset pagination on secret_friends.id (id > after). Returns plain
+        rows labelled like SecretFriendPair — no ORM objects are built.
+        """
+        giver = aliased(Participant)
+        receiver = aliased(Participant)
+        stmt = (
+            select(
+                SecretFriend.id,
+                SecretFriend.gift_giver_id,
+                giver.name.label("gift_giver_name"),
+                SecretFriend.gift_receiver_id,
+                receiver.name.label("gift_receiver_name"),
+            )
+            .join(giver, giver.id == SecretFriend.gift_giver_id)
+            .join(Group, Group.id == giver.group_id)
+            .join(receiver, receiver.id == SecretFriend.gift_receiver_id)
+            .where(giver.group_id == group_id, Group.deleted_at.is_(None))
+            .order_by(SecretFriend.id)
+            .limit(limit)
+        )
+        if after is not None:
+            stmt = stmt.where(SecretFriend.id > after)
+        return db_session.execute(stmt).all()
+
+    @staticmethod
+    def get_by_giver_id(gift_giver_id: int, db_session: Session) -> SecretFriend | None:
+        """The giver's current link, if any — a lookup on the unique giver index."""
+        stmt = select(SecretFriend).where(
+            SecretFriend.gift_giver_id == gift_giver_id, _giver_in_live_group
+        )
+        return db_session.scalars(stmt).one_or_none()
+
+    @staticmethod
+    def delete(secret_friend_id: int, db_session: Session) -> SecretFriend:
+        secret_friend = SecretFriendRepository.get_by_id(
+            secret_friend_id=secret_friend_id, db_session=db_session
+        )
         db_session.delete(secret_friend)
         db_session.flush()
+        return secret_friend
@@ -23,3 +23,56 @@ class SecretFriendRead(BaseModel):
     id: int
     gift_giver_id: int
     gift_receiver_id: int
+
+
+class SecretFriendList(BaseModel):
+    secret_friends: list[SecretFriendRead]
+
+
+class SecretFriendPair(BaseModel):
+    """An assignment with both names, for listing a whole group."""
+
+    model_config = {"from_attributes": True}
+
+    id: int
+    gift_giver_id: int
+    gift_giver_name: str
+    gift_receiver_id: int
+    gift_receiver_name: str
+
+
+class SecretFriendPairPage(BaseModel):
+    """One page of a group's assignments, ordered by assignment id.
+
+    next_after is the cursor for the next page (pass it as `after`), or
+    None on the last page.
+    """
+
+    secret_friends: list[SecretFriendPair]
+    next_after: int | None = None
+
+
+class SecretFriendDraw(BaseModel):
+    """Optional rules for a whole-group draw.
+
+    Each exclusion is a (gift_giver_id, gift_receiver_id) pair that must not
+    be drawn. Pairs are directed: list both directions for couples.
+    no_repeat_years forbids pairings drawn by the group's lineage in that
+    many previous years.
+    """
+
+    exclusions: list[tuple[int, int]] = Field(default_factory=list)
+    no_repeat_years: int = Field(default=0, ge=0, le=50)
+
+
+class SecretFriendBatchReport(BaseModel):
+    """Progress of an offline draw over every pending group.
+
+    last_group_id is the highest group id handled by a committed batch —
+    pass it as after_id to resume past it explicitly.
+    """
+
+    groups_drawn: int = 0
+    assignments: int = 0
+    groups_failed: list[int] = Field(default_factory=list)
+    last_group_id: int = 0
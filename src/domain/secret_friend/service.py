@@ -1,47 +1,103 @@
-import random
+import itertools
+import logging
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from datetime import datetime, timezone
 
 from sqlalchemy.orm import Session
 
-from src.domain.participant.schemas import ParticipantRead
+from src.domain.group.service import GroupService
 from src.domain.participant.service import ParticipantService
+from src.domain.secret_friend import cache, matching
 from src.domain.secret_friend.repository import SecretFriendRepository
-from src.domain.secret_friend.schemas import SecretFriendLink, SecretFriendRead
+from src.domain.secret_friend.schemas import (
+    SecretFriendBatchReport,
+    SecretFriendLink,
+    SecretFriendList,
+    SecretFriendPair,
+    SecretFriendPairPage,
+    SecretFriendRead,
+)
 from src.domain.secret_friend.signals import (
     secret_friend_assigned,
     secret_friend_deleted,
+    secret_friend_drawn,
 )
-from src.infrastructure.persistence import transaction
-from src.shared.exceptions import BusinessRuleError
+from src.infrastructure.persistence import in_transaction, transaction, use_primary
+from src.shared.exceptions import BusinessRuleError, ConflictError, NotFoundError
+
+log = logging.getLogger(__name__)
+
+# How many times assign() runs before a ConflictError reaches the caller.
+_ASSIGN_ATTEMPTS = 3
+
+# Groups drawn per transaction by draw_pending().
+_DRAW_BATCH_SIZE = 500
 
 
 class SecretFriendService:
     @staticmethod
     def assign(
         group_id: int, participant_id: int, db_session: Session
+    ) -> SecretFriendRead:
+        """Assigns a secret friend, retrying a bounded number of times on conflict.
+
+        Retries only when this call owns the transaction — inside a caller's
+        transaction the conflict is propagated so the caller can roll back.
+        """
+        attempts = 1 if in_transaction(db_session) else _ASSIGN_ATTEMPTS
+        attempt = 1
+        while True:
+            try:
+                return SecretFriendService._assign_once(
+                    group_id=group_id,
+                    participant_id=participant_id,
+                    db_session=db_session,
+                )
+            except ConflictError:
+                if attempt >= attempts:
+                    raise
+                log.warning(
+                    "secret friend assignment conflict — group_id=%s "
+                    "participant_id=%s attempt=%s",
+                    group_id,
+                    participant_id,
+                    attempt,
+                )
+                attempt += 1
+
+    @staticmethod
+    def _assign_once(
+        group_id: int, participant_id: int, db_session: Session
     ) -> SecretFriendRead:
         """Orchestrates the full secret friend assignment flow.
 
-        1. Fetch participant and group members
-        2. Sort a secret friend (random, no self-link)
-        3. Persist the link
-        4. Emit signal (participant status update handled by participant handler)
+        1. Lock the group so concurrent assignments run one at a time
+        2. Check the participant exists
+        3. Pick a random receiver not yet taken (single anti-join query)
+        4. Persist the link
+        5. Emit signal (participant status update handled by participant handler)
         """
         with transaction(db_session):
-            participant = ParticipantService.get_by_id(
-                participant_id=participant_id, db_session=db_session
-            )
-            all_participants = ParticipantService.get_by_group_id(
+            if not SecretFriendRepository.lock_group(
                 group_id=group_id, db_session=db_session
+            ):
+                raise NotFoundError("Group not found")
+            ParticipantService.get_by_id(
+                participant_id=participant_id, db_session=db_session
             )
-
-            link = SecretFriendService.sort_secret_friends(
-                participant, all_participants
+            receiver_id = SecretFriendRepository.pick_available_receiver(
+                group_id=group_id, gift_giver_id=participant_id, db_session=db_session
             )
+            if receiver_id is None:
+                raise BusinessRuleError(
+                    "Unable to assign a secret friend for the participant."
+                )
 
             result = SecretFriendRepository.link(
                 secret_friend=SecretFriendLink(
                     gift_giver_id=participant_id,
-                    gift_receiver_id=link.gift_receiver_id,
+                    gift_receiver_id=receiver_id,
                 ),
                 db_session=db_session,
             )
@@ -56,23 +112,254 @@ class SecretFriendService:
             return validated
 
     @staticmethod
-    def sort_secret_friends(
-        participant: ParticipantRead, participants: list[ParticipantRead]
-    ) -> SecretFriendLink:
-        """Shuffles participants and assigns a secret friend avoiding self-linking."""
-        if len(participants) < 2:
-            raise BusinessRuleError(
-                "At least 2 participants are required to assign secret friends."
+    def draw_group(
+        group_id: int,
+        db_session: Session,
+        exclusions: list[tuple[int, int]] | None = None,
+        no_repeat_years: int = 0,
+    ) -> SecretFriendList:
+        """Assigns every participant of a group in a single transaction.
+
+        1. Lock the group and fetch its member ids once (id column only)
+        2. Match them with the matching engine, honouring (giver, receiver)
+           exclusions and the pairings of the last no_repeat_years draws —
+           a single-cycle derangement when rules are sparse
+        3. Upsert every giver's link in one bulk statement
+        4. Record this year's pairings in the lineage's draw history
+        5. Emit one group-level signal (participant handler reveals everyone)
+        """
+        draw_year = datetime.now(timezone.utc).year
+        with transaction(db_session):
+            participant_ids, forbidden = SecretFriendService.prepare_draw(
+                group_id=group_id,
+                draw_year=draw_year,
+                db_session=db_session,
+                exclusions=exclusions,
+                no_repeat_years=no_repeat_years,
+            )
+            assignment = matching.match(participant_ids, forbidden=forbidden)
+            return SecretFriendService.save_draw(
+                group_id=group_id,
+                assignment=assignment,
+                draw_year=draw_year,
+                db_session=db_session,
+            )
+
+    @staticmethod
+    def prepare_draw(
+        group_id: int,
+        draw_year: int,
+        db_session: Session,
+        exclusions: list[tuple[int, int]] | None = None,
+        no_repeat_years: int = 0,
+    ) -> tuple[Sequence[int], matching.Forbidden]:
+        """Lock the group and read what matching needs: member ids, forbidden pairs.
+
+        Steps 1–2 of draw_group. Call inside transaction(), which holds the
+        lock until save_draw's writes commit.
+        """
+        if not SecretFriendRepository.lock_group(
+            group_id=group_id, db_session=db_session
+        ):
+            raise NotFoundError("Group not found")
+        participant_ids = ParticipantService.get_ids_by_group_id(
+            group_id=group_id, db_session=db_session
+        )
+        history: Iterable[tuple[int, int]] = ()
+        if no_repeat_years:
+            history = SecretFriendRepository.get_history_pairs(
+                group_id=group_id,
+                first_year=draw_year - no_repeat_years,
+                last_year=draw_year - 1,
+                db_session=db_session,
+            )
+        if exclusions:
+            # A giver may exclude any number of receivers: hash sets.
+            return participant_ids, matching.forbidden_from_pairs(
+                itertools.chain(exclusions, history)
             )
-        random.shuffle(participants)
+        return participant_ids, matching.pack_forbidden(history)
+
+    @staticmethod
+    def save_draw(
+        group_id: int,
+        assignment: Mapping[int, int],
+        draw_year: int,
+        db_session: Session,
+    ) -> SecretFriendList:
+        """Persist a matched assignment and emit secret_friend_drawn.
 
-        for receiver in participants[1:] + [participants[0]]:
-            if receiver.id == participant.id:
-                continue
-            return SecretFriendLink(
-                gift_giver_id=participant.id, gift_receiver_id=receiver.id
+        Steps 3–5 of draw_group, in the transaction() prepare_draw ran in.
+        """
+        links = [
+            SecretFriendLink(gift_giver_id=giver_id, gift_receiver_id=receiver_id)
+            for giver_id, receiver_id in assignment.items()
+        ]
+        rows = SecretFriendRepository.bulk_link(links=links, db_session=db_session)
+        SecretFriendRepository.record_history(
+            group_ids=[group_id], draw_year=draw_year, db_session=db_session
+        )
+        assignments = [SecretFriendRead.model_validate(row) for row in rows]
+        secret_friend_drawn.send(
+            SecretFriendService,
+            assignments=assignments,
+            group_id=group_id,
+            db_session=db_session,
+        )
+        return SecretFriendList(secret_friends=assignments)
+
+    @staticmethod
+    def draw_pending(
+        db_session: Session,
+        seed: int | None = None,
+        batch_size: int = _DRAW_BATCH_SIZE,
+        workers: int | None = None,
+        after_id: int = 0,
+        no_repeat_years: int = 0,
+        progress: Callable[[SecretFriendBatchReport], None] | None = None,
+    ) -> SecretFriendBatchReport:
+        """Draws every pending group, one batch per transaction — the draw-day job.
+
+        1. Page through pending group ids by keyset (id > last one seen)
+        2. Fetch the batch's member ids and past pairings, one query each
+        3. Match the groups in a process pool, seeded per group when seed is set
+        4. Commit the batch: lock, re-check each group's members (re-matching
+           groups whose membership changed meanwhile), bulk-upsert every link,
+           record history and emit one drawn signal per group (participant
+           handler reveals them)
+        5. Report progress
+
+        Steps 1-2 read outside any transaction, without locks — and from the
+        read replica, when one is configured (see persistence/routing.py) —
+        so they may be out of date by step 4. The re-check reads the primary,
+        under the lock.
+
+        Drawn groups stop being pending as their batch commits, so running the
+        job again after a crash picks up where it stopped. Groups that cannot
+        be drawn are listed in groups_failed and left pending.
+        """
+        draw_year = datetime.now(timezone.utc).year
+        report = SecretFriendBatchReport(last_group_id=after_id)
+        with matching.parallel_matcher(workers) as match_groups:
+            while True:
+                group_ids = SecretFriendRepository.get_pending_group_ids(
+                    after_id=report.last_group_id,
+                    limit=batch_size,
+                    db_session=db_session,
+                )
+                if not group_ids:
+                    break
+                members = ParticipantService.get_ids_by_group_ids(
+                    group_ids=group_ids, db_session=db_session
+                )
+                history = SecretFriendService._history_pairs(
+                    group_ids, draw_year, no_repeat_years, db_session
+                )
+                jobs = {
+                    group_id: (group_id, members[group_id], history[group_id], seed)
+                    for group_id in group_ids
+                }
+                results = list(match_groups(jobs.values()))
+                SecretFriendService._commit_draws(
+                    results, jobs, draw_year, report, db_session
+                )
+                report.last_group_id = group_ids[-1]
+                log.info(
+                    "draw_pending progress — drawn=%s failed=%s last_group_id=%s",
+                    report.groups_drawn,
+                    len(report.groups_failed),
+                    report.last_group_id,
+                )
+                if progress:
+                    progress(report)
+        return report
+
+    @staticmethod
+    def _history_pairs(
+        group_ids: Sequence[int],
+        draw_year: int,
+        no_repeat_years: int,
+        db_session: Session,
+    ) -> dict[int, list[tuple[int, int]]]:
+        if not no_repeat_years:
+            return {group_id: [] for group_id in group_ids}
+        return SecretFriendRepository.get_history_pairs_by_group_ids(
+            group_ids=group_ids,
+            first_year=draw_year - no_repeat_years,
+            last_year=draw_year - 1,
+            db_session=db_session,
+        )
+
+    @staticmethod
+    def _commit_draws(
+        results: Sequence[matching.MatchResult],
+        jobs: Mapping[int, matching.MatchJob],
+        draw_year: int,
+        report: SecretFriendBatchReport,
+        db_session: Session,
+    ) -> None:
+        """Persists one batch of matched groups in a single transaction.
+
+        Once a group is locked its members are read again: a group whose
+        members changed since they were matched is re-matched here, in
+        process (with the history read before, so newcomers have none); a
+        group marked for deletion meanwhile is skipped.
+        """
+        matched = dict(results)
+        drawn: dict[int, dict[int, int]] = {}
+        with transaction(db_session):
+            locked = [
+                group_id
+                for group_id in matched
+                if SecretFriendRepository.lock_group(
+                    group_id=group_id, db_session=db_session
+                )
+            ]
+            members = ParticipantService.get_ids_by_group_ids(
+                group_ids=locked, db_session=db_session
             )
-        raise BusinessRuleError("Unable to assign a secret friend for the participant.")
+            for group_id in locked:
+                assignment = matched[group_id]
+                _, matched_ids, history, seed = jobs[group_id]
+                if list(matched_ids) != members[group_id]:
+                    _, assignment = matching.match_group(
+                        (group_id, members[group_id], history, seed)
+                    )
+                if assignment is None:
+                    report.groups_failed.append(group_id)
+                else:
+                    drawn[group_id] = assignment
+            if not drawn:
+                return
+            links = [
+                SecretFriendLink(gift_giver_id=giver_id, gift_receiver_id=receiver_id)
+                for assignment in drawn.values()
+                for giver_id, receiver_id in assignment.items()
+            ]
+            rows = SecretFriendRepository.bulk_link(links=links, db_session=db_session)
+            SecretFriendRepository.record_history(
+                group_ids=list(drawn), draw_year=draw_year, db_session=db_session
+            )
+
+            group_of = {
+                giver_id: group_id
+                for group_id, assignment in drawn.items()
+                for giver_id in assignment
+            }
+            by_group: defaultdict[int, list[SecretFriendRead]] = defaultdict(list)
+            for row in rows:
+                by_group[group_of[row.gift_giver_id]].append(
+                    SecretFriendRead.model_validate(row)
+                )
+            for group_id, assignments in by_group.items():
+                secret_friend_drawn.send(
+                    SecretFriendService,
+                    assignments=assignments,
+                    group_id=group_id,
+                    db_session=db_session,
+                )
+        report.groups_drawn += len(drawn)
+        report.assignments += len(links)
 
     @staticmethod
     def get_by_id(secret_friend_id: int, db_session: Session) -> SecretFriendRead:
@@ -81,14 +368,63 @@ class SecretFriendService:
         )
         return SecretFriendRead.model_validate(result)
 
+    @staticmethod
+    def get_pairs_by_group_id(
+        group_id: int, db_session: Session, limit: int, after: int | None = None
+    ) -> SecretFriendPairPage:
+        """One page of a group's assignments with giver and receiver names.
+
+        Fetches limit + 1 rows to learn whether another page follows. The
+        group is only looked up when the first page comes back empty, to
+        tell an undrawn group from a missing one.
+        """
+        rows = SecretFriendRepository.get_pairs_by_group_id(
+            group_id=group_id, limit=limit + 1, after=after, db_session=db_session
+        )
+        if not rows and after is None:
+            GroupService.get_by_id(group_id=group_id, db_session=db_session)
+        pairs = [SecretFriendPair.model_validate(row) for row in rows[:limit]]
+        next_after = pairs[-1].id if len(rows) > limit else None
+        return SecretFriendPairPage(secret_friends=pairs, next_after=next_after)
+
+    @staticmethod
+    def get_by_giver_id(participant_id: int, db_session: Session) -> SecretFriendRead:
+        """Who a participant drew — from the giver cache after the first read.
+
+        Raises NotFoundError when the participant does not exist or has not
+        drawn yet; only the latter is cached. Misses are read from the
+        primary, never from a read replica that may lag behind the draw.
+        """
+
+        def load() -> SecretFriendRead | None:
+            # Cached for the TTL: a lagging replica would pin a stale answer.
+            use_primary(db_session)
+            result = SecretFriendRepository.get_by_giver_id(
+                gift_giver_id=participant_id, db_session=db_session
+            )
+            if result is None:
+                ParticipantService.get_by_id(
+                    participant_id=participant_id, db_session=db_session
+                )
+                return None
+            return SecretFriendRead.model_validate(result)
+
+        assignment = cache.by_giver.get_or_load(participant_id, load)
+        if assignment is None:
+            raise NotFoundError("Secret friend not assigned yet")
+        return assignment
+
     @staticmethod
     def delete(secret_friend_id: int, db_session: Session) -> None:
         with transaction(db_session):
-            SecretFriendRepository.delete(
+            deleted = SecretFriendRepository.delete(
                 secret_friend_id=secret_friend_id, db_session=db_session
             )
             secret_friend_deleted.send(
-                SecretFriendService, secret_friend_id=secret_friend_id
+                SecretFriendService,
+                secret_friend_id=secret_friend_id,
+                gift_giver_id=deleted.gift_giver_id,
+                db_session=db_session,
             )
 
     @staticmethod
@@ -96,4 +432,6 @@ class SecretFriendService:
         result = SecretFriendRepository.link(
             secret_friend=secret_friend, db_session=db_session
         )
+        # No signal is sent for a bare link, so evict the giver here.
+        cache.by_giver.invalidate(secret_friend.gift_giver_id)
         return SecretFriendRead.model_validate(result)
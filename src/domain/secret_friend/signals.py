@@ -4,3 +4,4 @@ from blinker import NamedSignal, signal
 
 secret_friend_assigned: NamedSignal = signal("secret_friend.assigned")
 secret_friend_deleted: NamedSignal = signal("secret_friend.deleted")
+secret_friend_drawn: NamedSignal = signal("secret_friend.drawn")
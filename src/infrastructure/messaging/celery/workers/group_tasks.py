@@ -1,11 +1,20 @@
-"""Celery task wrappers for group notifications."""
-from celery import shared_task
+"""Celery task wrappers for group notifications, counters and purges."""
+from typing import Any
+
+from celery import Task, shared_task
 
 from src.domain.group.notifications import (
     on_group_created,
     on_group_deleted,
     on_group_updated,
 )
+from src.domain.group.schemas import GroupStatsReport
+from src.domain.group.service import GroupService
+from src.infrastructure.persistence import SessionLocal
+from src.shared.exceptions import BusinessRuleError
+
+# Seconds between retries while the group's deletion mark is not visible yet.
+_PURGE_RETRY_DELAY = 5
 
 
 @shared_task(name="notifications.group_created")
@@ -21,3 +30,44 @@ def group_updated(*, group_id: int, group_name: str) -> None:
 @shared_task(name="notifications.group_deleted")
 def group_deleted(*, group_id: int) -> None:
     on_group_deleted(group_id=group_id)
+
+
+@shared_task(name="groups.reconcile_stats", bind=True)
+def reconcile_stats(
+    self: Task, *, batch_size: int = 1000, after_id: int = 0
+) -> dict[str, Any]:
+    """Rebuild group_stats from participants; progress is the PROGRESS state."""
+
+    def publish(report: GroupStatsReport) -> None:
+        self.update_state(state="PROGRESS", meta=report.model_dump())
+
+    db_session = SessionLocal()
+    try:
+        report = GroupService.reconcile_stats(
+            db_session=db_session,
+            batch_size=batch_size,
+            after_id=after_id,
+            progress=publish,
+        )
+    finally:
+        db_session.close()
+    return report.model_dump()
+
+
+@shared_task(name="groups.purge", bind=True, max_retries=3)
+def purge(self: Task, *, group_id: int, batch_size: int = 5000) -> dict[str, Any]:
+    """Remove the rows of a group deleted in the background.
+
+    Dispatched before the marking transaction commits, so an unmarked group
+    is retried a few times — and left alone if that transaction rolled back.
+    """
+    db_session = SessionLocal()
+    try:
+        report = GroupService.purge(
+            group_id=group_id, db_session=db_session, batch_size=batch_size
+        )
+    except BusinessRuleError as exc:
+        raise self.retry(exc=exc, countdown=_PURGE_RETRY_DELAY)
+    finally:
+        db_session.close()
+    return report.model_dump()
@@ -4,6 +4,7 @@ from celery import shared_task
 from src.domain.participant.notifications import (
     on_participant_deleted,
     on_participant_joined,
+    on_participants_joined,
 )
 
 
@@ -12,6 +13,11 @@ def participant_joined(*, participant_id: int, group_id: int) -> None:
     on_participant_joined(participant_id=participant_id, group_id=group_id)
 
 
+@shared_task(name="notifications.participants_joined")
+def participants_joined(*, group_id: int, participant_ids: list[int]) -> None:
+    on_participants_joined(group_id=group_id, participant_ids=participant_ids)
+
+
 @shared_task(name="notifications.participant_deleted")
 def participant_deleted(*, participant_id: int) -> None:
     on_participant_deleted(participant_id=participant_id)
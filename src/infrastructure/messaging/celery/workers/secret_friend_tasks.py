@@ -1,10 +1,17 @@
-"""Celery task wrappers for secret friend notifications."""
-from celery import shared_task
+"""Celery task wrappers for secret friend notifications and offline draws."""
+from typing import Any
 
+from celery import Task, shared_task
+
+from src.domain.lifecycle import register_all_handlers
 from src.domain.secret_friend.notifications import (
     on_secret_friend_assigned,
     on_secret_friend_deleted,
+    on_secret_friend_drawn,
 )
+from src.domain.secret_friend.schemas import SecretFriendBatchReport
+from src.domain.secret_friend.service import SecretFriendService
+from src.infrastructure.persistence import SessionLocal
 
 
 @shared_task(name="notifications.secret_friend_assigned")
@@ -12,6 +19,47 @@ def secret_friend_assigned(*, assignment_id: int, group_id: int) -> None:
     on_secret_friend_assigned(assignment_id=assignment_id, group_id=group_id)
 
 
+@shared_task(name="notifications.secret_friend_drawn")
+def secret_friend_drawn(*, group_id: int, assignment_count: int) -> None:
+    on_secret_friend_drawn(group_id=group_id, assignment_count=assignment_count)
+
+
 @shared_task(name="notifications.secret_friend_deleted")
 def secret_friend_deleted(*, secret_friend_id: int) -> None:
     on_secret_friend_deleted(secret_friend_id=secret_friend_id)
+
+
+@shared_task(name="secret_friends.draw_pending", bind=True)
+def draw_pending(
+    self: Task,
+    *,
+    seed: int | None = None,
+    batch_size: int = 500,
+    workers: int | None = None,
+    after_id: int = 0,
+    no_repeat_years: int = 0,
+) -> dict[str, Any]:
+    """Draw every pending group; progress is published as the PROGRESS state.
+
+    Prefork children cannot start a process pool, so matching runs in the
+    worker process unless the task is consumed by a --pool=solo/threads worker.
+    """
+
+    def publish(report: SecretFriendBatchReport) -> None:
+        self.update_state(state="PROGRESS", meta=report.model_dump())
+
+    register_all_handlers()
+    db_session = SessionLocal()
+    try:
+        report = SecretFriendService.draw_pending(
+            db_session=db_session,
+            seed=seed,
+            batch_size=batch_size,
+            workers=workers,
+            after_id=after_id,
+            no_repeat_years=no_repeat_years,
+            progress=publish,
+        )
+    finally:
+        db_session.close()
+    return report.model_dump()
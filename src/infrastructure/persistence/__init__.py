@@ -2,10 +2,42 @@
 
 Import from here for convenience:
     from src.infrastructure.persistence import Base, get_db, engine, transaction
+    from src.infrastructure.persistence import get_async_db, run_sync, async_transaction
+    from src.infrastructure.persistence import pool_stats
 """
 
+from src.infrastructure.persistence.async_session import (
+    AsyncSessionLocal,
+    async_engine,
+    async_transaction,
+    get_async_db,
+    run_sync,
+)
 from src.infrastructure.persistence.base import Base
-from src.infrastructure.persistence.session import SessionLocal, engine, get_db
-from src.infrastructure.persistence.transaction import transaction
+from src.infrastructure.persistence.pool_metrics import pool_stats
+from src.infrastructure.persistence.routing import RoutingSession, use_primary
+from src.infrastructure.persistence.session import (
+    SessionLocal,
+    engine,
+    get_db,
+    replica_engine,
+)
+from src.infrastructure.persistence.transaction import in_transaction, transaction
 
-__all__ = ["Base", "SessionLocal", "engine", "get_db", "transaction"]
+__all__ = [
+    "AsyncSessionLocal",
+    "Base",
+    "RoutingSession",
+    "SessionLocal",
+    "async_engine",
+    "async_transaction",
+    "engine",
+    "get_async_db",
+    "get_db",
+    "in_transaction",
+    "pool_stats",
+    "replica_engine",
+    "run_sync",
+    "transaction",
+    "use_primary",
+]
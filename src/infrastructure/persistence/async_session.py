@@ -0,0 +1,99 @@
+"""Async database session management — asyncpg, for the async API routes.
+
+The async services hand the existing sync services to
+AsyncSession.run_sync: the same repositories, transactions and signal
+handlers run unchanged, while every query is awaited on the event loop
+instead of occupying one of the threadpool's threads for the whole request.
+Celery workers and scripts keep using the sync engine in session.py.
+
+run_sync is a shim, not an async code path: the sync code runs on the event
+loop's thread (in a greenlet), so anything CPU-bound in it stalls every other
+request on the worker. Split such work around it — read inside
+async_transaction(), compute in a thread, then write.
+"""
+
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from typing import Any, TypeVar
+
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from src.infrastructure.persistence.pool_metrics import instrument, pool_options
+from src.infrastructure.persistence.routing import RoutingSession
+from src.shared.config import settings
+
+T = TypeVar("T")
+
+async_engine = create_async_engine(
+    settings.ASYNC_DATABASE_URL,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    **pool_options("primary_async", asyncio=True),
+)
+instrument(async_engine.sync_engine)
+
+async_replica_engine: AsyncEngine | None = None
+if settings.ASYNC_REPLICA_DATABASE_URL:
+    async_replica_engine = create_async_engine(
+        settings.ASYNC_REPLICA_DATABASE_URL,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        **pool_options("replica_async", asyncio=True),
+    )
+    instrument(async_replica_engine.sync_engine)
+
+# Routing happens in the sync session that run_sync hands to the services.
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    sync_session_class=RoutingSession,
+    replica=async_replica_engine.sync_engine if async_replica_engine else None,
+)
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Yield an async database session, ensuring proper cleanup."""
+    db = AsyncSessionLocal()
+    try:
+        yield db
+    except Exception:
+        await db.rollback()
+        raise
+    finally:
+        await db.close()
+
+
+@asynccontextmanager
+async def async_transaction(db_session: AsyncSession) -> AsyncIterator[AsyncSession]:
+    """transaction() spanning several awaits on an async session.
+
+    The run_sync calls inside it share one transaction (their own
+    transaction() blocks join it), committed when the block exits.
+    """
+    if db_session.info.get("_in_transaction"):
+        yield db_session
+        return
+
+    db_session.info["_in_transaction"] = True
+    try:
+        yield db_session
+        await db_session.commit()
+    except Exception:
+        await db_session.rollback()
+        raise
+    finally:
+        db_session.info.pop("_in_transaction", None)
+
+
+async def run_sync(
+    db_session: AsyncSession, fn: Callable[..., T], /, **kwargs: Any
+) -> T:
+    """Await fn(**kwargs, db_session=<the Session behind db_session>)."""
+    return await db_session.run_sync(
+        lambda sync_session: fn(**kwargs, db_session=sync_session)
+    )
@@ -1,5 +1,15 @@
+from sqlalchemy import DDL, event
 from sqlalchemy.orm import DeclarativeBase
 
 
 class Base(DeclarativeBase):
     pass
+
+
+# The trigram indexes on group and participant names need pg_trgm, so
+# create_all() enables it before creating any table.
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
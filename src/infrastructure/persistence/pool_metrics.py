@@ -0,0 +1,162 @@
+"""Connection pool instrumentation — how hard each engine's pool is pressed.
+
+Engines are built with pool_options(name), which sizes the pool from
+settings and swaps in a QueuePool that times every checkout, then handed to
+instrument(), which counts pool events:
+
+    engine = create_engine(url, **pool_options("primary"))
+    instrument(engine)
+
+pool_stats() reports every instrumented pool by name — checked-out
+connections (now and peak), overflow, checkout waits and timeouts,
+invalidations — for the /metrics endpoint. Counters are per worker process.
+"""
+
+import threading
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, QueuePool
+
+from src.shared.config import settings
+
+
+class PoolMetrics:
+    """Counters for one pool, fed by its events and by timed checkouts."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.connects = 0
+        self.checkouts = 0
+        self.checked_out = 0
+        self.peak_checked_out = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.timeouts = 0
+        self.invalidations = 0
+        self.soft_invalidations = 0
+
+    def observe_wait(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self.wait_total += seconds
+            self.wait_max = max(self.wait_max, seconds)
+            self.timeouts += timed_out
+
+    def on_connect(self, *_: Any) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def on_checkout(self, *_: Any) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.checked_out += 1
+            self.peak_checked_out = max(self.peak_checked_out, self.checked_out)
+
+    def on_checkin(self, dbapi_connection: Any, *_: Any) -> None:
+        # Also fired for connections invalidated while checked out, with
+        # dbapi_connection None; those were counted out all the same.
+        with self._lock:
+            self.checked_out -= 1
+
+    def on_invalidate(self, *_: Any) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+    def on_soft_invalidate(self, *_: Any) -> None:
+        with self._lock:
+            self.soft_invalidations += 1
+
+    def stats(self, pool: Any) -> dict[str, Any]:
+        stats: dict[str, Any] = {}
+        if isinstance(pool, QueuePool):
+            # overflow() counts up from -size as connections are opened.
+            stats |= {
+                "size": pool.size(),
+                "max_overflow": pool._max_overflow,
+                "timeout": pool.timeout(),
+                "open": pool.size() + pool.overflow(),
+                "checked_in": pool.checkedin(),
+                "overflow": max(0, pool.overflow()),
+            }
+        with self._lock:
+            return stats | {
+                "checked_out": self.checked_out,
+                "peak_checked_out": self.peak_checked_out,
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "wait_seconds_total": round(self.wait_total, 6),
+                "wait_seconds_max": round(self.wait_max, 6),
+                "timeouts": self.timeouts,
+                "invalidations": self.invalidations,
+                "soft_invalidations": self.soft_invalidations,
+            }
+
+
+# Pool logging name → its metrics and engine. Pools look themselves up by
+# name, which survives Engine.dispose() recreating the pool.
+_metrics: dict[str, PoolMetrics] = {}
+_engines: dict[str, Engine] = {}
+
+
+class _TimedCheckout(QueuePool):
+    """Times _do_get: the wait for a free connection (or a new one)."""
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        metrics = _metrics.get(self.logging_name or "")
+        if metrics is None:
+            return super()._do_get()
+        started = time.perf_counter()
+        try:
+            entry = super()._do_get()
+        except PoolTimeoutError:
+            metrics.observe_wait(time.perf_counter() - started, timed_out=True)
+            raise
+        metrics.observe_wait(time.perf_counter() - started)
+        return entry
+
+
+class InstrumentedQueuePool(_TimedCheckout):
+    pass
+
+
+class InstrumentedAsyncAdaptedQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_options(name: str, asyncio: bool = False) -> dict[str, Any]:
+    """create_engine() keyword arguments for an instrumented, sized pool."""
+    return {
+        "poolclass": (
+            InstrumentedAsyncAdaptedQueuePool if asyncio else InstrumentedQueuePool
+        ),
+        "pool_logging_name": name,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_use_lifo": settings.DB_POOL_USE_LIFO,
+    }
+
+
+def instrument(engine: Engine) -> PoolMetrics:
+    """Count engine's pool events under its pool logging name."""
+    name = engine.pool.logging_name
+    if not name:
+        raise ValueError("instrumented engines need a pool_logging_name")
+    metrics = _metrics[name] = PoolMetrics()
+    _engines[name] = engine
+    event.listen(engine, "connect", metrics.on_connect)
+    event.listen(engine, "checkout", metrics.on_checkout)
+    event.listen(engine, "checkin", metrics.on_checkin)
+    event.listen(engine, "invalidate", metrics.on_invalidate)
+    event.listen(engine, "soft_invalidate", metrics.on_soft_invalidate)
+    return metrics
+
+
+def pool_stats() -> dict[str, dict[str, Any]]:
+    """Current state and counters of every instrumented pool, by name."""
+    return {
+        name: metrics.stats(_engines[name].pool) for name, metrics in _metrics.items()
+    }
@@ -0,0 +1,65 @@
+"""Read-replica routing — reads to the replica, writes to the primary.
+
+RoutingSession is the session class behind SessionLocal (and behind
+AsyncSessionLocal's sync session). Given a replica engine, it sends a
+statement to the primary when the session is inside transaction(), is
+flushing, or the statement writes or locks (INSERT/UPDATE/DELETE, SELECT …
+FOR UPDATE, raw SQL); everything else goes to the replica.
+
+Once a session has used the primary it stays there. A session lives for one
+request, so a request reads its own writes, even though the replica lags
+behind the primary. Reads whose result outlives the request, such as cache
+fills, call use_primary() first. Without a replica, it behaves exactly
+like Session.
+"""
+
+from typing import Any
+
+from sqlalchemy import Select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+from sqlalchemy.sql.elements import ClauseElement, TextClause
+
+from src.infrastructure.persistence.transaction import in_transaction
+
+
+def _writes(clause: ClauseElement | None) -> bool:
+    if isinstance(clause, (UpdateBase, TextClause)):
+        return True
+    return isinstance(clause, Select) and clause._for_update_arg is not None
+
+
+class RoutingSession(Session):
+    def __init__(self, *args: Any, replica: Engine | None = None, **kw: Any) -> None:
+        super().__init__(*args, **kw)
+        self.replica = replica
+
+    def get_bind(
+        self,
+        mapper: Any = None,
+        *,
+        clause: ClauseElement | None = None,
+        **kw: Any,
+    ) -> Engine | Connection:
+        if self.replica is None or self.uses_primary(clause):
+            return super().get_bind(mapper, clause=clause, **kw)
+        return self.replica
+
+    def uses_primary(self, clause: ClauseElement | None = None) -> bool:
+        """True once this session has had to write (sticky), or must now."""
+        if self.info.get("_primary"):
+            return True
+        if self._flushing or in_transaction(self) or _writes(clause):
+            self.info["_primary"] = True
+            return True
+        return False
+
+
+def use_primary(db_session: Session) -> None:
+    """Send the rest of this session's work to the primary.
+
+    For reads that must not lag behind writes made by other requests,
+    typically before caching what they return.
+    """
+    db_session.info["_primary"] = True
@@ -1,22 +1,45 @@
 """Database session management.
 
-Production-ready engine configuration with connection pool health checks.
+Production-ready engine configuration with connection pool health checks,
+pool sizing from settings and pool metrics (see pool_metrics.py). Sessions
+read from the replica, when one is configured (see routing.py).
 Session lifecycle follows FastAPI dependency injection pattern.
 """
 
 from collections.abc import Generator
 
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine
 from sqlalchemy.orm import Session, sessionmaker
 
+from src.infrastructure.persistence.pool_metrics import instrument, pool_options
+from src.infrastructure.persistence.routing import RoutingSession
 from src.shared.config import settings
 
 engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,
     pool_recycle=1800,
+    **pool_options("primary"),
+)
+instrument(engine)
+
+replica_engine: Engine | None = None
+if settings.REPLICA_DATABASE_URL:
+    replica_engine = create_engine(
+        settings.REPLICA_DATABASE_URL,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        **pool_options("replica"),
+    )
+    instrument(replica_engine)
+
+SessionLocal = sessionmaker(
+    class_=RoutingSession,
+    autocommit=False,
+    autoflush=False,
+    bind=engine,
+    replica=replica_engine,
 )
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
 def get_db() -> Generator[Session, None, None]:
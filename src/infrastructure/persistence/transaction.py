@@ -26,3 +26,8 @@ def transaction(db_session: Session) -> Generator[Session, None, None]:
         raise
     finally:
         db_session.info.pop("_in_transaction", None)
+
+
+def in_transaction(db_session: Session) -> bool:
+    """True when called inside a transaction() block owned by an outer caller."""
+    return bool(db_session.info.get("_in_transaction"))
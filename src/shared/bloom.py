@@ -0,0 +1,69 @@
+"""Bloom filter — compact, probabilistic set membership for strings.
+
+Answers "definitely absent" or "possibly present": there are no false
+negatives, and false positives occur at roughly the error rate it was sized
+for, as long as no more than capacity items are added. Items cannot be
+removed.
+
+Usage:
+    from src.shared.bloom import BloomFilter
+    seen = BloomFilter(capacity=100_000, error_rate=0.01)
+    seen.add("token")
+    "token" in seen  # True
+"""
+
+import hashlib
+import math
+import threading
+from collections.abc import Iterator
+
+
+class BloomFilter:
+    """Bit-array Bloom filter using double hashing over one BLAKE2b digest."""
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        # Optimal sizing: m = -n·ln(p) / ln(2)², k = m/n · ln(2).
+        self._size = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.hash_count = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+        self._count = 0
+        # Setting a bit is a read-modify-write of its byte; concurrent adds
+        # must not lose each other's bits, or the filter would answer
+        # "absent" for an item that was added.
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of items added (duplicates included)."""
+        return self._count
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the bit array in bytes."""
+        return len(self._bits)
+
+    def _positions(self, item: str) -> Iterator[int]:
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self._size for i in range(self.hash_count))
+
+    def add(self, item: str) -> None:
+        positions = list(self._positions(item))
+        with self._lock:
+            for position in positions:
+                self._bits[position >> 3] |= 1 << (position & 7)
+            self._count += 1
+
+    def __contains__(self, item: object) -> bool:
+        if not isinstance(item, str):
+            return False
+        bits = self._bits
+        return all(bits[p >> 3] & (1 << (p & 7)) for p in self._positions(item))
@@ -0,0 +1,86 @@
+"""In-process LRU cache with per-entry time-to-live.
+
+Bounded by entry count (least recently used entries are evicted first) and
+by age (entries older than ttl seconds are treated as missing). Thread-safe,
+so it can be shared by the request threads of one worker process.
+
+Each worker process holds its own copy: invalidation reaches only the
+process that performed the write, the TTL bounds staleness everywhere else.
+
+Usage:
+    from src.shared.cache import TTLCache
+    cache: TTLCache[int, str] = TTLCache(maxsize=1024, ttl=60)
+    value = cache.get_or_load(key, load)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Least-recently-used cache whose entries expire ttl seconds after being set."""
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, key: K) -> tuple[bool, V | None]:
+        """Return (found, value); a found value may legitimately be None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[1]
+
+    def set(self, key: K, value: V) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock() + self._ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_load(self, key: K, load: Callable[[], V]) -> V:
+        """Return the cached value, calling load() and caching its result on a miss.
+
+        load() runs outside the lock; concurrent misses on one key may each
+        load it once, the last result wins.
+        """
+        found, value = self.lookup(key)
+        if found:
+            return value  # type: ignore[return-value]
+        value = load()
+        self.set(key, value)
+        return value
+
+    def invalidate(self, *keys: K) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -34,6 +34,24 @@ class Settings(BaseSettings):
     POSTGRES_PORT: str = "5432"
     POSTGRES_DB: str = "tdd"
 
+    # Optional streaming read replica (same credentials and database). When
+    # set, reads outside transaction() go to it; see persistence/routing.py.
+    POSTGRES_REPLICA_SERVER: str = ""
+    POSTGRES_REPLICA_PORT: str = ""
+
+    # Connection pool, per engine and per worker process. Each worker runs a
+    # sync and an async engine per database (primary, replica), so a
+    # deployment can open up to
+    #   workers × 2 × (DB_POOL_SIZE + DB_MAX_OVERFLOW)
+    # connections to each — keep that below its max_connections. DB_POOL_TIMEOUT
+    # is how long a request waits for a free connection before failing;
+    # DB_POOL_USE_LIFO reuses the most recent connection, letting idle ones
+    # be closed by server-side timeouts. Watch /metrics → db_pool.
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_USE_LIFO: bool = False
+
     # Sentry (optional)
     SENTRY_ENABLED: bool = False
     SENTRY_DSN: str = ""
@@ -65,18 +83,65 @@ class Settings(BaseSettings):
     # Use: celery worker --pool=$CELERY_WORKER_POOL
     CELERY_WORKER_POOL: str = "prefork"
 
+    # "Who did I draw" cache (per worker process): max entries, seconds to live.
+    SECRET_FRIEND_CACHE_SIZE: int = 10_000
+    SECRET_FRIEND_CACHE_TTL: float = 300.0
+
+    # Invite link token filter (per worker process): unknown tokens get a 404
+    # without a database round trip. False-positive rate of the Bloom filter,
+    # minimum number of tokens it is sized for, and the minimum seconds
+    # between catch-up queries for tokens created by other processes.
+    LINK_FILTER_ERROR_RATE: float = 0.01
+    LINK_FILTER_MIN_CAPACITY: int = 100_000
+    LINK_FILTER_SYNC_INTERVAL: float = 1.0
+
     # LLM / MCP
     OPENAI_API_KEY: str = ""
     LLM_MODEL: str = "gpt-4o-mini"
     LLM_TEMPERATURE: float = 0.0
     MCP_SERVERS_PATH: str | None = None
 
+    def _postgres_url(self, scheme: str, server: str, port: str) -> str:
+        return (
+            f"{scheme}://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}"
+            f"@{server}:{port}/{self.POSTGRES_DB}"
+        )
+
     @computed_field  # type: ignore[prop-decorator]
     @property
     def DATABASE_URL(self) -> str:
-        return (
-            f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}"
-            f"@{self.POSTGRES_SERVER}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
+        return self._postgres_url(
+            "postgresql", self.POSTGRES_SERVER, self.POSTGRES_PORT
+        )
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def ASYNC_DATABASE_URL(self) -> str:
+        """Same database through asyncpg, for the async API routes."""
+        return self._postgres_url(
+            "postgresql+asyncpg", self.POSTGRES_SERVER, self.POSTGRES_PORT
+        )
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def REPLICA_DATABASE_URL(self) -> str | None:
+        if not self.POSTGRES_REPLICA_SERVER:
+            return None
+        return self._postgres_url(
+            "postgresql",
+            self.POSTGRES_REPLICA_SERVER,
+            self.POSTGRES_REPLICA_PORT or self.POSTGRES_PORT,
+        )
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def ASYNC_REPLICA_DATABASE_URL(self) -> str | None:
+        if not self.POSTGRES_REPLICA_SERVER:
+            return None
+        return self._postgres_url(
+            "postgresql+asyncpg",
+            self.POSTGRES_REPLICA_SERVER,
+            self.POSTGRES_REPLICA_PORT or self.POSTGRES_PORT,
         )
 
 
@@ -1,3 +1,12 @@
+import asyncio
+import csv
+import io
+import json
+import threading
+
+import httpx
+
+
 def test_create_group_returns_201(client):
     response = client.post(
         "/groups",
@@ -49,12 +58,179 @@ def test_list_groups_response_contains_groups_key(client):
 
 
 def test_list_groups_includes_created_group(client):
-    client.post("/groups", json={"name": "Listed Group", "description": "d"})
-    response = client.get("/groups")
+    created = client.post(
+        "/groups", json={"name": "Listed Group", "description": "d"}
+    ).json()
+    # Lists are paginated by id; start the page right before the new row.
+    response = client.get("/groups", params={"after": created["id"] - 1})
     names = [g["name"] for g in response.json()["groups"]]
     assert "Listed Group" in names
 
 
+def test_list_groups_paginates_with_after_cursor(client):
+    created = [
+        client.post("/groups", json={"name": f"Page {i}", "description": "d"}).json()
+        for i in range(3)
+    ]
+    after = created[0]["id"] - 1
+
+    first = client.get("/groups", params={"limit": 2, "after": after}).json()
+    second = client.get(
+        "/groups", params={"limit": 2, "after": first["next_after"]}
+    ).json()
+
+    assert [g["id"] for g in first["groups"]] == [c["id"] for c in created[:2]]
+    assert second["groups"][0]["id"] == created[2]["id"]
+
+
+def test_list_groups_limit_out_of_range_returns_422(client):
+    assert client.get("/groups", params={"limit": 0}).status_code == 422
+    assert client.get("/groups", params={"limit": 1001}).status_code == 422
+
+
+def test_list_groups_streams_ndjson_when_asked(client):
+    created = [
+        client.post("/groups", json={"name": f"Stream {i}", "description": "d"}).json()
+        for i in range(3)
+    ]
+
+    response = client.get(
+        "/groups",
+        params={"after": created[0]["id"] - 1},
+        headers={"Accept": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [g["id"] for g in lines] == [c["id"] for c in created]
+
+
+def test_list_group_summaries_counts_participants(client):
+    group = client.post("/groups", json={"name": "Counted", "description": "d"}).json()
+    for name in ("Ann", "Ben", "Cid"):
+        client.post("/participants", json={"name": name, "group_id": group["id"]})
+    client.post(f"/secret-friends/{group['id']}/draw")
+    empty = client.post("/groups", json={"name": "Empty", "description": "d"}).json()
+
+    response = client.get("/groups/summaries", params={"after": group["id"] - 1})
+
+    assert response.status_code == 200
+    summaries = {s["id"]: s for s in response.json()["groups"]}
+    assert summaries[group["id"]] == {
+        "id": group["id"],
+        "name": "Counted",
+        "category": "santa",
+        "participant_count": 3,
+        "revealed_count": 3,
+    }
+    assert summaries[empty["id"]]["participant_count"] == 0
+
+
+def _bulk_url(client) -> tuple[dict, str]:
+    group = client.post(
+        "/groups", json={"name": "Bulk Group", "description": "d"}
+    ).json()
+    return group, f"/groups/{group['id']}/participants:bulk"
+
+
+def test_bulk_create_participants_from_csv(client):
+    group, url = _bulk_url(client)
+    body = 'name,gift_hint\nAnn,books\n"Doe, Jane","wine\nred"\nBen,\n'
+
+    response = client.post(url, content=body, headers={"Content-Type": "text/csv"})
+
+    assert response.status_code == 201
+    assert response.json() == {"group_id": group["id"], "created": 3}
+    members = client.get(f"/groups/{group['id']}").json()["participants"]
+    assert sorted(m["name"] for m in members) == ["Ann", "Ben", "Doe, Jane"]
+
+
+def test_bulk_create_participants_from_streamed_ndjson(client):
+    group, url = _bulk_url(client)
+
+    def body():
+        for i in range(2500):
+            yield json.dumps({"name": f"P{i}"}).encode() + b"\n"
+
+    response = client.post(
+        url, content=body(), headers={"Content-Type": "application/x-ndjson"}
+    )
+
+    assert response.status_code == 201
+    assert response.json()["created"] == 2500
+
+
+def test_bulk_create_participants_rejects_the_whole_upload_on_a_bad_row(client):
+    group, url = _bulk_url(client)
+    body = '{"name": "Ann"}\n{"gift_hint": "no name"}\n'
+
+    response = client.post(
+        url, content=body, headers={"Content-Type": "application/x-ndjson"}
+    )
+
+    assert response.status_code == 422
+    assert "Record 2" in response.json()["detail"][0]["msg"]
+    assert client.get(f"/groups/{group['id']}").json()["participants"] == []
+
+
+def test_bulk_create_participants_unsupported_media_type_returns_415(client):
+    _, url = _bulk_url(client)
+    response = client.post(url, json=[{"name": "Ann"}])
+    assert response.status_code == 415
+
+
+def test_bulk_create_participants_nonexistent_group_returns_404(client):
+    response = client.post(
+        "/groups/99999/participants:bulk",
+        content="name\nAnn\n",
+        headers={"Content-Type": "text/csv"},
+    )
+    assert response.status_code == 404
+
+
+def test_export_group_streams_ndjson_with_draws(client):
+    group = _drawn_group(client, 3)
+
+    response = client.get(f"/groups/{group['id']}/export")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert len(rows) == 3
+    names = {r["participant_name"] for r in rows}
+    assert names == {"P0", "P1", "P2"}
+    assert {r["gift_receiver_name"] for r in rows} == names
+    assert all(r["group_name"] == "Drawn Group" for r in rows)
+
+
+def test_export_group_streams_csv_when_asked(client):
+    group = client.post(
+        "/groups", json={"name": "Csv Group", "description": "d"}
+    ).json()
+    client.post("/participants", json={"name": "Ann", "group_id": group["id"]})
+
+    response = client.get(
+        f"/groups/{group['id']}/export", headers={"Accept": "text/csv"}
+    )
+
+    assert response.headers["content-type"].startswith("text/csv")
+    header, row = list(csv.reader(io.StringIO(response.text)))
+    assert header[:5] == [
+        "group_id",
+        "group_name",
+        "category",
+        "participant_id",
+        "participant_name",
+    ]
+    assert row[1] == "Csv Group" and row[4] == "Ann"
+    assert row[-1] == ""
+
+
+def test_export_group_nonexistent_returns_404(client):
+    assert client.get("/groups/99999/export").status_code == 404
+
+
 def test_get_group_by_id_returns_200(client):
     created = client.post(
         "/groups", json={"name": "Fetch Group", "description": "d"}
@@ -99,6 +275,53 @@ def test_get_group_by_link_url_nonexistent_returns_404(client):
     assert response.status_code == 404
 
 
+def test_guessed_link_tokens_are_refused_without_sql(client, sql_statements):
+    client.get("/groups/link/first-guess")  # builds the filter
+    sql_statements.clear()
+
+    for i in range(20):
+        assert client.get(f"/groups/link/guess-{i}").status_code == 404
+
+    assert sql_statements == []
+
+
+def test_link_of_group_created_after_filter_build_is_found(client):
+    client.get("/groups/link/first-guess")  # builds the filter
+    created = client.post(
+        "/groups", json={"name": "Late Link Group", "description": "d"}
+    ).json()
+
+    response = client.get(f"/groups/link/{created['link_url']}")
+    assert response.json()["id"] == created["id"]
+
+
+def test_concurrent_link_lookups_on_one_event_loop_all_return(client):
+    """Cold and catch-up filter loads must not block the loop they run on."""
+    from src.app_main import api
+
+    created = client.post(
+        "/groups", json={"name": "Busy Link Group", "description": "d"}
+    ).json()
+    paths = [f"/groups/link/{created['link_url']}"] * 4 + ["/groups/link/guess"] * 4
+    statuses: list[int] = []
+
+    async def _lookups() -> None:
+        transport = httpx.ASGITransport(app=api)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://testserver/api/v1"
+        ) as http:
+            responses = await asyncio.gather(*(http.get(path) for path in paths))
+        statuses.extend(response.status_code for response in responses)
+
+    # A deadlock blocks the loop's thread for good: watch it from outside.
+    loop_thread = threading.Thread(target=asyncio.run, args=(_lookups(),), daemon=True)
+    loop_thread.start()
+    loop_thread.join(timeout=10)
+
+    assert not loop_thread.is_alive(), "link lookups deadlocked"
+    assert statuses == [200] * 4 + [404] * 4
+
+
 def test_update_group_returns_200(client):
     created = client.post(
         "/groups", json={"name": "Patch Group", "description": "d"}
@@ -148,3 +371,262 @@ def test_delete_group_verify_not_found_after_delete(client):
     client.delete(f"/groups/{created['id']}")
     response = client.get(f"/groups/{created['id']}")
     assert response.status_code == 404
+
+
+def test_delete_drawn_group_issues_the_same_statements_at_any_size(
+    client, sql_statements
+):
+    counts = []
+    for size in (3, 30):
+        group = _drawn_group(client, size)
+        sql_statements.clear()
+
+        assert client.delete(f"/groups/{group['id']}").status_code == 204
+        counts.append(len(sql_statements))
+
+    # One DELETE of the group (the database cascades to participants and
+    # draws) and the counter row — no participant is loaded.
+    assert counts == [2, 2]
+
+
+def test_background_delete_returns_202_and_hides_the_group(client):
+    group = _drawn_group(client, 3)
+
+    response = client.delete(f"/groups/{group['id']}", params={"background": True})
+
+    assert response.status_code == 202
+    assert client.get(f"/groups/{group['id']}").status_code == 404
+    assert client.delete(f"/groups/{group['id']}").status_code == 404
+
+
+def test_clone_group_returns_201_with_the_copied_member_count(client):
+    group = _drawn_group(client, 4)
+
+    response = client.post(f"/groups/{group['id']}/clone", json={"name": "Round Two"})
+
+    assert response.status_code == 201
+    clone = response.json()
+    assert clone["name"] == "Round Two"
+    assert clone["participant_count"] == 4
+    assert clone["lineage_id"] == group["id"]
+    members = client.get(f"/groups/{clone['id']}").json()["participants"]
+    assert sorted(m["name"] for m in members) == ["P0", "P1", "P2", "P3"]
+
+
+def test_clone_group_without_a_body_keeps_the_name(client):
+    group = _drawn_group(client, 2)
+
+    clone = client.post(f"/groups/{group['id']}/clone").json()
+
+    assert clone["name"] == group["name"]
+
+
+def test_clone_group_nonexistent_returns_404(client):
+    assert client.post("/groups/99999/clone").status_code == 404
+
+
+def _drawn_group(client, size: int) -> dict:
+    group = client.post(
+        "/groups", json={"name": "Drawn Group", "description": "d"}
+    ).json()
+    for i in range(size):
+        client.post("/participants", json={"name": f"P{i}", "group_id": group["id"]})
+    client.post(f"/secret-friends/{group['id']}/draw")
+    return group
+
+
+def test_list_group_secret_friends_returns_names(client):
+    group = _drawn_group(client, 3)
+
+    response = client.get(f"/groups/{group['id']}/secret-friends")
+
+    assert response.status_code == 200
+    pairs = response.json()["secret_friends"]
+    assert len(pairs) == 3
+    assert {p["gift_giver_name"] for p in pairs} == {"P0", "P1", "P2"}
+    assert all(p["gift_giver_name"] != p["gift_receiver_name"] for p in pairs)
+    assert response.json()["next_after"] is None
+
+
+def test_list_group_secret_friends_paginates_with_after_cursor(client):
+    group = _drawn_group(client, 5)
+    url = f"/groups/{group['id']}/secret-friends"
+
+    first = client.get(url, params={"limit": 2}).json()
+    second = client.get(url, params={"limit": 2, "after": first["next_after"]}).json()
+    third = client.get(url, params={"limit": 2, "after": second["next_after"]}).json()
+
+    ids = [p["id"] for page in (first, second, third) for p in page["secret_friends"]]
+    assert len(ids) == 5
+    assert ids == sorted(set(ids))
+    assert third["next_after"] is None
+
+
+def test_list_group_secret_friends_of_undrawn_group_is_empty(client):
+    group = client.post(
+        "/groups", json={"name": "Undrawn Group", "description": "d"}
+    ).json()
+
+    response = client.get(f"/groups/{group['id']}/secret-friends")
+
+    assert response.status_code == 200
+    assert response.json() == {"secret_friends": [], "next_after": None}
+
+
+def test_list_group_secret_friends_nonexistent_group_returns_404(client):
+    response = client.get("/groups/99999/secret-friends")
+    assert response.status_code == 404
+
+
+def test_get_group_stats_returns_maintained_counters(client):
+    group = _drawn_group(client, 3)
+    client.post("/participants", json={"name": "Late", "group_id": group["id"]})
+
+    response = client.get(f"/groups/{group['id']}/stats")
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "group_id": group["id"],
+        "participant_count": 4,
+        "revealed_count": 3,
+    }
+
+
+def test_get_group_stats_nonexistent_group_returns_404(client):
+    response = client.get("/groups/99999/stats")
+    assert response.status_code == 404
+
+
+# ── Conditional GET ──────────────────────────────────────────────────────────
+
+
+def test_get_group_returns_an_etag(client):
+    created = client.post("/groups", json={"name": "ETag Group", "description": "d"})
+    response = client.get(f"/groups/{created.json()['id']}")
+    assert response.headers["etag"].startswith('"')
+
+
+def test_get_group_with_matching_etag_returns_304_from_one_statement(
+    client, sql_statements
+):
+    created = client.post(
+        "/groups", json={"name": "Cached Group", "description": "d"}
+    ).json()
+    etag = client.get(f"/groups/{created['id']}").headers["etag"]
+    sql_statements.clear()
+
+    response = client.get(f"/groups/{created['id']}", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert len(sql_statements) == 1
+
+
+def test_group_etag_changes_when_the_group_or_its_members_change(client):
+    created = client.post(
+        "/groups", json={"name": "Changing Group", "description": "d"}
+    ).json()
+    url = f"/groups/{created['id']}"
+    first = client.get(url).headers["etag"]
+
+    client.patch(url, json={"name": "Changed Group"})
+    second = client.get(url).headers["etag"]
+    client.post("/participants", json={"name": "New", "group_id": created["id"]})
+    third = client.get(url).headers["etag"]
+
+    assert len({first, second, third}) == 3
+    assert client.get(url, headers={"If-None-Match": first}).status_code == 200
+
+
+def test_get_group_with_etag_for_missing_group_returns_404(client):
+    response = client.get("/groups/99999", headers={"If-None-Match": '"x"'})
+    assert response.status_code == 404
+
+
+def test_list_groups_with_matching_etag_returns_304(client):
+    created = client.post(
+        "/groups", json={"name": "Listed ETag Group", "description": "d"}
+    ).json()
+    params = {"after": created["id"] - 1}
+    etag = client.get("/groups", params=params).headers["etag"]
+
+    unchanged = client.get("/groups", params=params, headers={"If-None-Match": etag})
+    client.post("/groups", json={"name": "Another Group", "description": "d"})
+    changed = client.get("/groups", params=params, headers={"If-None-Match": etag})
+
+    assert unchanged.status_code == 304
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+
+def test_list_groups_etag_depends_on_the_page(client):
+    first = client.get("/groups", params={"limit": 1}).headers["etag"]
+    second = client.get("/groups", params={"limit": 2}).headers["etag"]
+    assert first != second
+
+
+# ── Statement budgets ────────────────────────────────────────────────────────
+
+
+def test_create_group_issues_a_single_statement(client, sql_statements):
+    client.post("/groups", json={"name": "Budget Group", "description": "d"})
+    assert len(sql_statements) <= 1
+
+
+def test_update_group_issues_at_most_two_statements(client, sql_statements):
+    created = client.post(
+        "/groups", json={"name": "Budget Update", "description": "d"}
+    ).json()
+    sql_statements.clear()
+
+    client.patch(f"/groups/{created['id']}", json={"name": "Budget Updated"})
+
+    # UPDATE … RETURNING, plus loading participants for the response body.
+    assert len(sql_statements) <= 2
+
+
+def test_list_group_secret_friends_issues_a_single_statement(client, sql_statements):
+    group = _drawn_group(client, 4)
+    sql_statements.clear()
+
+    client.get(f"/groups/{group['id']}/secret-friends")
+
+    assert len(sql_statements) == 1
+
+
+def test_list_groups_loads_participants_in_one_extra_statement(client, sql_statements):
+    for i in range(3):
+        group = client.post(
+            "/groups", json={"name": f"Eager {i}", "description": "d"}
+        ).json()
+        client.post("/participants", json={"name": "P", "group_id": group["id"]})
+    sql_statements.clear()
+
+    client.get("/groups", params={"limit": 1000})
+
+    # Page version for the ETag, the page, then all its participants at once.
+    assert len(sql_statements) == 3
+
+
+def test_get_group_stats_issues_a_single_statement(client, sql_statements):
+    group = _drawn_group(client, 4)
+    sql_statements.clear()
+
+    client.get(f"/groups/{group['id']}/stats")
+
+    assert len(sql_statements) == 1
+
+
+def test_list_group_summaries_issues_a_single_statement(client, sql_statements):
+    client.get("/groups/summaries")
+    assert len(sql_statements) == 1
+
+
+def test_export_group_issues_two_statements(client, sql_statements):
+    group = _drawn_group(client, 4)
+    sql_statements.clear()
+
+    client.get(f"/groups/{group['id']}/export")
+
+    # Existence check, then the single joined export query.
+    assert len(sql_statements) == 2
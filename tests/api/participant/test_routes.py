@@ -1,3 +1,6 @@
+import json
+
+
 def _create_group(client, name: str = "Test Group") -> dict:
     return client.post("/groups", json={"name": name, "description": "desc"}).json()
 
@@ -49,8 +52,9 @@ def test_list_participants_response_contains_participants_key(client):
 
 def test_list_participants_includes_created_participant(client):
     group = _create_group(client, "List Group")
-    _create_participant(client, group["id"], "Listed Person")
-    response = client.get("/participants")
+    created = _create_participant(client, group["id"], "Listed Person")
+    # Lists are paginated by id; start the page right before the new row.
+    response = client.get("/participants", params={"after": created["id"] - 1})
     names = [p["name"] for p in response.json()["participants"]]
     assert "Listed Person" in names
 
@@ -62,6 +66,36 @@ def test_get_participant_by_id_returns_200(client):
     assert response.status_code == 200
 
 
+def test_list_participants_paginates_with_after_cursor(client):
+    group = _create_group(client, "Paged Group")
+    created = [_create_participant(client, group["id"], f"P{i}") for i in range(3)]
+    after = created[0]["id"] - 1
+
+    first = client.get("/participants", params={"limit": 2, "after": after}).json()
+    last = client.get(
+        "/participants", params={"limit": 2, "after": first["next_after"]}
+    ).json()
+
+    assert [p["id"] for p in first["participants"]] == [c["id"] for c in created[:2]]
+    assert [p["id"] for p in last["participants"]] == [created[2]["id"]]
+    assert last["next_after"] is None
+
+
+def test_list_participants_streams_ndjson_when_asked(client):
+    group = _create_group(client, "Streamed Group")
+    created = [_create_participant(client, group["id"], f"P{i}") for i in range(3)]
+
+    response = client.get(
+        "/participants",
+        params={"after": created[0]["id"] - 1},
+        headers={"Accept": "application/x-ndjson"},
+    )
+
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [p["id"] for p in lines] == [c["id"] for c in created]
+
+
 def test_get_participant_by_id_returns_correct_participant(client):
     group = _create_group(client, "ID Group")
     participant = _create_participant(client, group["id"], "Correct")
@@ -124,3 +158,214 @@ def test_delete_participant_verify_not_found_after_delete(client):
     client.delete(f"/participants/{participant['id']}")
     response = client.get(f"/participants/{participant['id']}")
     assert response.status_code == 404
+
+
+def test_get_drawn_secret_friend_returns_the_assignment(client):
+    group = _create_group(client, "Drawn Group")
+    alice = _create_participant(client, group["id"], "Alice")
+    bob = _create_participant(client, group["id"], "Bob")
+    client.post(f"/secret-friends/{group['id']}/{alice['id']}")
+
+    response = client.get(f"/participants/{alice['id']}/secret-friend")
+
+    assert response.status_code == 200
+    assert response.json()["gift_receiver_id"] == bob["id"]
+
+
+def test_get_drawn_secret_friend_before_drawing_returns_404(client):
+    group = _create_group(client, "Undrawn Group")
+    alice = _create_participant(client, group["id"], "Alice")
+
+    response = client.get(f"/participants/{alice['id']}/secret-friend")
+
+    assert response.status_code == 404
+
+
+def test_get_drawn_secret_friend_nonexistent_participant_returns_404(client):
+    response = client.get("/participants/99999/secret-friend")
+    assert response.status_code == 404
+
+
+# ── Statement budgets ────────────────────────────────────────────────────────
+
+
+def test_create_participant_issues_at_most_three_statements(client, sql_statements):
+    group = _create_group(client, "Budget Group")
+    sql_statements.clear()
+
+    _create_participant(client, group["id"], "Budget")
+
+    # Group existence check, the INSERT — no post-flush refresh — and the
+    # participant counter upsert.
+    assert len(sql_statements) <= 3
+
+
+def test_update_participant_issues_a_single_statement(client, sql_statements):
+    group = _create_group(client, "Budget Update Group")
+    participant = _create_participant(client, group["id"], "Budget")
+    sql_statements.clear()
+
+    client.patch(f"/participants/{participant['id']}", json={"gift_hint": "tea"})
+
+    assert len(sql_statements) <= 1
+
+
+def test_batch_update_applies_changes_to_every_id(client):
+    group = _create_group(client, "Batch Group")
+    ids = [_create_participant(client, group["id"], n)["id"] for n in ("A", "B")]
+
+    response = client.patch(
+        "/participants:batch", json={"ids": ids, "changes": {"gift_hint": "mugs"}}
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"updated": 2, "participant_ids": ids}
+    hints = [client.get(f"/participants/{i}").json()["gift_hint"] for i in ids]
+    assert hints == ["mugs", "mugs"]
+
+
+def test_batch_update_applies_per_participant_changes(client):
+    group = _create_group(client, "Mixed Batch Group")
+    a, b = (_create_participant(client, group["id"], n)["id"] for n in ("A", "B"))
+
+    response = client.patch(
+        "/participants:batch",
+        json={"updates": [{"id": a, "name": "Ava"}, {"id": b, "gift_hint": "pens"}]},
+    )
+
+    assert response.status_code == 200
+    assert client.get(f"/participants/{a}").json()["name"] == "Ava"
+    assert client.get(f"/participants/{b}").json()["gift_hint"] == "pens"
+
+
+def test_batch_update_with_unknown_id_returns_404_and_changes_nothing(client):
+    group = _create_group(client, "Partial Batch Group")
+    known = _create_participant(client, group["id"], "Known")["id"]
+
+    response = client.patch(
+        "/participants:batch", json={"ids": [known, 99999], "changes": {"name": "X"}}
+    )
+
+    assert response.status_code == 404
+    assert client.get(f"/participants/{known}").json()["name"] == "Known"
+
+
+def test_batch_update_with_both_forms_returns_422(client):
+    response = client.patch(
+        "/participants:batch",
+        json={
+            "ids": [1],
+            "changes": {"name": "X"},
+            "updates": [{"id": 1, "name": "Y"}],
+        },
+    )
+    assert response.status_code == 422
+
+
+def test_batch_update_statements_do_not_grow_with_the_batch(client, sql_statements):
+    group = _create_group(client, "Batch Budget Group")
+    ids = [_create_participant(client, group["id"], f"P{i}")["id"] for i in range(20)]
+    sql_statements.clear()
+
+    client.patch(
+        "/participants:batch", json={"ids": ids, "changes": {"gift_hint": "tea"}}
+    )
+
+    # Lock-and-read of the previous statuses, then the one UPDATE.
+    assert len(sql_statements) <= 2
+
+
+def test_repeat_drawn_secret_friend_reads_issue_no_statements(client, sql_statements):
+    group = _create_group(client, "Cached Group")
+    alice = _create_participant(client, group["id"], "Alice")
+    _create_participant(client, group["id"], "Bob")
+    client.post(f"/secret-friends/{group['id']}/{alice['id']}")
+    client.get(f"/participants/{alice['id']}/secret-friend")
+    sql_statements.clear()
+
+    response = client.get(f"/participants/{alice['id']}/secret-friend")
+
+    assert response.status_code == 200
+    assert sql_statements == []
+
+
+# ── Conditional GET ──────────────────────────────────────────────────────────
+
+
+def test_get_participant_with_matching_etag_returns_304_from_one_statement(
+    client, sql_statements
+):
+    group = _create_group(client, "ETag Group")
+    participant = _create_participant(client, group["id"], "Etta")
+    url = f"/participants/{participant['id']}"
+    etag = client.get(url).headers["etag"]
+    sql_statements.clear()
+
+    response = client.get(url, headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert len(sql_statements) == 1
+
+
+def test_participant_etag_changes_after_an_update(client):
+    group = _create_group(client, "ETag Update Group")
+    participant = _create_participant(client, group["id"], "Etta")
+    url = f"/participants/{participant['id']}"
+    etag = client.get(url).headers["etag"]
+
+    client.patch(url, json={"gift_hint": "socks"})
+    response = client.get(url, headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.json()["gift_hint"] == "socks"
+    assert response.headers["etag"] != etag
+
+
+def test_get_participant_with_etag_for_missing_participant_returns_404(client):
+    response = client.get("/participants/99999", headers={"If-None-Match": '"x"'})
+    assert response.status_code == 404
+
+
+def test_list_participants_with_matching_etag_returns_304(client):
+    group = _create_group(client, "ETag List Group")
+    participant = _create_participant(client, group["id"], "Listed")
+    params = {"after": participant["id"] - 1}
+    etag = client.get("/participants", params=params).headers["etag"]
+
+    unchanged = client.get(
+        "/participants", params=params, headers={"If-None-Match": etag}
+    )
+    client.patch(f"/participants/{participant['id']}", json={"name": "Renamed"})
+    changed = client.get(
+        "/participants", params=params, headers={"If-None-Match": etag}
+    )
+
+    assert unchanged.status_code == 304
+    assert changed.status_code == 200
+
+
+def test_streamed_participant_list_has_its_own_etag(client):
+    paged = client.get("/participants").headers["etag"]
+    streamed = client.get(
+        "/participants", headers={"Accept": "application/x-ndjson"}
+    ).headers["etag"]
+    assert paged != streamed
+
+
+def test_members_of_a_group_being_deleted_read_as_gone(client):
+    group = _create_group(client, "Fading Group")
+    kept = _create_participant(client, group["id"], "Kept")
+    gone = _create_participant(client, group["id"], "Gone")
+    client.delete(f"/groups/{group['id']}", params={"background": True})
+
+    assert client.get(f"/participants/{gone['id']}").status_code == 404
+    assert client.get(f"/participants/{gone['id']}/secret-friend").status_code == 404
+    page = client.get("/participants", params={"after": kept["id"] - 1, "limit": 2})
+    assert page.json()["participants"] == []
+    patch = client.patch(f"/participants/{gone['id']}", json={"name": "Back"})
+    assert patch.status_code == 404
+    batch = client.patch(
+        "/participants:batch", json={"ids": [gone["id"]], "changes": {"name": "Back"}}
+    )
+    assert batch.status_code == 404
+    assert client.delete(f"/participants/{gone['id']}").status_code == 404
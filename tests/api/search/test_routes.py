@@ -0,0 +1,47 @@
+def test_search_returns_ranked_hits(client):
+    group = client.post(
+        "/groups", json={"name": "Marzipan Lovers", "description": "d"}
+    ).json()
+    client.post("/participants", json={"name": "Marzia", "group_id": group["id"]})
+
+    response = client.get("/search", params={"q": "marz"})
+
+    assert response.status_code == 200
+    hits = response.json()["hits"]
+    assert {(h["kind"], h["name"]) for h in hits} >= {
+        ("group", "Marzipan Lovers"),
+        ("participant", "Marzia"),
+    }
+    assert [h["score"] for h in hits] == sorted(
+        (h["score"] for h in hits), reverse=True
+    )
+
+
+def test_search_filters_by_kind(client):
+    client.post("/groups", json={"name": "Kumquat Crew", "description": "d"})
+
+    response = client.get("/search", params={"q": "kumquat", "kind": "participant"})
+
+    assert all(h["kind"] == "participant" for h in response.json()["hits"])
+
+
+def test_search_with_short_query_returns_422(client):
+    response = client.get("/search", params={"q": "ab"})
+    assert response.status_code == 422
+
+
+def test_search_with_limit_above_maximum_returns_422(client):
+    response = client.get("/search", params={"q": "abc", "limit": 101})
+    assert response.status_code == 422
+
+
+def test_search_leaves_out_members_of_groups_being_deleted(client):
+    group = client.post(
+        "/groups", json={"name": "Quince Club", "description": "d"}
+    ).json()
+    client.post("/participants", json={"name": "Quincy", "group_id": group["id"]})
+    client.delete(f"/groups/{group['id']}", params={"background": True})
+
+    response = client.get("/search", params={"q": "quinc"})
+
+    assert response.json()["hits"] == []
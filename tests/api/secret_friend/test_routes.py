@@ -104,3 +104,105 @@ def test_get_secret_friend_returns_correct_fields(client):
     assert "id" in data
     assert "gift_giver_id" in data
     assert "gift_receiver_id" in data
+
+
+def test_draw_secret_friends_returns_200(client):
+    group = _create_group(client, "Draw Group")
+    for name in ("Ann", "Ben", "Cid"):
+        _create_participant(client, group["id"], name)
+
+    response = client.post(f"/secret-friends/{group['id']}/draw")
+    assert response.status_code == 200
+
+
+def test_draw_secret_friends_links_every_participant(client):
+    group = _create_group(client, "Full Draw Group")
+    ids = sorted(
+        _create_participant(client, group["id"], name)["id"]
+        for name in ("Ann", "Ben", "Cid", "Dee")
+    )
+
+    response = client.post(f"/secret-friends/{group['id']}/draw")
+    links = response.json()["secret_friends"]
+    assert sorted(sf["gift_giver_id"] for sf in links) == ids
+    assert sorted(sf["gift_receiver_id"] for sf in links) == ids
+
+
+def test_draw_secret_friends_marks_participants_revealed(client):
+    group = _create_group(client, "Reveal Draw Group")
+    p1 = _create_participant(client, group["id"], "Ann")
+    _create_participant(client, group["id"], "Ben")
+
+    client.post(f"/secret-friends/{group['id']}/draw")
+    response = client.get(f"/participants/{p1['id']}")
+    assert response.json()["status"] == "REVEALED"
+
+
+def test_draw_secret_friends_with_only_one_participant_returns_422(client):
+    group = _create_group(client, "Solo Draw Group")
+    _create_participant(client, group["id"], "Lonely")
+
+    response = client.post(f"/secret-friends/{group['id']}/draw")
+    assert response.status_code == 422
+
+
+def test_draw_secret_friends_honours_exclusions(client):
+    group = _create_group(client, "Rules Draw Group")
+    a, b, c = (
+        _create_participant(client, group["id"], name)["id"]
+        for name in ("Ann", "Ben", "Cid")
+    )
+
+    response = client.post(
+        f"/secret-friends/{group['id']}/draw", json={"exclusions": [[a, b]]}
+    )
+    receiver_of = {
+        sf["gift_giver_id"]: sf["gift_receiver_id"]
+        for sf in response.json()["secret_friends"]
+    }
+    assert receiver_of == {a: c, c: b, b: a}
+
+
+def test_draw_secret_friends_with_impossible_exclusions_returns_422(client):
+    group = _create_group(client, "Impossible Draw Group")
+    a, b = (
+        _create_participant(client, group["id"], name)["id"] for name in ("Ann", "Ben")
+    )
+
+    response = client.post(
+        f"/secret-friends/{group['id']}/draw", json={"exclusions": [[a, b]]}
+    )
+    assert response.status_code == 422
+
+
+# ── Statement budgets ────────────────────────────────────────────────────────
+
+
+def test_assign_secret_friend_issues_at_most_six_statements(client, sql_statements):
+    group = _create_group(client, "Budget Group")
+    giver = _create_participant(client, group["id"], "Giver")
+    _create_participant(client, group["id"], "Receiver")
+    sql_statements.clear()
+
+    client.post(f"/secret-friends/{group['id']}/{giver['id']}")
+
+    # Lock, participant check, receiver pick, upsert, reveal, revealed counter.
+    assert len(sql_statements) <= 6
+
+
+def test_groups_being_deleted_cannot_be_drawn_and_their_links_read_as_gone(client):
+    group = _create_group(client, "Vanishing Group")
+    giver = _create_participant(client, group["id"], "Vanishing Giver")
+    _create_participant(client, group["id"], "Vanishing Receiver")
+    link = client.post(f"/secret-friends/{group['id']}/{giver['id']}").json()
+    client.delete(f"/groups/{group['id']}", params={"background": True})
+
+    assert client.post(f"/secret-friends/{group['id']}/draw").status_code == 404
+    assert (
+        client.post(f"/secret-friends/{group['id']}/{giver['id']}").status_code == 404
+    )
+    link_id = link["secret_friends"]["id"]
+    assert client.get(f"/secret-friends/{link_id}").status_code == 404
+    assert client.delete(f"/secret-friends/{link_id}").status_code == 404
+    pairs = client.get(f"/groups/{group['id']}/secret-friends")
+    assert pairs.status_code == 404
@@ -0,0 +1,45 @@
+"""Tests for the conditional GET helpers in src/api/conditional.py."""
+
+import pytest
+from starlette.requests import Request
+
+from src.api.conditional import if_none_match, make_etag, not_modified
+
+
+def _request(if_none_match_header: str | None = None) -> Request:
+    headers = []
+    if if_none_match_header is not None:
+        headers.append((b"if-none-match", if_none_match_header.encode()))
+    return Request({"type": "http", "method": "GET", "headers": headers})
+
+
+def test_make_etag_is_a_quoted_strong_tag_stable_per_parts() -> None:
+    etag = make_etag("group", 1, "2026-01-01")
+
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == make_etag("group", 1, "2026-01-01")
+    assert etag != make_etag("group", 1, "2026-01-02")
+    assert etag != make_etag("participant", 1, "2026-01-01")
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (None, False),
+        ('"other"', False),
+        ('"tag"', True),
+        ('"other", "tag"', True),
+        ('W/"tag"', True),
+        ("*", True),
+    ],
+)
+def test_if_none_match(header: str | None, expected: bool) -> None:
+    assert if_none_match(_request(header), '"tag"') is expected
+
+
+def test_not_modified_has_no_body_and_repeats_the_etag() -> None:
+    response = not_modified('"tag"')
+
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == '"tag"'
@@ -34,7 +34,7 @@ def test_business_rule_error_returns_422_with_detail(client):
     participant = client.post(
         "/participants", json={"name": "Lone Wolf", "group_id": group["id"]}
     ).json()
-    # Only one participant — BusinessRuleError is raised by sort_secret_friends
+    # Only one participant — BusinessRuleError is raised by SecretFriendService.assign
     response = client.post(f"/secret-friends/{group['id']}/{participant['id']}")
     assert response.status_code == 422
     assert response.json()["detail"][0]["msg"] != ""
@@ -6,3 +6,31 @@ def test_healthcheck_returns_200(client):
 def test_healthcheck_returns_ok_status(client):
     response = client.get("/healthcheck")
     assert response.json() == {"status": "ok"}
+
+
+def test_metrics_reports_link_filter_footprint(client):
+    client.get("/groups/link/some-token")  # builds the filter
+
+    link_filter = client.get("/metrics").json()["link_filter"]
+
+    assert link_filter["built"] is True
+    assert link_filter["bytes"] > 0
+    assert link_filter["rejected"] >= 1
+    assert {"tokens", "stale", "capacity", "error_rate", "hash_count"} <= set(
+        link_filter
+    )
+
+
+def test_metrics_reports_connection_pools(client):
+    db_pool = client.get("/metrics").json()["db_pool"]
+
+    assert {"primary", "primary_async"} <= set(db_pool)
+    assert {
+        "size",
+        "max_overflow",
+        "checked_out",
+        "overflow",
+        "wait_seconds_max",
+        "timeouts",
+        "invalidations",
+    } <= set(db_pool["primary"])
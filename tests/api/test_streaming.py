@@ -0,0 +1,61 @@
+"""Tests for the NDJSON helpers in src/api/streaming.py."""
+
+import json
+
+import pytest
+from pydantic import BaseModel
+
+from src.api.streaming import (
+    iter_lines,
+    ndjson_lines,
+    parse_records,
+    validate_records,
+)
+from src.shared.exceptions import BusinessRuleError
+
+
+class _Item(BaseModel):
+    id: int
+
+
+def test_ndjson_lines_writes_one_object_per_line_in_bounded_chunks() -> None:
+    chunks = list(ndjson_lines(_Item(id=i) for i in range(600)))
+
+    assert len(chunks) == 3
+    lines = b"".join(chunks).decode().splitlines()
+    assert [json.loads(line)["id"] for line in lines] == list(range(600))
+
+
+def test_ndjson_lines_of_nothing_yields_nothing() -> None:
+    assert list(ndjson_lines([])) == []
+
+
+def test_iter_lines_reassembles_lines_and_characters_split_across_chunks() -> None:
+    data = "first\nsecönd\nlast".encode()
+    chunks = [data[i : i + 3] for i in range(0, len(data), 3)]
+
+    assert list(iter_lines(chunks)) == ["first\n", "secönd\n", "last"]
+
+
+def test_iter_lines_rejects_runaway_lines() -> None:
+    with pytest.raises(BusinessRuleError, match="longer than"):
+        list(iter_lines([b"x" * 70_000]))
+
+
+def test_parse_records_reads_csv_with_header_and_drops_empty_cells() -> None:
+    lines = ["name,gift_hint\r\n", '"Doe, Jane","multi\n', 'line"\n', "Ben,\n"]
+
+    assert list(parse_records(lines, "text/csv")) == [
+        {"name": "Doe, Jane", "gift_hint": "multi\nline"},
+        {"name": "Ben"},
+    ]
+
+
+def test_parse_records_reports_the_bad_ndjson_line() -> None:
+    with pytest.raises(BusinessRuleError, match="Line 2: invalid JSON"):
+        list(parse_records(['{"id": 1}\n', "{oops\n"], "application/x-ndjson"))
+
+
+def test_validate_records_names_the_failing_record_and_field() -> None:
+    with pytest.raises(BusinessRuleError, match="Record 2: id"):
+        list(validate_records([{"id": 1}, {"id": "x"}], _Item))
@@ -1,40 +1,80 @@
 from unittest.mock import AsyncMock, patch
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool, StaticPool
 from fastapi.testclient import TestClient
 
-from src.infrastructure.persistence import Base, get_db
+from src.infrastructure.persistence import Base, get_async_db, get_db
 from src.domain.group.repository import GroupRepository
 from src.domain.group.schemas import GroupCreate
 from src.domain.participant.repository import ParticipantRepository
 from src.domain.participant.schemas import ParticipantCreate
+from src.domain.group.link_filter import link_tokens
+from src.domain.secret_friend import cache as secret_friend_cache
 
 # Import models so Base.metadata knows all tables
 from src.domain.group.model import Group  # noqa: F401
 from src.domain.participant.model import Participant  # noqa: F401
 from src.domain.secret_friend.model import SecretFriend  # noqa: F401
 
-TEST_DATABASE_URL = "sqlite:///:memory:"
+# A named, shared-cache in-memory database: the sync engine and the aiosqlite
+# engine behind the async routes open separate connections to the same data.
+TEST_DATABASE = "file:santa_test?mode=memory&cache=shared&uri=true"
+TEST_DATABASE_URL = f"sqlite:///{TEST_DATABASE}"
+TEST_ASYNC_DATABASE_URL = f"sqlite+aiosqlite:///{TEST_DATABASE}"
+
+
+def _enforce_foreign_keys(dbapi_connection, connection_record):
+    dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+
+@pytest.fixture(autouse=True)
+def clear_secret_friend_cache():
+    """Rolled-back tests reuse ids — never let a cached read cross tests."""
+    secret_friend_cache.by_giver.clear()
+    yield
+    secret_friend_cache.by_giver.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_link_filter():
+    """Rolled-back tests leave their tokens behind — rebuild per test."""
+    link_tokens.reset()
+    yield
+    link_tokens.reset()
 
 
 @pytest.fixture(scope="session")
 def engine():
-    # StaticPool ensures all connections share the same in-memory SQLite
-    # database — required so that tables created here are visible to sessions
-    # opened inside the FastAPI request handlers during integration tests.
+    # StaticPool keeps one connection open for the whole session, which is
+    # what keeps the shared in-memory database (and its tables) alive.
     _engine = create_engine(
         TEST_DATABASE_URL,
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
+    event.listen(_engine, "connect", _enforce_foreign_keys)
     Base.metadata.create_all(_engine)
     yield _engine
     Base.metadata.drop_all(_engine)
 
 
+@pytest.fixture(scope="session")
+def async_engine(engine):
+    """aiosqlite engine on the same database, for the async routes.
+
+    NullPool: TestClient runs each request on its own event loop, and an
+    aiosqlite connection must not outlive the loop it was opened on.
+    """
+    _engine = create_async_engine(TEST_ASYNC_DATABASE_URL, poolclass=NullPool)
+    event.listen(_engine.sync_engine, "connect", _enforce_foreign_keys)
+    yield _engine
+    _engine.sync_engine.dispose()
+
+
 @pytest.fixture(scope="function")
 def db_session(engine) -> Session:
     """Each test runs in a transaction that is rolled back on teardown."""
@@ -48,8 +88,23 @@ def db_session(engine) -> Session:
 
 
 @pytest.fixture
-def client(engine):
-    """FastAPI test client with a dedicated SQLite session per request.
+def sql_statements(engine, async_engine) -> list[str]:
+    """Records every SQL statement the test engines send to the database."""
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    for _engine in (engine, async_engine.sync_engine):
+        event.listen(_engine, "before_cursor_execute", _record)
+    yield statements
+    for _engine in (engine, async_engine.sync_engine):
+        event.remove(_engine, "before_cursor_execute", _record)
+
+
+@pytest.fixture
+def client(engine, async_engine):
+    """FastAPI test client with dedicated SQLite sessions per request.
 
     The routes live on the `api` sub-application (mounted at /api/v1).
     dependency_overrides must be applied on `api`, not on the outer `app`.
@@ -67,7 +122,14 @@ def client(engine):
         finally:
             db.close()
 
+    TestingAsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False)
+
+    async def override_get_async_db():
+        async with TestingAsyncSessionLocal() as db:
+            yield db
+
     api.dependency_overrides[get_db] = override_get_db
+    api.dependency_overrides[get_async_db] = override_get_async_db
     with (
         patch("src.app_main.init_agents_registry", new_callable=AsyncMock),
         patch("src.app_main.shutdown_agents", new_callable=AsyncMock),
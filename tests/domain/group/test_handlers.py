@@ -102,3 +102,23 @@ def test_relay_group_deleted_dispatches_task(db_session: Session) -> None:
             )
         finally:
             group_deleted.disconnect(_relay_group_deleted)
+
+
+def test_relay_group_purge_dispatches_only_for_background_deletes(
+    db_session: Session,
+) -> None:
+    kept = GroupService.create(
+        GroupCreate(name="Right Away", description="d"), db_session
+    )
+    later = GroupService.create(GroupCreate(name="Later", description="d"), db_session)
+
+    with patch("src.domain.group.handlers.task_relays.dispatch_task") as mock_dispatch:
+        from src.domain.group.handlers.task_relays import _relay_group_purge
+
+        group_deleted.connect(_relay_group_purge)
+        try:
+            GroupService.delete(kept.id, db_session)
+            GroupService.delete(later.id, db_session, background=True)
+            mock_dispatch.assert_called_once_with("groups.purge", group_id=later.id)
+        finally:
+            group_deleted.disconnect(_relay_group_purge)
@@ -0,0 +1,180 @@
+"""Tests for the invite link token filter."""
+
+import threading
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.domain.group.link_filter import LinkTokenFilter, link_tokens
+from src.domain.group.repository import GroupRepository
+from src.domain.group.schemas import GroupCreate
+from src.domain.group.service import GroupService
+from src.shared.exceptions import NotFoundError
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _filter(clock: _Clock, min_capacity: int = 1_000) -> LinkTokenFilter:
+    return LinkTokenFilter(
+        error_rate=0.01, min_capacity=min_capacity, sync_interval=1.0, clock=clock
+    )
+
+
+def test_existing_tokens_pass_and_unknown_ones_are_refused(
+    db_session: Session, group_fixture
+):
+    group = group_fixture()
+    tokens = _filter(_Clock())
+
+    assert tokens.might_exist(group.link_url, db_session=db_session)
+    assert not tokens.might_exist("guessed-token", db_session=db_session)
+    assert tokens.rejected == 1
+
+
+def test_refusals_within_the_sync_interval_issue_no_sql(
+    db_session: Session, group_fixture, sql_statements
+):
+    group_fixture()
+    clock = _Clock()
+    tokens = _filter(clock)
+    tokens.rebuild(db_session)
+
+    clock.now = 0.5
+    sql_statements.clear()
+    for i in range(100):
+        assert not tokens.might_exist(f"guess-{i}", db_session=db_session)
+
+    assert sql_statements == []
+
+
+def test_tokens_created_by_another_process_are_found_after_catch_up(
+    db_session: Session, group_fixture, sql_statements
+):
+    clock = _Clock()
+    tokens = _filter(clock)
+    tokens.rebuild(db_session)
+    # Created without the filter hearing about it, as in another worker.
+    group = group_fixture()
+
+    assert not tokens.might_exist(group.link_url, db_session=db_session)
+
+    clock.now = 1.0
+    sql_statements.clear()
+    assert tokens.might_exist(group.link_url, db_session=db_session)
+    assert len(sql_statements) == 1
+
+
+def test_created_groups_are_added_by_the_signal_handler(db_session: Session):
+    link_tokens.rebuild(db_session)
+    before = link_tokens.stats()["tokens"]
+
+    created = GroupService.create(
+        GroupCreate(name="Signal Group", description="d"), db_session
+    )
+
+    assert link_tokens.stats()["tokens"] == before + 1
+    assert created.link_url is not None
+    assert (
+        GroupService.get_by_link_url(
+            link_url=created.link_url, db_session=db_session
+        ).id
+        == created.id
+    )
+
+
+def test_deleted_groups_are_counted_as_stale_until_rebuild(
+    db_session: Session, group_fixture
+):
+    link_tokens.rebuild(db_session)
+    GroupService.delete(group_id=group_fixture().id, db_session=db_session)
+
+    assert link_tokens.stats()["stale"] == 1
+    link_tokens.rebuild(db_session)
+    assert link_tokens.stats()["stale"] == 0
+
+
+def test_filter_is_rebuilt_once_stale_tokens_fill_it(db_session: Session):
+    clock = _Clock()
+    tokens = _filter(clock)
+    tokens.rebuild(db_session)
+    for _ in range(tokens.stats()["capacity"]):
+        tokens.discard()
+
+    clock.now = 1.0
+    tokens.might_exist("guessed-token", db_session=db_session)
+
+    assert tokens.stats()["stale"] == 0
+
+
+def test_concurrent_discards_are_all_counted(db_session: Session):
+    tokens = _filter(_Clock())
+    tokens.rebuild(db_session)
+
+    def _discard_many() -> None:
+        for _ in range(10_000):
+            tokens.discard()
+
+    threads = [threading.Thread(target=_discard_many) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert tokens.stats()["stale"] == 80_000
+
+
+def test_deletions_during_a_rebuild_stay_stale(
+    db_session: Session, group_fixture, monkeypatch
+):
+    group_fixture()
+    tokens = _filter(_Clock())
+    stream_link_tokens = GroupRepository.stream_link_tokens
+
+    def _interleaved(db_session: Session, after: int | None = None):
+        tokens.discard()  # a group deleted while the tokens stream in
+        yield from stream_link_tokens(db_session=db_session, after=after)
+
+    monkeypatch.setattr(GroupRepository, "stream_link_tokens", _interleaved)
+    tokens.discard()
+    tokens.rebuild(db_session)
+
+    assert tokens.stats()["stale"] == 1
+
+
+def test_service_refuses_unknown_tokens_without_querying_groups(
+    db_session: Session, sql_statements
+):
+    link_tokens.rebuild(db_session)
+    sql_statements.clear()
+
+    with pytest.raises(NotFoundError):
+        GroupService.get_by_link_url(link_url="guessed", db_session=db_session)
+
+    assert not any("FROM groups" in s and "link_url =" in s for s in sql_statements)
+
+
+def test_lookups_during_a_rebuild_do_not_wait_for_it(
+    db_session: Session, group_fixture, monkeypatch
+):
+    group_fixture()
+    tokens = _filter(_Clock())
+    stream_link_tokens = GroupRepository.stream_link_tokens
+    during: list[bool] = []
+
+    def _interleaved(db_session: Session, after: int | None = None):
+        # What another request on the same event loop does mid-query.
+        during.append(tokens.might_exist("unknown-token", db_session=db_session))
+        tokens.add("created-during-rebuild")
+        yield from stream_link_tokens(db_session=db_session, after=after)
+
+    monkeypatch.setattr(GroupRepository, "stream_link_tokens", _interleaved)
+    tokens.rebuild(db_session)
+
+    assert during == [True]  # let through to the database, not blocked
+    assert tokens.might_exist("created-during-rebuild", db_session=db_session)
@@ -1,8 +1,11 @@
 import pytest
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from src.domain.group.repository import GroupRepository
 from src.domain.group.schemas import GroupCreate, GroupUpdate
+from src.domain.participant.model import Participant
+from src.domain.secret_friend.model import SecretFriend
 from src.shared.exceptions import NotFoundError
 
 
@@ -117,3 +120,69 @@ def test_delete_group_removes_from_db(db_session: Session):
 def test_delete_group_not_found_raises(db_session: Session):
     with pytest.raises(NotFoundError):
         GroupRepository.delete(group_id=99999, db_session=db_session)
+
+
+def _member_count(group_id: int, db_session: Session) -> int:
+    stmt = select(func.count(Participant.id)).where(Participant.group_id == group_id)
+    return db_session.scalar(stmt) or 0
+
+
+def test_delete_group_cascades_to_participants_and_their_draws(
+    db_session: Session, group_fixture, participant_fixture
+):
+    group = group_fixture()
+    giver = participant_fixture(group=group, name="Giver")
+    receiver = participant_fixture(group=group, name="Receiver")
+    db_session.add(SecretFriend(gift_giver_id=giver.id, gift_receiver_id=receiver.id))
+    db_session.flush()
+
+    GroupRepository.delete(group_id=group.id, db_session=db_session)
+
+    assert _member_count(group.id, db_session) == 0
+    draws = select(func.count(SecretFriend.id)).where(
+        SecretFriend.gift_giver_id == giver.id
+    )
+    assert db_session.scalar(draws) == 0
+
+
+def test_marked_group_reads_as_gone_until_purged(
+    db_session: Session, group_fixture, participant_fixture
+):
+    group = group_fixture()
+    for name in ("A", "B", "C"):
+        participant_fixture(group=group, name=name)
+
+    GroupRepository.mark_deleted(group_id=group.id, db_session=db_session)
+
+    with pytest.raises(NotFoundError):
+        GroupRepository.get_by_id(group_id=group.id, db_session=db_session)
+    with pytest.raises(NotFoundError):
+        GroupRepository.mark_deleted(group_id=group.id, db_session=db_session)
+    assert _member_count(group.id, db_session) == 3
+
+    purged = [
+        GroupRepository.purge_participants(
+            group_id=group.id, limit=2, db_session=db_session
+        )
+        for _ in range(3)
+    ]
+    assert purged == [2, 1, 0]
+    GroupRepository.delete_marked(group_id=group.id, db_session=db_session)
+    assert (
+        GroupRepository.get_deleted_at(group_id=group.id, db_session=db_session) is None
+    )
+
+
+def test_purge_participants_leaves_live_groups_alone(
+    db_session: Session, group_fixture, participant_fixture
+):
+    group = group_fixture()
+    participant_fixture(group=group)
+
+    assert (
+        GroupRepository.purge_participants(
+            group_id=group.id, limit=10, db_session=db_session
+        )
+        == 0
+    )
+    assert _member_count(group.id, db_session) == 1
@@ -1,9 +1,32 @@
+import tracemalloc
+
 import pytest
+from sqlalchemy import RowMapping, func, select
 from sqlalchemy.orm import Session
 
+from src.domain.group.repository import GroupRepository
 from src.domain.group.service import GroupService
-from src.domain.group.schemas import GroupCreate, GroupRead, GroupList, GroupUpdate
-from src.shared.exceptions import NotFoundError
+from src.domain.group.schemas import (
+    GroupClone,
+    GroupPurgeReport,
+    GROUP_EXPORT_COLUMNS,
+    GroupCreate,
+    GroupRead,
+    GroupList,
+    GroupUpdate,
+)
+from src.domain.participant.model import Participant
+from src.domain.participant.schemas import (
+    ParticipantBatchChange,
+    ParticipantBatchUpdate,
+    ParticipantCreate,
+    ParticipantImport,
+    ParticipantStatus,
+    ParticipantUpdate,
+)
+from src.domain.participant.service import ParticipantService
+from src.domain.secret_friend.service import SecretFriendService
+from src.shared.exceptions import BusinessRuleError, NotFoundError
 
 
 def test_create_returns_group_read_schema(db_session: Session):
@@ -69,6 +92,26 @@ def test_get_by_link_url_nonexistent_raises_not_found(db_session: Session):
         GroupService.get_by_link_url(link_url="does-not-exist", db_session=db_session)
 
 
+def test_get_version_changes_when_a_member_is_added(
+    db_session: Session, participant_fixture
+):
+    created = GroupService.create(
+        GroupCreate(name="Versioned Group", description="d"), db_session
+    )
+    before = GroupService.get_version(group_id=created.id, db_session=db_session)
+
+    participant_fixture(group=created)
+
+    assert GroupService.get_version(group_id=created.id, db_session=db_session) != (
+        before
+    )
+
+
+def test_get_version_nonexistent_raises_not_found(db_session: Session):
+    with pytest.raises(NotFoundError):
+        GroupService.get_version(group_id=99999, db_session=db_session)
+
+
 def test_update_group_returns_updated_data(db_session: Session):
     created = GroupService.create(
         GroupCreate(name="Update Service", description="desc"), db_session
@@ -86,3 +129,294 @@ def test_update_group_returns_updated_data(db_session: Session):
 def test_delete_group_not_found_raises(db_session: Session):
     with pytest.raises(NotFoundError):
         GroupService.delete(group_id=99999, db_session=db_session)
+
+
+# ── export ───────────────────────────────────────────────────────────────────
+
+
+def test_export_yields_plain_rows_without_orm_objects(db_session: Session):
+    group = GroupService.create(GroupCreate(name="Export", description="d"), db_session)
+    ParticipantService.bulk_create(
+        group_id=group.id,
+        rows=[ParticipantImport(name="Ann"), ParticipantImport(name="Ben")],
+        db_session=db_session,
+    )
+
+    rows = list(GroupService.export(group_id=group.id, db_session=db_session))
+
+    assert all(isinstance(r, RowMapping) for r in rows)
+    assert [tuple(r.keys()) for r in rows] == [GROUP_EXPORT_COLUMNS] * 2
+    assert [r["participant_name"] for r in rows] == ["Ann", "Ben"]
+
+
+def test_export_of_missing_group_raises_before_streaming(db_session: Session):
+    with pytest.raises(NotFoundError):
+        GroupService.export(group_id=99999, db_session=db_session)
+
+
+def test_export_memory_stays_bounded_for_large_groups(db_session: Session):
+    group = GroupService.create(GroupCreate(name="Large", description="d"), db_session)
+    ParticipantService.bulk_create(
+        group_id=group.id,
+        rows=(ParticipantImport(name=f"Person {i}") for i in range(20_000)),
+        db_session=db_session,
+    )
+
+    tracemalloc.start()
+    try:
+        count = sum(1 for _ in GroupService.export(group.id, db_session))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert count == 20_000
+    assert peak < 5_000_000
+
+
+# ── Member counters ──────────────────────────────────────────────────────────
+
+
+def _stats(group_id: int, db_session: Session) -> tuple[int, int]:
+    stats = GroupService.get_stats(group_id=group_id, db_session=db_session)
+    return stats.participant_count, stats.revealed_count
+
+
+def _group_with(names: list[str], db_session: Session) -> tuple[int, list[int]]:
+    group = GroupService.create(
+        GroupCreate(name="Counted", description="d"), db_session
+    )
+    ids = [
+        ParticipantService.create(
+            ParticipantCreate(name=name, group_id=group.id), db_session
+        ).id
+        for name in names
+    ]
+    return group.id, ids
+
+
+def test_stats_count_created_imported_and_deleted_participants(db_session: Session):
+    group_id, ids = _group_with(["Ann", "Ben"], db_session)
+    ParticipantService.bulk_create(
+        group_id=group_id,
+        rows=[ParticipantImport(name="Cid"), ParticipantImport(name="Dee")],
+        db_session=db_session,
+    )
+    ParticipantService.delete(participant_id=ids[0], db_session=db_session)
+
+    assert _stats(group_id, db_session) == (3, 0)
+
+
+def test_stats_count_each_reveal_once(db_session: Session):
+    group_id, ids = _group_with(["Ann", "Ben", "Cid"], db_session)
+
+    assignment = SecretFriendService.assign(
+        group_id=group_id, participant_id=ids[0], db_session=db_session
+    )
+    assert _stats(group_id, db_session) == (3, 1)
+
+    # Re-assigning an already revealed giver must not count them again.
+    SecretFriendService.delete(secret_friend_id=assignment.id, db_session=db_session)
+    SecretFriendService.assign(
+        group_id=group_id, participant_id=ids[0], db_session=db_session
+    )
+    assert _stats(group_id, db_session) == (3, 1)
+
+    SecretFriendService.draw_group(group_id=group_id, db_session=db_session)
+    assert _stats(group_id, db_session) == (3, 3)
+
+
+def test_stats_follow_status_edits_and_revealed_deletes(db_session: Session):
+    group_id, ids = _group_with(["Ann", "Ben", "Cid"], db_session)
+    SecretFriendService.draw_group(group_id=group_id, db_session=db_session)
+
+    ParticipantService.update(
+        participant_id=ids[1],
+        payload=ParticipantUpdate(status=ParticipantStatus.PENDING),
+        db_session=db_session,
+    )
+    ParticipantService.update(
+        participant_id=ids[2],
+        payload=ParticipantUpdate(status=ParticipantStatus.REVEALED, name="Cy"),
+        db_session=db_session,
+    )
+    assert _stats(group_id, db_session) == (3, 2)
+
+    ParticipantService.delete(participant_id=ids[0], db_session=db_session)
+    assert _stats(group_id, db_session) == (2, 1)
+
+
+def test_stats_follow_batch_status_updates(db_session: Session):
+    group_id, ids = _group_with(["Ann", "Ben", "Cid"], db_session)
+    SecretFriendService.assign(
+        group_id=group_id, participant_id=ids[0], db_session=db_session
+    )
+
+    ParticipantService.update_batch(
+        payload=ParticipantBatchUpdate(
+            ids=ids, changes=ParticipantUpdate(status=ParticipantStatus.REVEALED)
+        ),
+        db_session=db_session,
+    )
+    assert _stats(group_id, db_session) == (3, 3)
+
+    ParticipantService.update_batch(
+        payload=ParticipantBatchUpdate(
+            updates=[
+                ParticipantBatchChange(id=ids[0], status=ParticipantStatus.PENDING),
+                ParticipantBatchChange(id=ids[1], gift_hint="tea"),
+            ]
+        ),
+        db_session=db_session,
+    )
+    assert _stats(group_id, db_session) == (3, 2)
+
+
+def test_stats_follow_deleting_a_revealed_receiver(db_session: Session):
+    """The draw of whoever gave to a deleted participant cascades away too."""
+    group_id, ids = _group_with(["Ann", "Ben", "Cid"], db_session)
+    SecretFriendService.draw_group(group_id=group_id, db_session=db_session)
+
+    ParticipantService.delete(participant_id=ids[1], db_session=db_session)
+
+    assert _stats(group_id, db_session) == (2, 2)
+    page = SecretFriendService.get_pairs_by_group_id(
+        group_id=group_id, db_session=db_session, limit=10
+    )
+    assert all(
+        ids[1] not in (pair.gift_giver_id, pair.gift_receiver_id)
+        for pair in page.secret_friends
+    )
+    assert len(page.secret_friends) == 1
+
+
+def test_stats_of_missing_group_raise_not_found(db_session: Session):
+    with pytest.raises(NotFoundError):
+        GroupService.get_stats(group_id=99999, db_session=db_session)
+
+
+def test_reconcile_stats_repairs_drifted_and_missing_counters(
+    db_session: Session, participant_fixture
+):
+    drifted, _ = _group_with(["Ann", "Ben"], db_session)
+    GroupRepository.add_to_stats(
+        group_id=drifted, participants=5, revealed=1, db_session=db_session
+    )
+    # Written below the services: no counter row at all.
+    untracked = participant_fixture().group_id
+    correct, _ = _group_with(["Cid"], db_session)
+
+    report = GroupService.reconcile_stats(
+        db_session=db_session, batch_size=2, after_id=drifted - 1
+    )
+
+    assert report.groups_checked == 3
+    assert report.groups_repaired == 2
+    assert report.last_group_id == correct
+    assert _stats(drifted, db_session) == (2, 0)
+    assert _stats(untracked, db_session) == (1, 0)
+    again = GroupService.reconcile_stats(db_session=db_session, after_id=drifted - 1)
+    assert again.groups_repaired == 0
+
+
+# ── Background deletion ──────────────────────────────────────────────────────
+
+
+def _member_rows(group_id: int, db_session: Session) -> int:
+    stmt = select(func.count()).where(Participant.group_id == group_id)
+    return db_session.scalar(stmt) or 0
+
+
+def test_background_delete_hides_the_group_and_purge_removes_it(
+    db_session: Session,
+):
+    group_id, ids = _group_with(["Ann", "Ben", "Cid", "Dee", "Eve"], db_session)
+
+    GroupService.delete(group_id=group_id, db_session=db_session, background=True)
+
+    with pytest.raises(NotFoundError):
+        GroupService.get_by_id(group_id=group_id, db_session=db_session)
+    # Members read as gone with their group, but stay until the purge.
+    assert ParticipantService.get_by_group_id(group_id, db_session) == []
+    assert _member_rows(group_id, db_session) == 5
+
+    report = GroupService.purge(group_id=group_id, db_session=db_session, batch_size=2)
+
+    assert report == GroupPurgeReport(group_id=group_id, participants_purged=5)
+    assert _member_rows(group_id, db_session) == 0
+    again = GroupService.purge(group_id=group_id, db_session=db_session)
+    assert again.participants_purged == 0
+
+
+def test_purge_refuses_a_group_that_is_not_marked(db_session: Session):
+    group_id, _ = _group_with(["Ann"], db_session)
+
+    with pytest.raises(BusinessRuleError):
+        GroupService.purge(group_id=group_id, db_session=db_session)
+
+
+# ── Cloning ──────────────────────────────────────────────────────────────────
+
+
+def test_clone_copies_members_as_pending_into_a_new_linked_group(
+    db_session: Session,
+):
+    group_id, ids = _group_with(["Ann", "Ben", "Cid"], db_session)
+    ParticipantService.update(
+        participant_id=ids[0],
+        payload=ParticipantUpdate(gift_hint="books"),
+        db_session=db_session,
+    )
+    SecretFriendService.draw_group(group_id=group_id, db_session=db_session)
+    source = GroupService.get_by_id(group_id=group_id, db_session=db_session)
+
+    clone = GroupService.clone(group_id=group_id, db_session=db_session)
+
+    assert clone.id != group_id
+    assert (clone.name, clone.description) == (source.name, source.description)
+    assert clone.link_url and clone.link_url != source.link_url
+    assert (clone.lineage_id, clone.source_id) == (group_id, group_id)
+    members = ParticipantService.get_by_group_id(clone.id, db_session)
+    assert sorted((m.name, m.gift_hint) for m in members) == [
+        ("Ann", "books"),
+        ("Ben", None),
+        ("Cid", None),
+    ]
+    assert {m.status for m in members} == {ParticipantStatus.PENDING}
+    assert _stats(clone.id, db_session) == (3, 0)
+
+
+def test_clone_of_a_clone_stays_in_the_first_lineage(db_session: Session):
+    group_id, _ = _group_with(["Ann"], db_session)
+    first = GroupService.clone(group_id=group_id, db_session=db_session)
+
+    second = GroupService.clone(
+        group_id=first.id,
+        db_session=db_session,
+        payload=GroupClone(name="Next Year"),
+    )
+
+    assert second.lineage_id == group_id
+    assert second.name == "Next Year"
+
+
+def test_clone_of_a_missing_group_raises_not_found(db_session: Session):
+    with pytest.raises(NotFoundError):
+        GroupService.clone(group_id=99999, db_session=db_session)
+
+
+def test_clone_issues_the_same_statements_for_ten_thousand_members(
+    db_session: Session, sql_statements
+):
+    group_id, _ = _group_with([], db_session)
+    ParticipantService.bulk_create(
+        group_id=group_id,
+        rows=(ParticipantImport(name=f"P{i}") for i in range(10_000)),
+        db_session=db_session,
+    )
+    sql_statements.clear()
+
+    clone = GroupService.clone(group_id=group_id, db_session=db_session)
+
+    assert clone.participant_count == 10_000
+    # INSERT … SELECT for the group, another for its members, the counters.
+    assert len(sql_statements) == 3
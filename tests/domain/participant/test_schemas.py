@@ -2,6 +2,7 @@ import pytest
 from pydantic import ValidationError
 
 from src.domain.participant.schemas import (
+    ParticipantBatchUpdate,
     ParticipantStatus,
     ParticipantBase,
     ParticipantCreate,
@@ -105,3 +106,33 @@ def test_participant_update_all_none_values_raises():
 def test_participant_update_empty_dict_raises():
     with pytest.raises(ValidationError):
         ParticipantUpdate()
+
+
+# ── ParticipantBatchUpdate ────────────────────────────────────────────────────
+
+
+def test_participant_batch_update_accepts_ids_with_changes():
+    schema = ParticipantBatchUpdate(ids=[1, 2], changes={"status": "PENDING"})
+    assert schema.participant_ids == [1, 2]
+
+
+def test_participant_batch_update_accepts_per_participant_updates():
+    schema = ParticipantBatchUpdate(updates=[{"id": 3, "gift_hint": "tea"}])
+    assert schema.participant_ids == [3]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {},
+        {"ids": [1]},
+        {"changes": {"name": "A"}},
+        {"ids": [1], "changes": {"name": "A"}, "updates": [{"id": 1, "name": "A"}]},
+        {"ids": [1, 1], "changes": {"name": "A"}},
+        {"updates": [{"id": 1}]},
+        {"updates": []},
+    ],
+)
+def test_participant_batch_update_rejects_ambiguous_or_empty_batches(data):
+    with pytest.raises(ValidationError):
+        ParticipantBatchUpdate(**data)
@@ -1,15 +1,23 @@
+import tracemalloc
+
 import pytest
 from sqlalchemy.orm import Session
 
 from src.domain.participant.service import ParticipantService
 from src.domain.participant.schemas import (
+    ParticipantBatchChange,
+    ParticipantBatchResult,
+    ParticipantBatchUpdate,
     ParticipantCreate,
+    ParticipantImport,
+    ParticipantImportResult,
     ParticipantList,
     ParticipantRead,
     ParticipantUpdate,
     ParticipantStatus,
 )
-from src.shared.exceptions import NotFoundError
+from src.domain.participant.signals import participants_imported, participants_updated
+from src.shared.exceptions import BusinessRuleError, NotFoundError
 
 
 def test_create_returns_participant_read_schema(db_session: Session, group_fixture):
@@ -126,3 +134,168 @@ def test_update_nonexistent_participant_raises_not_found(db_session: Session):
 def test_delete_participant_not_found_raises(db_session: Session):
     with pytest.raises(NotFoundError):
         ParticipantService.delete(participant_id=99999, db_session=db_session)
+
+
+# ── bulk_create ──────────────────────────────────────────────────────────────
+
+
+def test_bulk_create_imports_rows_in_chunks_with_one_signal_each(
+    db_session: Session, group_fixture
+):
+    group = group_fixture()
+    announced: list[list[int]] = []
+
+    def _record(sender, *, participant_ids, **kwargs):
+        announced.append(participant_ids)
+
+    participants_imported.connect(_record)
+    try:
+        result = ParticipantService.bulk_create(
+            group_id=group.id,
+            rows=(ParticipantImport(name=f"P{i}") for i in range(5)),
+            db_session=db_session,
+            chunk_size=2,
+        )
+    finally:
+        participants_imported.disconnect(_record)
+
+    assert result == ParticipantImportResult(group_id=group.id, created=5)
+    assert [len(ids) for ids in announced] == [2, 2, 1]
+    members = ParticipantService.get_by_group_id(group.id, db_session)
+    assert sorted(m.id for m in members) == sorted(sum(announced, []))
+    assert {m.status for m in members} == {ParticipantStatus.PENDING}
+
+
+def test_bulk_create_into_missing_group_raises_not_found(db_session: Session):
+    with pytest.raises(NotFoundError):
+        ParticipantService.bulk_create(
+            group_id=99999, rows=[ParticipantImport(name="A")], db_session=db_session
+        )
+
+
+def test_bulk_create_memory_stays_bounded_by_the_chunk(
+    db_session: Session, group_fixture
+):
+    group = group_fixture()
+    rows = (ParticipantImport(name=f"Person {i}") for i in range(20_000))
+
+    tracemalloc.start()
+    try:
+        ParticipantService.bulk_create(
+            group_id=group.id, rows=rows, db_session=db_session
+        )
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # 20k materialized rows alone would take several times this.
+    assert peak < 5_000_000
+
+
+def test_get_version_changes_after_update(db_session: Session, group_fixture):
+    group = group_fixture()
+    created = ParticipantService.create(
+        ParticipantCreate(name="Versioned", group_id=group.id), db_session
+    )
+    before = ParticipantService.get_version(
+        participant_id=created.id, db_session=db_session
+    )
+
+    ParticipantService.update(
+        participant_id=created.id,
+        payload=ParticipantUpdate(gift_hint="tea"),
+        db_session=db_session,
+    )
+
+    assert (
+        ParticipantService.get_version(participant_id=created.id, db_session=db_session)
+        != before
+    )
+
+
+def test_get_version_nonexistent_raises_not_found(db_session: Session):
+    with pytest.raises(NotFoundError):
+        ParticipantService.get_version(participant_id=99999, db_session=db_session)
+
+
+# ── update_batch ─────────────────────────────────────────────────────────────
+
+
+def _members(group_id: int, db_session: Session) -> dict[int, ParticipantRead]:
+    db_session.expire_all()
+    return {p.id: p for p in ParticipantService.get_by_group_id(group_id, db_session)}
+
+
+def test_update_batch_applies_same_changes_to_every_id_with_one_signal(
+    db_session: Session, group_fixture, participant_fixture
+):
+    group = group_fixture()
+    ids = [participant_fixture(group=group, name=f"P{i}").id for i in range(3)]
+    announced: list[dict] = []
+
+    def _record(sender, **kwargs):
+        announced.append(kwargs)
+
+    participants_updated.connect(_record)
+    try:
+        result = ParticipantService.update_batch(
+            payload=ParticipantBatchUpdate(
+                ids=ids[:2], changes=ParticipantUpdate(gift_hint="socks")
+            ),
+            db_session=db_session,
+        )
+    finally:
+        participants_updated.disconnect(_record)
+
+    assert result == ParticipantBatchResult(updated=2, participant_ids=ids[:2])
+    assert len(announced) == 1
+    assert announced[0]["participant_ids"] == ids[:2]
+    members = _members(group.id, db_session)
+    assert [members[i].gift_hint for i in ids] == ["socks", "socks", None]
+    assert members[ids[0]].updated_at is not None
+
+
+def test_update_batch_applies_per_participant_changes(
+    db_session: Session, group_fixture, participant_fixture
+):
+    group = group_fixture()
+    first, second = (participant_fixture(group=group, name=n).id for n in "AB")
+
+    ParticipantService.update_batch(
+        payload=ParticipantBatchUpdate(
+            updates=[
+                ParticipantBatchChange(id=first, gift_hint="tea"),
+                ParticipantBatchChange(id=second, name="Bea", gift_hint="jam"),
+            ]
+        ),
+        db_session=db_session,
+    )
+
+    members = _members(group.id, db_session)
+    assert (members[first].name, members[first].gift_hint) == ("A", "tea")
+    assert (members[second].name, members[second].gift_hint) == ("Bea", "jam")
+
+
+def test_update_batch_without_changes_raises_business_rule_error(
+    db_session: Session, group_fixture, participant_fixture
+):
+    existing = participant_fixture(group=group_fixture()).id
+    # Skips the schema's validation, as a caller building it in code could.
+    payload = ParticipantBatchUpdate.model_construct(ids=[existing])
+
+    with pytest.raises(BusinessRuleError, match="ids and changes"):
+        ParticipantService.update_batch(payload=payload, db_session=db_session)
+
+
+def test_update_batch_with_a_missing_id_raises_not_found(
+    db_session: Session, group_fixture, participant_fixture
+):
+    existing = participant_fixture(group=group_fixture()).id
+
+    with pytest.raises(NotFoundError, match="99999"):
+        ParticipantService.update_batch(
+            payload=ParticipantBatchUpdate(
+                ids=[existing, 99999], changes=ParticipantUpdate(gift_hint="x")
+            ),
+            db_session=db_session,
+        )
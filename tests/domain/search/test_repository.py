@@ -0,0 +1,64 @@
+from unittest.mock import MagicMock
+
+from sqlalchemy import create_mock_engine, inspect
+from sqlalchemy.dialects import postgresql
+
+from src.domain.search.repository import SearchRepository
+from src.infrastructure.persistence import Base
+
+
+def _postgres_sql(search) -> str:
+    db_session = MagicMock()
+    db_session.get_bind.return_value.dialect.name = "postgresql"
+    search("quix", 10, db_session)
+    stmt = db_session.execute.call_args.args[0]
+    return str(stmt.compile(dialect=postgresql.psycopg2.dialect()))
+
+
+def test_postgres_group_search_uses_trigram_operators_and_ranking():
+    sql = _postgres_sql(SearchRepository.search_groups)
+
+    assert "groups.name ILIKE" in sql
+    assert "<%% groups.name" in sql
+    assert "ORDER BY word_similarity" in sql
+    assert "LIMIT" in sql
+
+
+def test_postgres_participant_search_uses_trigram_operators_and_ranking():
+    sql = _postgres_sql(SearchRepository.search_participants)
+
+    assert "participants.name ILIKE" in sql
+    assert "<%% participants.name" in sql
+    assert "ORDER BY word_similarity" in sql
+
+
+def test_create_all_builds_the_trigram_indexes_on_postgres():
+    statements: list[str] = []
+    engine = create_mock_engine(
+        "postgresql+psycopg2://",
+        lambda sql, *a, **kw: statements.append(
+            str(sql.compile(dialect=engine.dialect))
+        ),
+    )
+
+    Base.metadata.create_all(engine, checkfirst=False)
+
+    assert statements[0] == "CREATE EXTENSION IF NOT EXISTS pg_trgm"
+    assert (
+        "CREATE INDEX ix_groups_name_trgm ON groups USING gin (name gin_trgm_ops)"
+        in statements
+    )
+    assert (
+        "CREATE INDEX ix_participants_name_trgm ON participants "
+        "USING gin (name gin_trgm_ops)" in statements
+    )
+
+
+def test_trigram_indexes_are_postgres_only(engine):
+    indexes = {
+        index["name"]
+        for table in ("groups", "participants")
+        for index in inspect(engine).get_indexes(table)
+    }
+
+    assert not indexes & {"ix_groups_name_trgm", "ix_participants_name_trgm"}
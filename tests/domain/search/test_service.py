@@ -0,0 +1,60 @@
+import pytest
+from sqlalchemy.orm import Session
+
+from src.domain.search.schemas import SearchKind, SearchResults
+from src.domain.search.service import SearchService
+from src.shared.exceptions import BusinessRuleError
+
+
+def test_search_finds_groups_and_participants_by_partial_name(
+    db_session: Session, group_fixture, participant_fixture
+):
+    group = group_fixture(name="Quixotic Readers")
+    participant = participant_fixture(group=group, name="Quixby")
+
+    result = SearchService.search(q="quix", db_session=db_session)
+
+    assert isinstance(result, SearchResults)
+    hits = {(hit.kind, hit.id): hit for hit in result.hits}
+    assert hits[(SearchKind.group, group.id)].group_id == group.id
+    assert hits[(SearchKind.participant, participant.id)].group_id == group.id
+
+
+def test_search_ranks_closer_matches_first(db_session: Session, group_fixture):
+    group_fixture(name="Zanzibar Wine Tasting Society")
+    exact = group_fixture(name="Zanzibar")
+
+    result = SearchService.search(q="zanzibar", db_session=db_session)
+
+    assert result.hits[0].id == exact.id
+    scores = [hit.score for hit in result.hits]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_search_honours_kind_and_limit(
+    db_session: Session, group_fixture, participant_fixture
+):
+    group = group_fixture(name="Plover Club")
+    for i in range(3):
+        participant_fixture(group=group, name=f"Plover {i}")
+
+    result = SearchService.search(
+        q="plover", db_session=db_session, limit=2, kind=SearchKind.participant
+    )
+
+    assert len(result.hits) == 2
+    assert {hit.kind for hit in result.hits} == {SearchKind.participant}
+
+
+def test_search_treats_like_wildcards_literally(db_session: Session, group_fixture):
+    group = group_fixture(name="Ninety_9% Club")
+
+    assert [
+        h.id for h in SearchService.search(q="_9%", db_session=db_session).hits
+    ] == [group.id]
+    assert SearchService.search(q="%%%", db_session=db_session).hits == []
+
+
+def test_search_rejects_queries_too_short_for_the_index(db_session: Session):
+    with pytest.raises(BusinessRuleError):
+        SearchService.search(q=" ab ", db_session=db_session)
@@ -0,0 +1,177 @@
+"""Benchmarks for the secret friend assignment hot path.
+
+They assert that the statements sent to assign one participant do not grow
+with the size of the group, and that a whole-group draw loads member ids
+only. Wall-clock timings are reported through record_property, never
+asserted on.
+"""
+
+import statistics
+import time
+import tracemalloc
+
+import pytest
+from sqlalchemy import event, insert, select
+from sqlalchemy.orm import Session
+
+from src.domain.participant.model import Participant
+from src.domain.participant.service import ParticipantService
+from src.domain.secret_friend.service import SecretFriendService
+
+SMALL_GROUP = 10
+LARGE_GROUP = 5_000
+DRAW_GROUP = 10_000
+ASSIGNMENTS = 5
+
+
+def _populate_group(db_session: Session, group_fixture, size: int):
+    group = group_fixture()
+    db_session.execute(
+        insert(Participant),
+        [{"name": f"Member {i}", "group_id": group.id} for i in range(size)],
+    )
+    ids = db_session.scalars(
+        select(Participant.id).where(Participant.group_id == group.id)
+    ).all()
+    return group.id, list(ids)
+
+
+def _assign_each(db_session: Session, group_id: int, giver_ids: list[int]):
+    timings = []
+    for giver_id in giver_ids:
+        start = time.perf_counter()
+        SecretFriendService.assign(
+            group_id=group_id, participant_id=giver_id, db_session=db_session
+        )
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def test_assign_issues_the_same_statements_regardless_of_group_size(
+    db_session: Session, group_fixture, sql_statements
+):
+    small_id, small_ids = _populate_group(db_session, group_fixture, SMALL_GROUP)
+    large_id, large_ids = _populate_group(db_session, group_fixture, LARGE_GROUP)
+
+    sql_statements.clear()
+    _assign_each(db_session, small_id, small_ids[:1])
+    small_count = len(sql_statements)
+
+    sql_statements.clear()
+    _assign_each(db_session, large_id, large_ids[:1])
+    large_count = len(sql_statements)
+
+    assert large_count == small_count
+
+
+def test_assign_latency_is_reported_for_small_and_large_groups(
+    db_session: Session, group_fixture, record_property
+):
+    small_id, small_ids = _populate_group(db_session, group_fixture, SMALL_GROUP)
+    large_id, large_ids = _populate_group(db_session, group_fixture, LARGE_GROUP)
+
+    small = _assign_each(db_session, small_id, small_ids[:ASSIGNMENTS])
+    large = _assign_each(db_session, large_id, large_ids[:ASSIGNMENTS])
+
+    record_property(f"assign_median_ms_{SMALL_GROUP}", round(small * 1e3, 2))
+    record_property(f"assign_median_ms_{LARGE_GROUP}", round(large * 1e3, 2))
+
+
+@pytest.fixture
+def selects(engine):
+    """Records the (statement, parameters) of every SELECT the engine runs."""
+    recorded: list[tuple[str, object]] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            recorded.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", _record)
+    yield recorded
+    event.remove(engine, "before_cursor_execute", _record)
+
+
+def _result_bytes(db_session: Session, recorded) -> int:
+    """Replays recorded SELECTs and sums the text size of every value returned.
+
+    SQLite has no wire, so this stands in for bytes transferred: it grows
+    with both the row count and the number of columns selected.
+    """
+    cursor = db_session.connection().connection.cursor()
+    total = 0
+    for statement, parameters in recorded:
+        for row in cursor.execute(statement, parameters).fetchall():
+            total += sum(len(str(value)) for value in row if value is not None)
+    return total
+
+
+def _peak_allocated(load) -> int:
+    tracemalloc.start()
+    try:
+        load()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_member_id_query_selects_only_the_id_column(
+    db_session: Session, group_fixture, sql_statements
+):
+    group_id, ids = _populate_group(db_session, group_fixture, SMALL_GROUP)
+
+    sql_statements.clear()
+    result = ParticipantService.get_ids_by_group_id(
+        group_id=group_id, db_session=db_session
+    )
+
+    assert list(result) == sorted(ids)
+    assert result.itemsize == 8
+    assert len(sql_statements) == 1
+    select_list = sql_statements[0].split("FROM")[0]
+    assert select_list.count(",") == 0
+
+
+def test_draw_loads_member_ids_only(db_session: Session, group_fixture, sql_statements):
+    group_id, _ = _populate_group(db_session, group_fixture, SMALL_GROUP)
+
+    sql_statements.clear()
+    SecretFriendService.draw_group(group_id=group_id, db_session=db_session)
+
+    member_queries = [
+        s for s in sql_statements if s.lstrip().startswith("SELECT participants")
+    ]
+    assert member_queries
+    assert all(s.split("FROM")[0].count(",") == 0 for s in member_queries)
+
+
+def test_member_id_query_transfers_and_allocates_less_than_full_rows(
+    db_session: Session, group_fixture, selects, record_property
+):
+    group_id, _ = _populate_group(db_session, group_fixture, DRAW_GROUP)
+
+    def load_rows():
+        return ParticipantService.get_by_group_id(
+            group_id=group_id, db_session=db_session
+        )
+
+    def load_ids():
+        return ParticipantService.get_ids_by_group_id(
+            group_id=group_id, db_session=db_session
+        )
+
+    selects.clear()
+    load_rows()
+    rows_bytes = _result_bytes(db_session, list(selects))
+    selects.clear()
+    load_ids()
+    ids_bytes = _result_bytes(db_session, list(selects))
+
+    db_session.expunge_all()
+    rows_peak = _peak_allocated(load_rows)
+    db_session.expunge_all()
+    ids_peak = _peak_allocated(load_ids)
+
+    record_property("result_bytes", {"rows": rows_bytes, "ids": ids_bytes})
+    record_property("peak_alloc_bytes", {"rows": rows_peak, "ids": ids_peak})
+    assert ids_bytes * 3 < rows_bytes
+    assert ids_peak * 5 < rows_peak
@@ -0,0 +1,138 @@
+"""Concurrent assignment stress tests.
+
+Uses a file-backed SQLite database (the shared in-memory engine is a single
+connection) so every worker thread gets its own connection and transaction.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from src.domain.group.model import Group
+from src.domain.participant.model import Participant
+from src.domain.secret_friend.model import SecretFriend
+from src.domain.secret_friend.repository import SecretFriendRepository
+from src.domain.secret_friend.service import SecretFriendService
+from src.infrastructure.persistence import Base, transaction
+from src.shared.exceptions import ConflictError
+
+GROUP_SIZE = 250
+CONCURRENT_ASSIGNS = 200
+WORKERS = 16
+
+
+@pytest.fixture
+def file_session_factory(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'stress.db'}",
+        connect_args={"check_same_thread": False, "timeout": 30},
+    )
+    Base.metadata.create_all(engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine.dispose()
+
+
+def _seed_group(session_factory) -> tuple[int, list[int]]:
+    with session_factory() as session:
+        group = Group(name="Stress Group", description="d")
+        session.add(group)
+        session.flush()
+        session.execute(
+            insert(Participant),
+            [{"name": f"Member {i}", "group_id": group.id} for i in range(GROUP_SIZE)],
+        )
+        session.commit()
+        ids = session.scalars(
+            select(Participant.id).where(Participant.group_id == group.id)
+        ).all()
+        return group.id, list(ids)
+
+
+def test_concurrent_assigns_never_conflict_and_never_share_a_receiver(
+    file_session_factory, record_property
+):
+    group_id, member_ids = _seed_group(file_session_factory)
+    givers = member_ids[:CONCURRENT_ASSIGNS]
+
+    def _assign(giver_id: int):
+        with file_session_factory() as session:
+            return SecretFriendService.assign(
+                group_id=group_id, participant_id=giver_id, db_session=session
+            )
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+        results = list(pool.map(_assign, givers))
+    elapsed = time.perf_counter() - start
+
+    record_property("assigns_per_second", round(CONCURRENT_ASSIGNS / elapsed))
+    assert len(results) == CONCURRENT_ASSIGNS
+    with file_session_factory() as session:
+        rows = session.execute(
+            select(SecretFriend.gift_giver_id, SecretFriend.gift_receiver_id)
+        ).all()
+    assert sorted(giver for giver, _ in rows) == sorted(givers)
+    receivers = [receiver for _, receiver in rows]
+    assert len(set(receivers)) == len(receivers)
+
+
+def test_assign_retries_after_a_conflict(file_session_factory):
+    group_id, member_ids = _seed_group(file_session_factory)
+    real_link = SecretFriendRepository.link
+    calls = {"count": 0}
+
+    def _flaky_link(**kwargs):
+        calls["count"] += 1
+        if calls["count"] == 1:
+            raise ConflictError("simulated race")
+        return real_link(**kwargs)
+
+    with (
+        patch.object(SecretFriendRepository, "link", side_effect=_flaky_link),
+        file_session_factory() as session,
+    ):
+        result = SecretFriendService.assign(
+            group_id=group_id, participant_id=member_ids[0], db_session=session
+        )
+
+    assert calls["count"] == 2
+    assert result.gift_giver_id == member_ids[0]
+
+
+def test_assign_gives_up_after_bounded_attempts(file_session_factory):
+    group_id, member_ids = _seed_group(file_session_factory)
+
+    with (
+        patch.object(
+            SecretFriendRepository, "link", side_effect=ConflictError("always")
+        ) as link,
+        file_session_factory() as session,
+        pytest.raises(ConflictError),
+    ):
+        SecretFriendService.assign(
+            group_id=group_id, participant_id=member_ids[0], db_session=session
+        )
+
+    assert link.call_count == 3
+
+
+def test_assign_does_not_retry_inside_a_callers_transaction(file_session_factory):
+    group_id, member_ids = _seed_group(file_session_factory)
+
+    with (
+        patch.object(
+            SecretFriendRepository, "link", side_effect=ConflictError("always")
+        ) as link,
+        file_session_factory() as session,
+        pytest.raises(ConflictError),
+        transaction(session),
+    ):
+        SecretFriendService.assign(
+            group_id=group_id, participant_id=member_ids[0], db_session=session
+        )
+
+    assert link.call_count == 1
@@ -10,6 +10,7 @@ from src.domain.group.schemas import GroupCreate
 from src.domain.group.service import GroupService
 from src.domain.participant.schemas import ParticipantCreate
 from src.domain.participant.service import ParticipantService
+from src.domain.secret_friend import cache
 from src.domain.secret_friend.repository import SecretFriendRepository
 from src.domain.secret_friend.schemas import SecretFriendLink
 from src.domain.secret_friend.service import SecretFriendService
@@ -17,6 +18,7 @@ from src.domain.secret_friend.signals import (
     secret_friend_assigned,
     secret_friend_deleted,
 )
+from src.shared.exceptions import NotFoundError
 
 
 def _setup_group_with_two_participants(db_session: Session):
@@ -60,6 +62,54 @@ def test_on_secret_friend_assigned_logs_event(
         secret_friend_assigned.disconnect(_on_secret_friend_assigned)
 
 
+# ── Giver cache eviction ─────────────────────────────────────────────────────
+
+
+def test_reads_between_flush_and_commit_do_not_stay_cached(
+    db_session: Session,
+) -> None:
+    from src.domain.secret_friend.handlers.side_effects import register_side_effects
+
+    group, p1, p2 = _setup_group_with_two_participants(db_session)
+    register_side_effects()
+
+    def _concurrent_read(sender: type, **kwargs: object) -> None:
+        # Another request, not yet seeing the flushed link, caches "no draw".
+        cache.by_giver.set(p1.id, None)
+
+    secret_friend_assigned.connect(_concurrent_read)
+    try:
+        assignment = SecretFriendService.assign(
+            group_id=group.id, participant_id=p1.id, db_session=db_session
+        )
+    finally:
+        secret_friend_assigned.disconnect(_concurrent_read)
+
+    assert SecretFriendService.get_by_giver_id(p1.id, db_session) == assignment
+
+
+def test_deleted_links_are_evicted_again_after_commit(db_session: Session) -> None:
+    from src.domain.secret_friend.handlers.side_effects import register_side_effects
+
+    group, p1, p2 = _setup_group_with_two_participants(db_session)
+    register_side_effects()
+    assignment = SecretFriendService.assign(
+        group_id=group.id, participant_id=p1.id, db_session=db_session
+    )
+
+    def _concurrent_read(sender: type, **kwargs: object) -> None:
+        cache.by_giver.set(p1.id, assignment)
+
+    secret_friend_deleted.connect(_concurrent_read)
+    try:
+        SecretFriendService.delete(assignment.id, db_session)
+    finally:
+        secret_friend_deleted.disconnect(_concurrent_read)
+
+    with pytest.raises(NotFoundError):
+        SecretFriendService.get_by_giver_id(p1.id, db_session)
+
+
 # ── Task relay handler tests ─────────────────────────────────────────────────
 
 
@@ -0,0 +1,198 @@
+import itertools
+import random
+import time
+import tracemalloc
+
+import pytest
+
+from src.domain.secret_friend import matching
+from src.domain.secret_friend.matching import (
+    BipartiteMatcher,
+    CycleMatcher,
+    DefaultMatcher,
+    forbidden_from_pairs,
+    pack_forbidden,
+)
+from src.shared.exceptions import BusinessRuleError
+
+
+def _assert_valid(assignment: dict[int, int], ids: list[int], forbidden) -> None:
+    assert sorted(assignment) == sorted(ids)
+    assert sorted(assignment.values()) == sorted(ids)
+    for giver, receiver in assignment.items():
+        assert giver != receiver
+        assert receiver not in forbidden.get(giver, ())
+
+
+def _cycle_length(assignment: dict[int, int]) -> int:
+    start = current = next(iter(assignment))
+    length = 0
+    while True:
+        current = assignment[current]
+        length += 1
+        if current == start:
+            return length
+
+
+# ── forbidden_from_pairs ─────────────────────────────────────────────────────
+
+
+def test_forbidden_from_pairs_groups_receivers_by_giver():
+    assert forbidden_from_pairs([(1, 2), (1, 3), (2, 1)]) == {1: {2, 3}, 2: {1}}
+
+
+def test_pack_forbidden_holds_one_compact_array_per_giver():
+    packed = pack_forbidden([(1, 2), (1, 3), (2, 1)])
+
+    assert {giver: list(row) for giver, row in packed.items()} == {1: [2, 3], 2: [1]}
+    assert packed[1].itemsize == 8
+    assert 3 in packed[1] and 4 not in packed[1]
+
+
+# ── CycleMatcher ─────────────────────────────────────────────────────────────
+
+
+def test_cycle_matcher_raises_with_fewer_than_two_participants():
+    with pytest.raises(BusinessRuleError, match="At least 2 participants"):
+        CycleMatcher().match([1])
+
+
+def test_cycle_matcher_builds_a_single_cycle():
+    ids = list(range(1, 51))
+    assignment = CycleMatcher().match(ids)
+
+    _assert_valid(assignment, ids, {})
+    assert _cycle_length(assignment) == len(ids)
+
+
+def test_cycle_matcher_repairs_sparse_exclusions():
+    ids = list(range(1, 201))
+    rng = random.Random(7)
+    forbidden = forbidden_from_pairs(
+        (g, r) for g in ids for r in rng.sample(ids, 5) if r != g
+    )
+
+    assignment = CycleMatcher().match(ids, forbidden, rng)
+
+    _assert_valid(assignment, ids, forbidden)
+    assert _cycle_length(assignment) == len(ids)
+
+
+def test_cycle_matcher_try_match_gives_up_instead_of_raising():
+    # 1 and 2 may only draw each other, which no single cycle of 3 allows.
+    forbidden = {1: {3}, 2: {3}}
+    assert CycleMatcher(attempts=3).try_match([1, 2, 3], forbidden) is None
+
+
+# ── BipartiteMatcher ─────────────────────────────────────────────────────────
+
+
+def test_bipartite_matcher_finds_assignment_whenever_one_exists():
+    rng = random.Random(11)
+    for _ in range(200):
+        ids = list(range(rng.randint(2, 7)))
+        forbidden = {g: {r for r in ids if rng.random() < 0.5} for g in ids}
+        exists = any(
+            all(p[g] != g and p[g] not in forbidden[g] for g in ids)
+            for p in itertools.permutations(ids)
+        )
+        if exists:
+            _assert_valid(BipartiteMatcher().match(ids, forbidden), ids, forbidden)
+        else:
+            with pytest.raises(BusinessRuleError, match="exclusion rules"):
+                BipartiteMatcher().match(ids, forbidden)
+
+
+def test_bipartite_matcher_does_not_materialize_the_candidate_lists():
+    ids = list(range(1, 2001))
+
+    tracemalloc.start()
+    try:
+        assignment = BipartiteMatcher().match(ids, rng=random.Random(5))
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    _assert_valid(assignment, ids, {})
+    # Every giver's list of 1999 candidates would take well over 100MB.
+    assert peak < 5_000_000
+
+
+# ── DefaultMatcher ───────────────────────────────────────────────────────────
+
+
+def test_default_matcher_falls_back_when_no_single_cycle_exists():
+    # Only valid assignment: 1↔2 and 3↔4 — two cycles of two.
+    forbidden = {1: {3, 4}, 2: {3, 4}, 3: {1, 2}, 4: {1, 2}}
+    assignment = DefaultMatcher().match([1, 2, 3, 4], forbidden)
+    assert assignment == {1: 2, 2: 1, 3: 4, 4: 3}
+
+
+def test_default_matcher_is_reproducible_with_a_seeded_rng():
+    ids = list(range(1, 101))
+    first = DefaultMatcher().match(ids, rng=random.Random(42))
+    second = DefaultMatcher().match(ids, rng=random.Random(42))
+    assert first == second
+
+
+def test_set_matching_engine_swaps_the_global_engine():
+    class _Fixed:
+        def match(self, participant_ids, forbidden=None, rng=None):
+            return {1: 2, 2: 1}
+
+    previous = matching._engine
+    matching.set_matching_engine(_Fixed())
+    try:
+        assert matching.match([1, 2]) == {1: 2, 2: 1}
+    finally:
+        matching.set_matching_engine(previous)
+
+
+# ── Many groups ──────────────────────────────────────────────────────────────
+
+
+def test_match_group_is_reproducible_from_seed_and_group_id():
+    job = (7, list(range(1, 30)), [(1, 2)], 42)
+
+    assert matching.match_group(job) == matching.match_group(job)
+    assert matching.match_group(job) != matching.match_group((8, *job[1:]))
+
+
+def test_match_group_returns_none_when_the_group_cannot_be_drawn():
+    assert matching.match_group((7, [1, 2], [(1, 2)], None)) == (7, None)
+
+
+def test_parallel_matcher_matches_like_in_process_and_keeps_job_order():
+    jobs = [(g, list(range(g * 100, g * 100 + 10)), [], 1) for g in range(1, 41)]
+
+    with matching.parallel_matcher(workers=2) as match_groups:
+        pooled = list(match_groups(jobs))
+    with matching.parallel_matcher(workers=1) as match_groups:
+        in_process = list(match_groups(jobs))
+
+    assert pooled == in_process
+    assert [group_id for group_id, _ in pooled] == list(range(1, 41))
+
+
+# ── Benchmark ────────────────────────────────────────────────────────────────
+
+
+def test_default_matcher_10k_participants_with_5_percent_forbidden_under_1s():
+    n = 10_000
+    ids = list(range(1, n + 1))
+    rng = random.Random(2024)
+    width = n // 20
+    # 5% of every giver's possible receivers are forbidden. Ranges keep the
+    # 5M forbidden pairs cheap to hold while still supporting `in`.
+    forbidden = {
+        g: range(start, start + width)
+        for g in ids
+        for start in [rng.randrange(1, n + 1)]
+    }
+
+    start = time.perf_counter()
+    assignment = DefaultMatcher().match(ids, forbidden, rng)
+    elapsed = time.perf_counter() - start
+
+    _assert_valid(assignment, ids, forbidden)
+    assert elapsed < 1.0
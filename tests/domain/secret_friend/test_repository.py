@@ -1,6 +1,8 @@
 import pytest
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
+from src.domain.secret_friend.model import SecretFriendHistory
 from src.domain.secret_friend.repository import SecretFriendRepository
 from src.domain.secret_friend.schemas import SecretFriendLink
 from src.shared.exceptions import NotFoundError
@@ -114,3 +116,169 @@ def test_delete_not_found_raises(db_session: Session):
     """delete() raises NotFoundError when no row matches the given id."""
     with pytest.raises(NotFoundError):
         SecretFriendRepository.delete(999_999, db_session)
+
+
+def test_link_is_a_single_upsert_statement(
+    db_session: Session, participant_fixture, sql_statements
+):
+    giver = participant_fixture()
+    receiver = participant_fixture()
+    sql_statements.clear()
+
+    SecretFriendRepository.link(
+        SecretFriendLink(gift_giver_id=giver.id, gift_receiver_id=receiver.id),
+        db_session,
+    )
+
+    assert len(sql_statements) == 1
+    assert "ON CONFLICT (gift_giver_id) DO UPDATE" in sql_statements[0]
+
+
+# ---------------------------------------------------------------------------
+# bulk_link
+# ---------------------------------------------------------------------------
+
+
+def test_bulk_link_inserts_every_link(db_session: Session, participant_fixture):
+    a, b, c = (participant_fixture() for _ in range(3))
+    links = [
+        SecretFriendLink(gift_giver_id=a.id, gift_receiver_id=b.id),
+        SecretFriendLink(gift_giver_id=b.id, gift_receiver_id=c.id),
+        SecretFriendLink(gift_giver_id=c.id, gift_receiver_id=a.id),
+    ]
+
+    rows = SecretFriendRepository.bulk_link(links, db_session)
+
+    assert sorted((r.gift_giver_id, r.gift_receiver_id) for r in rows) == sorted(
+        [(a.id, b.id), (b.id, c.id), (c.id, a.id)]
+    )
+    assert all(r.id is not None for r in rows)
+
+
+def test_bulk_link_upserts_existing_givers(db_session: Session, participant_fixture):
+    a, b, c = (participant_fixture() for _ in range(3))
+    first = SecretFriendRepository.link(
+        SecretFriendLink(gift_giver_id=a.id, gift_receiver_id=b.id), db_session
+    )
+
+    rows = SecretFriendRepository.bulk_link(
+        [SecretFriendLink(gift_giver_id=a.id, gift_receiver_id=c.id)], db_session
+    )
+
+    assert rows[0].id == first.id
+    assert rows[0].gift_receiver_id == c.id
+
+
+def test_bulk_link_with_no_links_issues_no_statements(
+    db_session: Session, sql_statements
+):
+    assert SecretFriendRepository.bulk_link([], db_session) == []
+    assert sql_statements == []
+
+
+# ---------------------------------------------------------------------------
+# draw history
+# ---------------------------------------------------------------------------
+
+
+def test_record_history_snapshots_links_by_name(
+    db_session: Session, group_fixture, participant_fixture
+):
+    group = group_fixture()
+    ann = participant_fixture(group=group, name="Ann")
+    ben = participant_fixture(group=group, name="Ben")
+    SecretFriendRepository.bulk_link(
+        [
+            SecretFriendLink(gift_giver_id=ann.id, gift_receiver_id=ben.id),
+            SecretFriendLink(gift_giver_id=ben.id, gift_receiver_id=ann.id),
+        ],
+        db_session,
+    )
+
+    SecretFriendRepository.record_history([group.id], 2025, db_session)
+
+    rows = db_session.scalars(
+        select(SecretFriendHistory).where(SecretFriendHistory.lineage_id == group.id)
+    ).all()
+    assert sorted((r.draw_year, r.giver_name, r.receiver_name) for r in rows) == [
+        (2025, "Ann", "Ben"),
+        (2025, "Ben", "Ann"),
+    ]
+    assert all(r.created_at is not None for r in rows)
+
+
+def test_record_history_replaces_the_same_year(
+    db_session: Session, group_fixture, participant_fixture
+):
+    group = group_fixture()
+    ann = participant_fixture(group=group, name="Ann")
+    ben = participant_fixture(group=group, name="Ben")
+    SecretFriendRepository.link(
+        SecretFriendLink(gift_giver_id=ann.id, gift_receiver_id=ben.id), db_session
+    )
+
+    SecretFriendRepository.record_history([group.id], 2025, db_session)
+    SecretFriendRepository.record_history([group.id], 2025, db_session)
+
+    count = db_session.scalar(
+        select(func.count()).where(SecretFriendHistory.lineage_id == group.id)
+    )
+    assert count == 1
+
+
+def test_get_history_pairs_maps_names_onto_current_participants(
+    db_session: Session, group_fixture, participant_fixture
+):
+    group = group_fixture()
+    ann = participant_fixture(group=group, name="Ann")
+    ben = participant_fixture(group=group, name="Ben")
+    db_session.add_all(
+        [
+            SecretFriendHistory(
+                lineage_id=group.id,
+                draw_year=year,
+                giver_name="Ann",
+                receiver_name=receiver,
+            )
+            for year, receiver in [(2023, "Ben"), (2024, "Gone"), (2019, "Ben")]
+        ]
+    )
+    db_session.flush()
+
+    pairs = SecretFriendRepository.get_history_pairs(group.id, 2022, 2024, db_session)
+
+    assert list(pairs) == [(ann.id, ben.id)]
+
+
+def test_get_history_pairs_by_group_ids_keys_each_groups_pairs(
+    db_session: Session, group_fixture, participant_fixture, sql_statements
+):
+    first, second, quiet = group_fixture(), group_fixture(), group_fixture()
+    people = {
+        (group.id, name): participant_fixture(group=group, name=name)
+        for group in (first, second)
+        for name in ("Ann", "Ben")
+    }
+    db_session.add_all(
+        [
+            SecretFriendHistory(
+                lineage_id=group.id,
+                draw_year=2023,
+                giver_name="Ann",
+                receiver_name="Ben",
+            )
+            for group in (first, second)
+        ]
+    )
+    db_session.flush()
+    sql_statements.clear()
+
+    pairs = SecretFriendRepository.get_history_pairs_by_group_ids(
+        [first.id, second.id, quiet.id], 2022, 2024, db_session
+    )
+
+    assert len(sql_statements) == 1
+    assert pairs == {
+        group.id: [(people[group.id, "Ann"].id, people[group.id, "Ben"].id)]
+        for group in (first, second)
+    } | {quiet.id: []}
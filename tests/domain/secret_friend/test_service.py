@@ -1,79 +1,537 @@
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
 import pytest
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 
+from src.domain.group.service import GroupService
+from src.domain.participant.model import Participant
+from src.domain.participant.service import ParticipantService
+from src.domain.secret_friend import matching
+from src.domain.secret_friend.model import SecretFriend, SecretFriendHistory
 from src.domain.secret_friend.service import SecretFriendService
-from src.domain.secret_friend.schemas import SecretFriendLink, SecretFriendRead
-from src.domain.participant.schemas import ParticipantRead, ParticipantStatus
-from src.shared.exceptions import BusinessRuleError
-from datetime import datetime
+from src.domain.secret_friend.schemas import (
+    SecretFriendLink,
+    SecretFriendList,
+    SecretFriendRead,
+)
+from src.domain.participant.schemas import ParticipantStatus
+from src.shared.exceptions import BusinessRuleError, NotFoundError
+
+
+# ── assign ────────────────────────────────────────────────────────────────────
 
 
-def _make_participant_read(id: int, group_id: int = 1) -> ParticipantRead:
-    return ParticipantRead(
-        id=id,
-        name=f"Participant {id}",
-        group_id=group_id,
-        status=ParticipantStatus.PENDING,
-        created_at=datetime.now(),
+def test_assign_picks_a_receiver_from_the_same_group(
+    db_session: Session, group_fixture, participant_fixture
+):
+    group = group_fixture()
+    giver = participant_fixture(group=group)
+    receiver = participant_fixture(group=group)
+    participant_fixture()  # member of another group
+
+    result = SecretFriendService.assign(
+        group_id=group.id, participant_id=giver.id, db_session=db_session
     )
+    assert result.gift_giver_id == giver.id
+    assert result.gift_receiver_id == receiver.id
 
 
-# ── sort_secret_friends ───────────────────────────────────────────────────────
+def test_assign_skips_receivers_already_taken(
+    db_session: Session, group_fixture, participant_fixture
+):
+    group = group_fixture()
+    members = [participant_fixture(group=group) for _ in range(6)]
 
+    receivers = [
+        SecretFriendService.assign(
+            group_id=group.id, participant_id=m.id, db_session=db_session
+        ).gift_receiver_id
+        for m in members[:5]
+    ]
+    assert len(set(receivers)) == len(receivers)
 
-def test_sort_secret_friends_raises_with_fewer_than_two_participants():
-    participant = _make_participant_read(1)
-    with pytest.raises(BusinessRuleError, match="At least 2 participants"):
-        SecretFriendService.sort_secret_friends(
-            participant=participant, participants=[participant]
+
+def test_assign_reassignment_may_reuse_own_receiver(
+    db_session: Session, group_fixture, participant_fixture
+):
+    group = group_fixture()
+    giver = participant_fixture(group=group)
+    receiver = participant_fixture(group=group)
+
+    SecretFriendService.assign(
+        group_id=group.id, participant_id=giver.id, db_session=db_session
+    )
+    again = SecretFriendService.assign(
+        group_id=group.id, participant_id=giver.id, db_session=db_session
+    )
+    assert again.gift_receiver_id == receiver.id
+
+
+def test_assign_raises_when_no_receiver_is_available(
+    db_session: Session, group_fixture, participant_fixture
+):
+    group = group_fixture()
+    giver = participant_fixture(group=group)
+
+    with pytest.raises(BusinessRuleError, match="Unable to assign"):
+        SecretFriendService.assign(
+            group_id=group.id, participant_id=giver.id, db_session=db_session
         )
 
 
-def test_sort_secret_friends_raises_with_empty_list():
-    participant = _make_participant_read(1)
+# ── draw_group ────────────────────────────────────────────────────────────────
+
+
+def test_draw_group_assigns_every_participant(
+    db_session: Session, group_fixture, participant_fixture
+):
+    group = group_fixture()
+    members = [participant_fixture(group=group) for _ in range(5)]
+
+    result = SecretFriendService.draw_group(group_id=group.id, db_session=db_session)
+
+    assert isinstance(result, SecretFriendList)
+    member_ids = sorted(m.id for m in members)
+    assert sorted(sf.gift_giver_id for sf in result.secret_friends) == member_ids
+    assert sorted(sf.gift_receiver_id for sf in result.secret_friends) == member_ids
+
+
+def test_draw_group_reveals_every_participant(
+    db_session: Session, group_fixture, participant_fixture
+):
+    group = group_fixture()
+    members = [participant_fixture(group=group) for _ in range(3)]
+
+    SecretFriendService.draw_group(group_id=group.id, db_session=db_session)
+
+    for member in members:
+        db_session.refresh(member)
+        assert member.status == ParticipantStatus.REVEALED
+
+
+def test_draw_group_replaces_previous_draw(
+    db_session: Session, group_fixture, participant_fixture
+):
+    group = group_fixture()
+    for _ in range(4):
+        participant_fixture(group=group)
+
+    SecretFriendService.draw_group(group_id=group.id, db_session=db_session)
+    second = SecretFriendService.draw_group(group_id=group.id, db_session=db_session)
+
+    assert len(second.secret_friends) == 4
+
+
+def test_draw_group_with_one_participant_raises(
+    db_session: Session, group_fixture, participant_fixture
+):
+    group = group_fixture()
+    participant_fixture(group=group)
+
     with pytest.raises(BusinessRuleError, match="At least 2 participants"):
-        SecretFriendService.sort_secret_friends(
-            participant=participant, participants=[]
+        SecretFriendService.draw_group(group_id=group.id, db_session=db_session)
+
+
+def test_draw_group_honours_exclusions(
+    db_session: Session, group_fixture, participant_fixture
+):
+    group = group_fixture()
+    a, b, c = (participant_fixture(group=group) for _ in range(3))
+
+    # With a→b excluded the only valid cycle of three is a→c→b→a.
+    result = SecretFriendService.draw_group(
+        group_id=group.id, db_session=db_session, exclusions=[(a.id, b.id)]
+    )
+
+    receiver_of = {
+        sf.gift_giver_id: sf.gift_receiver_id for sf in result.secret_friends
+    }
+    assert receiver_of == {a.id: c.id, c.id: b.id, b.id: a.id}
+
+
+def test_draw_group_keeps_exclusions_in_sets(
+    db_session: Session, group_fixture, participant_fixture, monkeypatch
+):
+    group = group_fixture()
+    giver, *others = (participant_fixture(group=group) for _ in range(4))
+    seen: list[matching.Forbidden] = []
+    real_match = matching.match
+
+    def _match(participant_ids, forbidden=None, rng=None):
+        seen.append(forbidden)
+        return real_match(participant_ids, forbidden, rng)
+
+    monkeypatch.setattr(matching, "match", _match)
+    SecretFriendService.draw_group(
+        group_id=group.id,
+        db_session=db_session,
+        exclusions=[(giver.id, other.id) for other in others[:2]],
+        no_repeat_years=1,
+    )
+
+    assert seen == [{giver.id: {others[0].id, others[1].id}}]
+
+
+def test_draw_group_avoids_pairings_from_previous_years(
+    db_session: Session, group_fixture, participant_fixture
+):
+    group = group_fixture()
+    names = ["Ann", "Ben", "Cid", "Dee"]
+    for name in names:
+        participant_fixture(group=group, name=name)
+    last_year = datetime.now(timezone.utc).year - 1
+    # Last year was Ann→Ben→Cid→Dee→Ann.
+    past = list(zip(names, names[1:] + names[:1]))
+    db_session.add_all(
+        SecretFriendHistory(
+            lineage_id=group.id,
+            draw_year=last_year,
+            giver_name=giver,
+            receiver_name=receiver,
         )
+        for giver, receiver in past
+    )
+    db_session.flush()
+
+    for _ in range(10):
+        result = SecretFriendService.draw_group(
+            group_id=group.id, db_session=db_session, no_repeat_years=1
+        )
+        name_of = {p.id: p.name for p in group.participants}
+        drawn = {
+            (name_of[sf.gift_giver_id], name_of[sf.gift_receiver_id])
+            for sf in result.secret_friends
+        }
+        assert not drawn & set(past)
 
 
-def test_sort_secret_friends_returns_secret_friend_link():
-    giver = _make_participant_read(1)
-    receiver = _make_participant_read(2)
-    result = SecretFriendService.sort_secret_friends(
-        participant=giver, participants=[giver, receiver]
+def test_draw_group_records_history_for_the_current_year(
+    db_session: Session, group_fixture, participant_fixture
+):
+    group = group_fixture()
+    for _ in range(3):
+        participant_fixture(group=group)
+
+    SecretFriendService.draw_group(group_id=group.id, db_session=db_session)
+
+    years = db_session.scalars(
+        select(SecretFriendHistory.draw_year).where(
+            SecretFriendHistory.lineage_id == group.id
+        )
+    ).all()
+    assert years == [datetime.now(timezone.utc).year] * 3
+
+
+# ── draw_pending ──────────────────────────────────────────────────────────────
+
+
+def _pairs_by_group(db_session: Session, groups) -> dict[int, set[tuple[int, int]]]:
+    rows = db_session.execute(
+        select(
+            Participant.group_id,
+            SecretFriend.gift_giver_id,
+            SecretFriend.gift_receiver_id,
+        )
+        .join(Participant, Participant.id == SecretFriend.gift_giver_id)
+        .where(Participant.group_id.in_([g.id for g in groups]))
     )
-    assert isinstance(result, SecretFriendLink)
+    pairs: dict[int, set[tuple[int, int]]] = {}
+    for group_id, giver_id, receiver_id in rows:
+        pairs.setdefault(group_id, set()).add((giver_id, receiver_id))
+    return pairs
 
 
-def test_sort_secret_friends_does_not_assign_self_as_receiver():
-    giver = _make_participant_read(1)
-    others = [_make_participant_read(i) for i in range(2, 6)]
-    all_participants = [giver] + others
+def test_draw_pending_draws_every_pending_group_in_batches(
+    db_session: Session, group_fixture, participant_fixture
+):
+    groups = [group_fixture() for _ in range(5)]
+    for group in groups:
+        for _ in range(4):
+            participant_fixture(group=group)
+    reports = []
 
-    for _ in range(20):  # run multiple times to cover random shuffling
-        result = SecretFriendService.sort_secret_friends(
-            participant=giver, participants=all_participants
+    report = SecretFriendService.draw_pending(
+        db_session=db_session,
+        batch_size=2,
+        workers=1,
+        after_id=groups[0].id - 1,
+        progress=reports.append,
+    )
+
+    assert report.groups_drawn == 5
+    assert report.assignments == 20
+    assert report.groups_failed == []
+    assert len(reports) == 3
+    pairs = _pairs_by_group(db_session, groups)
+    assert all(len(pairs[g.id]) == 4 for g in groups)
+    statuses = db_session.scalars(
+        select(Participant.status).where(
+            Participant.group_id.in_([g.id for g in groups])
         )
-        assert result.gift_receiver_id != giver.id
+    ).all()
+    assert set(statuses) == {ParticipantStatus.REVEALED}
+
 
+def test_draw_pending_skips_drawn_groups_so_a_rerun_resumes(
+    db_session: Session, group_fixture, participant_fixture
+):
+    drawn, pending = group_fixture(), group_fixture()
+    for group in (drawn, pending):
+        for _ in range(3):
+            participant_fixture(group=group)
+    SecretFriendService.draw_group(group_id=drawn.id, db_session=db_session)
 
-def test_sort_secret_friends_giver_id_matches_participant(db_session: Session):
-    giver = _make_participant_read(7)
-    receiver = _make_participant_read(8)
-    result = SecretFriendService.sort_secret_friends(
-        participant=giver, participants=[giver, receiver]
+    after_id = drawn.id - 1
+
+    report = SecretFriendService.draw_pending(
+        db_session=db_session, workers=1, after_id=after_id
     )
-    assert result.gift_giver_id == giver.id
+
+    assert report.groups_drawn == 1
+    assert report.last_group_id == pending.id
+    rerun = SecretFriendService.draw_pending(
+        db_session=db_session, workers=1, after_id=after_id
+    )
+    assert rerun.groups_drawn == 0
+
+
+def test_draw_pending_skips_groups_being_deleted(
+    db_session: Session, group_fixture, participant_fixture
+):
+    marked, pending = group_fixture(), group_fixture()
+    for group in (marked, pending):
+        for _ in range(3):
+            participant_fixture(group=group)
+    GroupService.delete(group_id=marked.id, db_session=db_session, background=True)
+
+    report = SecretFriendService.draw_pending(
+        db_session=db_session, workers=1, after_id=marked.id - 1
+    )
+
+    assert report.groups_drawn == 1
+    assert report.groups_failed == []
+    assert set(_pairs_by_group(db_session, [marked, pending])) == {pending.id}
+
+
+def test_draw_pending_is_reproducible_with_a_seed(
+    db_session: Session, group_fixture, participant_fixture
+):
+    groups = [group_fixture() for _ in range(3)]
+    for group in groups:
+        for _ in range(6):
+            participant_fixture(group=group)
+
+    after_id = groups[0].id - 1
+
+    SecretFriendService.draw_pending(
+        db_session=db_session, seed=7, workers=2, after_id=after_id
+    )
+    first = _pairs_by_group(db_session, groups)
+    db_session.execute(update(Participant).values(status=ParticipantStatus.PENDING))
+    SecretFriendService.draw_pending(
+        db_session=db_session, seed=7, workers=1, after_id=after_id
+    )
+
+    assert _pairs_by_group(db_session, groups) == first
+
+
+def test_draw_pending_ignores_groups_with_a_single_member(
+    db_session: Session, group_fixture, participant_fixture
+):
+    lonely, fine = group_fixture(), group_fixture()
+    participant_fixture(group=lonely)
+    for _ in range(3):
+        participant_fixture(group=fine)
+
+    report = SecretFriendService.draw_pending(
+        db_session=db_session, workers=1, after_id=lonely.id - 1
+    )
+
+    assert report.groups_drawn == 1
+    assert report.groups_failed == []
+
+
+def test_draw_pending_leaves_unmatchable_groups_pending(
+    db_session: Session, group_fixture, participant_fixture
+):
+    group = group_fixture()
+    participant_fixture(group=group, name="Ann")
+    participant_fixture(group=group, name="Ben")
+    db_session.add(
+        SecretFriendHistory(
+            lineage_id=group.id,
+            draw_year=datetime.now(timezone.utc).year - 1,
+            giver_name="Ann",
+            receiver_name="Ben",
+        )
+    )
+    db_session.flush()
+
+    report = SecretFriendService.draw_pending(
+        db_session=db_session, workers=1, after_id=group.id - 1, no_repeat_years=1
+    )
+
+    assert report.groups_failed == [group.id]
+    assert _pairs_by_group(db_session, [group]) == {}
+
+
+def test_draw_pending_reads_history_once_per_batch(
+    db_session: Session, group_fixture, participant_fixture, sql_statements
+):
+    groups = [group_fixture() for _ in range(4)]
+    for group in groups:
+        for _ in range(3):
+            participant_fixture(group=group)
+    sql_statements.clear()
+
+    SecretFriendService.draw_pending(
+        db_session=db_session,
+        workers=1,
+        batch_size=2,
+        after_id=groups[0].id - 1,
+        no_repeat_years=2,
+    )
+
+    history_reads = [
+        statement
+        for statement in sql_statements
+        if statement.lstrip().startswith("SELECT")
+        and "FROM secret_friend_history" in statement
+    ]
+    assert len(history_reads) == 2
+
+
+def _joining_matcher(on_matched):
+    """parallel_matcher that runs on_matched after matching, before the commit."""
+    parallel_matcher = matching.parallel_matcher
+
+    @contextmanager
+    def _matcher(workers=None):
+        with parallel_matcher(1) as match_groups:
+
+            def _match(jobs):
+                results = list(match_groups(jobs))
+                on_matched()
+                return iter(results)
+
+            yield _match
+
+    return _matcher
 
 
-def test_sort_secret_friends_with_two_participants_links_to_the_other():
-    p1 = _make_participant_read(1)
-    p2 = _make_participant_read(2)
-    result = SecretFriendService.sort_secret_friends(
-        participant=p1, participants=[p1, p2]
+def test_draw_pending_rematches_a_group_joined_after_matching(
+    db_session: Session, group_fixture, participant_fixture, monkeypatch
+):
+    group = group_fixture()
+    for _ in range(3):
+        participant_fixture(group=group)
+    latecomers = []
+    monkeypatch.setattr(
+        matching,
+        "parallel_matcher",
+        _joining_matcher(lambda: latecomers.append(participant_fixture(group=group))),
+    )
+
+    report = SecretFriendService.draw_pending(
+        db_session=db_session, after_id=group.id - 1
+    )
+
+    assert report.groups_drawn == 1
+    assert report.assignments == 4
+    pairs = _pairs_by_group(db_session, [group])[group.id]
+    assert latecomers[0].id in {giver for giver, _ in pairs}
+    assert latecomers[0].id in {receiver for _, receiver in pairs}
+
+
+def test_draw_pending_rematches_a_group_left_after_matching(
+    db_session: Session, group_fixture, participant_fixture, monkeypatch
+):
+    group = group_fixture()
+    members = [participant_fixture(group=group) for _ in range(4)]
+    monkeypatch.setattr(
+        matching,
+        "parallel_matcher",
+        _joining_matcher(
+            lambda: ParticipantService.delete(
+                participant_id=members[0].id, db_session=db_session
+            )
+        ),
+    )
+
+    report = SecretFriendService.draw_pending(
+        db_session=db_session, after_id=group.id - 1
+    )
+
+    assert report.assignments == 3
+    pairs = _pairs_by_group(db_session, [group])[group.id]
+    assert members[0].id not in {p for pair in pairs for p in pair}
+
+
+# ── get_by_giver_id ───────────────────────────────────────────────────────────
+
+
+def test_get_by_giver_id_returns_the_givers_assignment(
+    db_session: Session, group_fixture, participant_fixture
+):
+    group = group_fixture()
+    giver = participant_fixture(group=group)
+    receiver = participant_fixture(group=group)
+    SecretFriendService.assign(
+        group_id=group.id, participant_id=giver.id, db_session=db_session
+    )
+
+    result = SecretFriendService.get_by_giver_id(
+        participant_id=giver.id, db_session=db_session
     )
-    assert result.gift_receiver_id == p2.id
+
+    assert result.gift_receiver_id == receiver.id
+
+
+def test_get_by_giver_id_raises_until_the_participant_has_drawn(
+    db_session: Session, group_fixture, participant_fixture
+):
+    group = group_fixture()
+    giver = participant_fixture(group=group)
+    participant_fixture(group=group)
+
+    with pytest.raises(NotFoundError, match="not assigned"):
+        SecretFriendService.get_by_giver_id(
+            participant_id=giver.id, db_session=db_session
+        )
+    SecretFriendService.assign(
+        group_id=group.id, participant_id=giver.id, db_session=db_session
+    )
+
+    assert SecretFriendService.get_by_giver_id(
+        participant_id=giver.id, db_session=db_session
+    )
+
+
+def test_get_by_giver_id_raises_for_unknown_participant(db_session: Session):
+    with pytest.raises(NotFoundError, match="Participant not found"):
+        SecretFriendService.get_by_giver_id(participant_id=99999, db_session=db_session)
+
+
+def test_get_by_giver_id_sees_redraws_and_deletions(
+    db_session: Session, group_fixture, participant_fixture
+):
+    group = group_fixture()
+    members = [participant_fixture(group=group) for _ in range(4)]
+    giver = members[0]
+
+    drawn = SecretFriendService.draw_group(group_id=group.id, db_session=db_session)
+    cached = SecretFriendService.get_by_giver_id(
+        participant_id=giver.id, db_session=db_session
+    )
+    assert cached in drawn.secret_friends
+
+    SecretFriendService.delete(secret_friend_id=cached.id, db_session=db_session)
+    with pytest.raises(NotFoundError):
+        SecretFriendService.get_by_giver_id(
+            participant_id=giver.id, db_session=db_session
+        )
 
 
 # ── link ──────────────────────────────────────────────────────────────────────
@@ -12,6 +12,7 @@ from src.domain.secret_friend.service import SecretFriendService
 from src.domain.secret_friend.signals import (
     secret_friend_assigned,
     secret_friend_deleted,
+    secret_friend_drawn,
 )
 
 
@@ -70,3 +71,29 @@ def test_secret_friend_deleted_signal_fires_on_delete(db_session: Session) -> No
         assert received[0]["secret_friend_id"] == assignment.id
     finally:
         secret_friend_deleted.disconnect(handler)
+
+
+def test_secret_friend_drawn_signal_fires_once_per_draw(db_session: Session) -> None:
+    received: list[dict] = []
+
+    def handler(sender: object, **kwargs: object) -> None:
+        received.append(kwargs)
+
+    group, p1, p2 = _setup_group_with_two_participants(db_session)
+
+    assigned: list[dict] = []
+
+    def assigned_handler(sender: object, **kwargs: object) -> None:
+        assigned.append(kwargs)
+
+    secret_friend_drawn.connect(handler)
+    secret_friend_assigned.connect(assigned_handler)
+    try:
+        SecretFriendService.draw_group(group_id=group.id, db_session=db_session)
+        assert len(received) == 1
+        assert received[0]["group_id"] == group.id
+        assert len(received[0]["assignments"]) == 2
+        assert assigned == []
+    finally:
+        secret_friend_drawn.disconnect(handler)
+        secret_friend_assigned.disconnect(assigned_handler)
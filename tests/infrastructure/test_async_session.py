@@ -0,0 +1,112 @@
+import threading
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session
+
+from src.domain.group.async_service import AsyncGroupService
+from src.domain.group.model import Group
+from src.domain.group.schemas import GroupCreate, GroupUpdate
+from src.domain.participant.async_service import AsyncParticipantService
+from src.domain.participant.schemas import ParticipantCreate
+from src.domain.secret_friend import matching
+from src.domain.secret_friend.async_service import AsyncSecretFriendService
+from src.infrastructure.persistence import async_transaction, run_sync
+from src.shared.exceptions import NotFoundError
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_run_sync_hands_fn_the_sync_session(async_engine: AsyncEngine):
+    def _session_of(db_session: Session, marker: str) -> tuple[Session, str]:
+        return db_session, marker
+
+    async with AsyncSession(async_engine) as db_session:
+        sync_session, marker = await run_sync(db_session, _session_of, marker="x")
+
+    assert sync_session is db_session.sync_session
+    assert marker == "x"
+
+
+async def test_async_service_commits_through_the_sync_service(
+    async_engine: AsyncEngine,
+):
+    async with AsyncSession(async_engine) as db_session:
+        created = await AsyncGroupService.create(
+            GroupCreate(name="Async Group", description="desc"), db_session
+        )
+        updated = await AsyncGroupService.update(
+            created.id, GroupUpdate(description="changed"), db_session
+        )
+
+    assert updated.description == "changed"
+    async with AsyncSession(async_engine) as db_session:
+        stored = await db_session.scalar(
+            select(Group.description).where(Group.id == created.id)
+        )
+    assert stored == "changed"
+
+
+async def test_async_service_raises_domain_errors(async_engine: AsyncEngine):
+    async with AsyncSession(async_engine) as db_session:
+        with pytest.raises(NotFoundError):
+            await AsyncGroupService.get_by_id(999_999, db_session)
+
+
+async def test_async_transaction_commits_every_run_sync_call_at_exit(
+    async_engine: AsyncEngine,
+):
+    async with AsyncSession(async_engine) as db_session:
+        async with async_transaction(db_session):
+            created = await AsyncGroupService.create(
+                GroupCreate(name="Joined", description="desc"), db_session
+            )
+            await AsyncGroupService.update(
+                created.id, GroupUpdate(description="joined"), db_session
+            )
+            assert db_session.in_transaction()
+
+    async with AsyncSession(async_engine) as db_session:
+        stored = await db_session.scalar(
+            select(Group.description).where(Group.id == created.id)
+        )
+    assert stored == "joined"
+
+
+async def test_async_transaction_rolls_back_on_error(async_engine: AsyncEngine):
+    async with AsyncSession(async_engine) as db_session:
+        with pytest.raises(NotFoundError):
+            async with async_transaction(db_session):
+                created = await AsyncGroupService.create(
+                    GroupCreate(name="Rolled Back", description="desc"), db_session
+                )
+                await AsyncGroupService.get_by_id(999_999, db_session)
+
+    async with AsyncSession(async_engine) as db_session:
+        assert await db_session.get(Group, created.id) is None
+
+
+async def test_async_draw_matches_off_the_event_loop(
+    async_engine: AsyncEngine, monkeypatch
+):
+    matched_on: list[threading.Thread] = []
+    real_match = matching.match
+
+    def _match(participant_ids, forbidden=None, rng=None):
+        matched_on.append(threading.current_thread())
+        return real_match(participant_ids, forbidden, rng)
+
+    monkeypatch.setattr(matching, "match", _match)
+    async with AsyncSession(async_engine) as db_session:
+        group = await AsyncGroupService.create(
+            GroupCreate(name="Async Draw", description="desc"), db_session
+        )
+        for name in ("Ann", "Ben", "Cid"):
+            await AsyncParticipantService.create(
+                ParticipantCreate(name=name, group_id=group.id), db_session
+            )
+        drawn = await AsyncSecretFriendService.draw_group(group.id, db_session)
+
+    assert len(drawn.secret_friends) == 3
+    assert matched_on and matched_on[0] is not threading.current_thread()
@@ -1,7 +1,7 @@
 import pytest
 from sqlalchemy.orm import Session
 
-from src.infrastructure.persistence import transaction
+from src.infrastructure.persistence import in_transaction, transaction
 from src.domain.group.model import Group
 from src.domain.group.schemas import GroupCreate
 from src.domain.group.repository import GroupRepository
@@ -99,3 +99,11 @@ def test_transaction_flag_cleared_after_outer_exception(db_session: Session):
             raise RuntimeError("boom")
 
     assert "_in_transaction" not in db_session.info
+
+
+def test_in_transaction_reflects_enclosing_block(db_session: Session):
+    """in_transaction() is True only while a transaction() block is open."""
+    assert in_transaction(db_session) is False
+    with transaction(db_session):
+        assert in_transaction(db_session) is True
+    assert in_transaction(db_session) is False
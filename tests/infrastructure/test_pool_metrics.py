@@ -0,0 +1,91 @@
+import threading
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from src.infrastructure.persistence import pool_metrics
+from src.infrastructure.persistence.pool_metrics import (
+    InstrumentedQueuePool,
+    instrument,
+    pool_options,
+    pool_stats,
+)
+
+
+@pytest.fixture
+def pooled_engine(tmp_path):
+    """A one-connection, no-overflow pool, instrumented as "test"."""
+    options = pool_options("test") | {
+        "pool_size": 1,
+        "max_overflow": 0,
+        "pool_timeout": 0.05,
+    }
+    engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", **options)
+    instrument(engine)
+    yield engine
+    engine.dispose()
+    pool_metrics._metrics.pop("test")
+    pool_metrics._engines.pop("test")
+
+
+def test_pool_options_sizes_the_pool_from_settings():
+    options = pool_options("primary")
+
+    assert options["poolclass"] is InstrumentedQueuePool
+    assert options["pool_logging_name"] == "primary"
+    assert {"pool_size", "max_overflow", "pool_timeout", "pool_use_lifo"} <= set(
+        options
+    )
+
+
+def test_instrument_requires_a_pool_name(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'anon.db'}")
+
+    with pytest.raises(ValueError):
+        instrument(engine)
+
+
+def test_checkouts_are_counted_while_held(pooled_engine):
+    with pooled_engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        held = pool_stats()["test"]
+    released = pool_stats()["test"]
+
+    assert held["checked_out"] == 1
+    assert held["open"] == 1
+    assert released["checked_out"] == 0
+    assert released["checked_in"] == 1
+    assert released["peak_checked_out"] == 1
+    assert released["connects"] == released["checkouts"] == 1
+    assert released["timeouts"] == 0
+
+
+def test_exhausted_pool_records_the_wait_and_the_timeout(pooled_engine):
+    with pooled_engine.connect():
+        waiter_error: list[Exception] = []
+
+        def _wait() -> None:
+            try:
+                pooled_engine.connect()
+            except PoolTimeoutError as e:
+                waiter_error.append(e)
+
+        waiter = threading.Thread(target=_wait)
+        waiter.start()
+        waiter.join()
+
+    stats = pool_stats()["test"]
+    assert len(waiter_error) == 1
+    assert stats["timeouts"] == 1
+    assert stats["wait_seconds_max"] >= 0.05
+    assert stats["checked_out"] == 0
+
+
+def test_invalidated_connections_are_counted_and_checked_in(pooled_engine):
+    with pooled_engine.connect() as connection:
+        connection.invalidate()
+
+    stats = pool_stats()["test"]
+    assert stats["invalidations"] == 1
+    assert stats["checked_out"] == 0
@@ -0,0 +1,136 @@
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.domain.group.model import Group
+from src.domain.group.repository import GroupRepository
+from src.domain.group.schemas import GroupCreate
+from src.domain.group.service import GroupService
+from src.domain.participant.schemas import ParticipantCreate
+from src.domain.participant.service import ParticipantService
+from src.domain.secret_friend.service import SecretFriendService
+from src.infrastructure.persistence import (
+    AsyncSessionLocal,
+    Base,
+    RoutingSession,
+    SessionLocal,
+    transaction,
+)
+from src.shared.exceptions import NotFoundError
+
+
+@pytest.fixture
+def primary(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'primary.db'}")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def replica(tmp_path):
+    """A second SQLite file standing in for a replica that has not caught up."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def routed(primary, replica):
+    make_session = sessionmaker(
+        class_=RoutingSession, autoflush=False, bind=primary, replica=replica
+    )
+    with make_session() as session:
+        yield session
+
+
+def _create_group(engine, name: str) -> int:
+    with Session(engine) as session, transaction(session):
+        return GroupRepository.create(
+            GroupCreate(name=name, description="desc"), session
+        ).id
+
+
+def _count_groups(engine) -> int:
+    with Session(engine) as session:
+        return session.scalar(select(func.count()).select_from(Group))
+
+
+def test_reads_go_to_the_replica(routed: RoutingSession, replica):
+    group_id = _create_group(replica, "Replica Only")
+
+    assert GroupService.get_by_id(group_id, routed).name == "Replica Only"
+    assert not routed.uses_primary()
+
+
+def test_transactions_write_to_the_primary(routed: RoutingSession, primary, replica):
+    GroupService.create(GroupCreate(name="Primary Group", description="d"), routed)
+
+    assert _count_groups(primary) == 1
+    assert _count_groups(replica) == 0
+
+
+def test_reads_after_a_write_see_it(routed: RoutingSession):
+    created = GroupService.create(
+        GroupCreate(name="Read My Write", description="d"), routed
+    )
+
+    # The replica never receives the row: only the primary can answer.
+    assert GroupService.get_by_id(created.id, routed).name == "Read My Write"
+    assert routed.uses_primary()
+
+
+def test_locking_reads_go_to_the_primary(routed: RoutingSession, primary):
+    group_id = _create_group(primary, "Locked Group")
+
+    locked = routed.scalar(
+        select(Group.name).where(Group.id == group_id).with_for_update()
+    )
+
+    assert locked == "Locked Group"
+
+
+def test_each_session_starts_on_the_replica(primary, replica):
+    make_session = sessionmaker(class_=RoutingSession, bind=primary, replica=replica)
+    with make_session() as writer:
+        group_id = GroupService.create(
+            GroupCreate(name="Not Replicated", description="d"), writer
+        ).id
+
+    with make_session() as reader, pytest.raises(NotFoundError):
+        GroupService.get_by_id(group_id, reader)
+
+
+def test_without_a_replica_everything_uses_the_bind(primary):
+    group_id = _create_group(primary, "Single Database")
+
+    with RoutingSession(bind=primary) as session:
+        assert GroupService.get_by_id(group_id, session).name == "Single Database"
+        assert session.get_bind() is primary
+
+
+def test_app_sessions_route_reads():
+    with SessionLocal() as session:
+        assert isinstance(session, RoutingSession)
+    assert isinstance(AsyncSessionLocal().sync_session, RoutingSession)
+
+
+def test_giver_cache_fills_from_the_primary(routed: RoutingSession, primary):
+    with Session(primary) as session:
+        group = GroupService.create(
+            GroupCreate(name="Cached", description="d"), session
+        )
+        giver = ParticipantService.create(
+            ParticipantCreate(name="Giver", group_id=group.id), session
+        )
+        ParticipantService.create(
+            ParticipantCreate(name="Receiver", group_id=group.id), session
+        )
+        SecretFriendService.draw_group(group_id=group.id, db_session=session)
+
+    # The replica has neither the participant nor the draw yet.
+    drawn = SecretFriendService.get_by_giver_id(giver.id, routed)
+
+    assert drawn.gift_giver_id == giver.id
+    assert routed.uses_primary()
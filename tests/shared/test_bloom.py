@@ -0,0 +1,48 @@
+"""Tests for the Bloom filter in src/shared/bloom.py."""
+
+import pytest
+
+from src.shared.bloom import BloomFilter
+
+
+def test_added_items_are_always_found() -> None:
+    bloom = BloomFilter(capacity=1_000, error_rate=0.01)
+    items = [f"token-{i}" for i in range(1_000)]
+    for item in items:
+        bloom.add(item)
+
+    assert all(item in bloom for item in items)
+    assert len(bloom) == 1_000
+
+
+def test_false_positive_rate_stays_near_the_configured_rate() -> None:
+    bloom = BloomFilter(capacity=10_000, error_rate=0.01)
+    for i in range(10_000):
+        bloom.add(f"known-{i}")
+
+    false_positives = sum(f"unknown-{i}" in bloom for i in range(20_000))
+
+    assert false_positives / 20_000 < 0.02
+
+
+def test_lower_error_rate_costs_more_memory_and_hashes() -> None:
+    loose = BloomFilter(capacity=10_000, error_rate=0.1)
+    tight = BloomFilter(capacity=10_000, error_rate=0.001)
+
+    assert tight.nbytes > loose.nbytes
+    assert tight.hash_count > loose.hash_count
+    # ~9.6 bits per item at 1%: about 12KB for 10k items.
+    assert BloomFilter(capacity=10_000, error_rate=0.01).nbytes < 13_000
+
+
+def test_non_string_items_are_never_present() -> None:
+    bloom = BloomFilter(capacity=10, error_rate=0.01)
+    bloom.add("1")
+
+    assert 1 not in bloom
+
+
+@pytest.mark.parametrize("capacity, error_rate", [(0, 0.01), (10, 0.0), (10, 1.0)])
+def test_invalid_sizing_is_rejected(capacity: int, error_rate: float) -> None:
+    with pytest.raises(ValueError):
+        BloomFilter(capacity=capacity, error_rate=error_rate)
@@ -0,0 +1,69 @@
+"""Tests for the in-process LRU + TTL cache in src/shared/cache.py."""
+
+from src.shared.cache import TTLCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_get_or_load_loads_once_then_serves_from_cache() -> None:
+    cache: TTLCache[int, str] = TTLCache(maxsize=10, ttl=60)
+    calls = []
+
+    def load() -> str:
+        calls.append(1)
+        return "value"
+
+    assert cache.get_or_load(1, load) == "value"
+    assert cache.get_or_load(1, load) == "value"
+    assert len(calls) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_none_is_cached_like_any_other_value() -> None:
+    cache: TTLCache[int, str | None] = TTLCache(maxsize=10, ttl=60)
+    cache.set(1, None)
+
+    assert cache.lookup(1) == (True, None)
+    assert cache.lookup(2) == (False, None)
+
+
+def test_entries_expire_after_ttl() -> None:
+    clock = _Clock()
+    cache: TTLCache[int, str] = TTLCache(maxsize=10, ttl=5, clock=clock)
+    cache.set(1, "value")
+
+    clock.now = 4.9
+    assert cache.lookup(1) == (True, "value")
+    clock.now = 5.0
+    assert cache.lookup(1) == (False, None)
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted_first() -> None:
+    cache: TTLCache[int, str] = TTLCache(maxsize=2, ttl=60)
+    cache.set(1, "one")
+    cache.set(2, "two")
+    cache.lookup(1)
+
+    cache.set(3, "three")
+
+    assert cache.lookup(2) == (False, None)
+    assert cache.lookup(1) == (True, "one")
+    assert cache.lookup(3) == (True, "three")
+
+
+def test_invalidate_and_clear_drop_entries() -> None:
+    cache: TTLCache[int, str] = TTLCache(maxsize=10, ttl=60)
+    for key in (1, 2, 3):
+        cache.set(key, str(key))
+
+    cache.invalidate(1, 2, 42)
+    assert len(cache) == 1
+    cache.clear()
+    assert len(cache) == 0